@@ -2,6 +2,8 @@ from importlib.metadata import version
 
 from alpha.adapters.rest_api_unit_of_work import RestApiUnitOfWork
 from alpha.adapters.sqla_unit_of_work import SqlAlchemyUnitOfWork
+from alpha.adapters.async_sqla_unit_of_work import AsyncSqlAlchemyUnitOfWork
+from alpha.adapters.async_rest_api_unit_of_work import AsyncRestApiUnitOfWork
 from alpha.factories.jwt_factory import JWTFactory
 from alpha.factories.logging_handler_factory import LoggingHandlerFactory
 from alpha.factories.model_class_factory import ModelClassFactory
@@ -19,10 +21,36 @@ from alpha.infra.connectors.oidc_connector import (
     OIDCConnector,
     KeyCloakOIDCConnector,
 )
+from alpha.infra.caches.file_cache import FileCache
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.infra.caches.shared_cache import LocalCacheClient, SharedCache
+from alpha.infra.caches.statement_cache import StatementCache
+from alpha.infra.connectors.async_sql_alchemy import AsyncSqlAlchemyDatabase
+from alpha.infra.connectors.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from alpha.infra.connectors.pool_monitor import PoolMonitor
+from alpha.infra.connectors.query_monitor import (
+    QueryMonitor,
+    QuerySummary,
+    StatementRecord,
+)
+from alpha.infra.connectors.routing_session import RoutingSession
 from alpha.infra.connectors.sql_alchemy import SqlAlchemyDatabase
 from alpha.infra.models.filter_operators import And, Or, FilterOperator
+from alpha.infra.models.cached_response import CachedResponse
 from alpha.infra.models.json_patch import JsonPatch
 from alpha.infra.models.order_by import OrderBy, Order
+from alpha.infra.models.load_option import LoadOption, LoadStrategy
+from alpha.infra.models.pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    PagePagination,
+    Pagination,
+)
+from alpha.infra.models.retry_policy import RetryPolicy
 from alpha.infra.models.search_filter import SearchFilter, Operator
 from alpha.interfaces.attrs_instance import AttrsInstance
 from alpha.interfaces.dataclass_instance import DataclassInstance
@@ -30,11 +58,17 @@ from alpha.interfaces.pydantic_instance import PydanticInstance
 from alpha.interfaces.openapi_model import OpenAPIModel
 from alpha.interfaces.updatable import Updatable
 from alpha.interfaces.patchable import Patchable
-from alpha.interfaces.http_client import HTTPClient, HTTPResponse
+from alpha.interfaces.http_client import (
+    AsyncHTTPClient,
+    HTTPClient,
+    HTTPResponse,
+)
 from alpha.interfaces.api_repository import ApiRepository
 from alpha.interfaces.sql_repository import SqlRepository
+from alpha.interfaces.cache import CacheBackend
 from alpha.interfaces.sql_mapper import SqlMapper
 from alpha.interfaces.sql_database import SqlDatabase
+from alpha.interfaces.async_sql_database import AsyncSqlDatabase
 from alpha.interfaces.unit_of_work import UnitOfWork
 from alpha.interfaces.providers import (
     IdentityProvider,
@@ -62,8 +96,14 @@ from alpha.providers.oidc_provider import (
     DEFAULT_OIDC_MAPPINGS,
     DEFAULT_KEYCLOAK_MAPPINGS,
 )
+from alpha.repositories.async_sql_alchemy_repository import (
+    AsyncSqlAlchemyRepository,
+)
 from alpha.repositories.models.repository_model import RepositoryModel
 from alpha.repositories.rest_api_repository import RestApiRepository
+from alpha.repositories.async_rest_api_repository import (
+    AsyncRestApiRepository,
+)
 from alpha.repositories.sql_alchemy_repository import SqlAlchemyRepository
 from alpha.repositories.refresh.cache_repository import (
     CacheRefreshRepository,
@@ -79,6 +119,7 @@ from alpha.repositories.refresh.memory_repository import (
 )
 from alpha.services.authentication_service import AuthenticationService
 from alpha.services.user_lifecycle_management import UserLifecycleManagement
+from alpha.utils.gunicorn_hooks import post_fork
 from alpha.utils.is_attrs import is_attrs
 from alpha.utils.is_pydantic import is_pydantic
 from alpha.utils.logging_configurator import (
@@ -113,6 +154,8 @@ __version__ = version("alpha-python")
 __all__ = [
     "RestApiUnitOfWork",
     "SqlAlchemyUnitOfWork",
+    "AsyncSqlAlchemyUnitOfWork",
+    "AsyncRestApiUnitOfWork",
     "JWTFactory",
     "LoggingHandlerFactory",
     "ModelClassFactory",
@@ -127,12 +170,34 @@ __all__ = [
     "OIDCConnector",
     "KeyCloakOIDCConnector",
     "SqlAlchemyDatabase",
+    "AsyncSqlAlchemyDatabase",
+    "PoolMonitor",
+    "CircuitBreaker",
+    "CircuitState",
+    "QueryMonitor",
+    "QuerySummary",
+    "StatementRecord",
+    "RoutingSession",
+    "MemoryCache",
+    "FileCache",
+    "LocalCacheClient",
+    "SharedCache",
+    "StatementCache",
     "And",
     "Or",
     "FilterOperator",
     "JsonPatch",
     "OrderBy",
     "Order",
+    "LoadOption",
+    "LoadStrategy",
+    "Pagination",
+    "PagePagination",
+    "OffsetPagination",
+    "CursorPagination",
+    "LinkHeaderPagination",
+    "RetryPolicy",
+    "CachedResponse",
     "SearchFilter",
     "Operator",
     "AttrsInstance",
@@ -143,10 +208,13 @@ __all__ = [
     "Patchable",
     "HTTPClient",
     "HTTPResponse",
+    "AsyncHTTPClient",
     "ApiRepository",
     "SqlRepository",
+    "CacheBackend",
     "SqlMapper",
     "SqlDatabase",
+    "AsyncSqlDatabase",
     "UnitOfWork",
     "IdentityProvider",
     "PasswordAuthenticator",
@@ -171,6 +239,8 @@ __all__ = [
     "RepositoryModel",
     "RestApiRepository",
     "SqlAlchemyRepository",
+    "AsyncSqlAlchemyRepository",
+    "AsyncRestApiRepository",
     "CacheRefreshRepository",
     "DatabaseRefreshRepository",
     "FileRefreshRepository",
@@ -181,6 +251,7 @@ __all__ = [
     "is_pydantic",
     "LoggingConfigurator",
     "GunicornLogger",
+    "post_fork",
     "logging_level_checker",
     "Headers",
     "create_response_object",
@@ -1,7 +1,11 @@
+from alpha.adapters.async_rest_api_unit_of_work import AsyncRestApiUnitOfWork
+from alpha.adapters.async_sqla_unit_of_work import AsyncSqlAlchemyUnitOfWork
 from alpha.adapters.rest_api_unit_of_work import RestApiUnitOfWork
 from alpha.adapters.sqla_unit_of_work import SqlAlchemyUnitOfWork
 
 __all__ = [
+    "AsyncRestApiUnitOfWork",
+    "AsyncSqlAlchemyUnitOfWork",
     "RestApiUnitOfWork",
     "SqlAlchemyUnitOfWork",
 ]
@@ -0,0 +1,134 @@
+"""Contains the asyncio REST API Unit of Work implementation."""
+
+from typing import Any, Self, cast
+
+import httpx
+
+from alpha.interfaces.http_client import AsyncHTTPClient
+from alpha.repositories.models.repository_model import RepositoryModel
+
+
+class AsyncRestApiUnitOfWork:
+    """Unit of Work implementation for asyncio REST API interactions.
+
+    This class manages the lifecycle of a shared asyncio HTTP client and
+    provides access to configured repositories, like the
+    `AsyncRestApiRepository`. It is used as an asynchronous context manager.
+    Like the `RestApiUnitOfWork`, it does not support transactional
+    operations like commit, flush, rollback, or refresh.
+
+    A client which is passed to the unit of work is kept open when the
+    context exits, so it can be shared by all units of work of a service. A
+    client which is created by the unit of work is closed on exit.
+
+    Example:
+    ```python
+    async with uow:
+        users = await asyncio.gather(
+            *[uow.users.get(param=user_id) for user_id in user_ids]
+        )
+    ```
+    """
+
+    def __init__(
+        self,
+        repos: list[RepositoryModel[Any]],
+        session: AsyncHTTPClient | None = None,
+    ) -> None:
+        """Initialize the Unit of Work with repositories.
+
+        Parameters
+        ----------
+        repos
+            The list of repository models to use.
+        session
+            The asyncio HTTP client (e.g., `httpx.AsyncClient`) to share
+            between the repositories, by default None which results in a new
+            `httpx.AsyncClient` per unit of work context.
+        """
+        self._repositories = repos
+        self._session = session
+        self._owns_session = False
+
+    async def __aenter__(self) -> Self:
+        """Enter the asyncio REST API Unit of Work context.
+
+        Creates an `httpx.AsyncClient` if no client was provided and attaches
+        the configured repositories as attributes on the unit of work
+        instance. Each repository is constructed using the shared client and
+        its associated configuration, and optionally validated against a
+        declared interface.
+
+        Returns
+        -------
+        Self
+            The configured `AsyncRestApiUnitOfWork` instance.
+
+        Raises
+        ------
+        TypeError
+            If any repository does not implement its specified interface.
+        """
+        if self._session is None:
+            self._session = cast(AsyncHTTPClient, httpx.AsyncClient())
+            self._owns_session = True
+
+        for repo in self._repositories:
+            name: str = repo.name
+            interface: Any = repo.interface
+            additional_config: dict[str, Any] = dict(
+                repo.additional_config or {}
+            )
+
+            self.__setattr__(
+                name,
+                repo.repository(
+                    session=self._session,
+                    default_model=repo.default_model,
+                    **additional_config,
+                ),
+            )
+
+            if interface and not isinstance(getattr(self, name), interface):
+                raise TypeError(f"Repository for {name} has no interface")
+
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Finalize the Unit of Work context. The client is closed when it
+        was created by the unit of work."""
+        if self._session and self._owns_session:
+            await self._session.aclose()
+            self._session = None
+            self._owns_session = False
+
+    async def commit(self) -> None:
+        raise NotImplementedError(
+            "AsyncRestApiUnitOfWork does not support commit"
+        )
+
+    async def flush(self) -> None:
+        raise NotImplementedError(
+            "AsyncRestApiUnitOfWork does not support flush"
+        )
+
+    async def rollback(self) -> None:
+        raise NotImplementedError(
+            "AsyncRestApiUnitOfWork does not support rollback"
+        )
+
+    async def refresh(self, obj: object) -> None:
+        raise NotImplementedError(
+            "AsyncRestApiUnitOfWork does not support refresh"
+        )
+
+    @property
+    def session(self) -> AsyncHTTPClient | None:
+        """Get the current client.
+
+        Returns
+        -------
+        AsyncHTTPClient | None
+            The current asyncio HTTP client used for API interactions.
+        """
+        return self._session
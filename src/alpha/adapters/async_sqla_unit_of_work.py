@@ -0,0 +1,174 @@
+"""Contains the asyncio SQLAlchemy Unit of Work implementation."""
+
+import asyncio
+from typing import Any, Self
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from alpha.adapters.sqla_unit_of_work import (
+    SAVEPOINTS_KEY,
+    BaseSqlAlchemyUnitOfWork,
+    UnitOfWorkState,
+    get_unit_of_work_state,
+    set_unit_of_work_state,
+)
+from alpha.infra.caches.model_cache import (
+    discard_invalidations,
+    invalidate_caches,
+)
+from alpha.infra.connectors.query_monitor import end_summary, start_summary
+from alpha.infra.connectors.statement_timeout import STATEMENT_TIMEOUT_KEY
+from alpha.interfaces.async_sql_database import AsyncSqlDatabase
+
+
+class AsyncSqlAlchemyUnitOfWork(BaseSqlAlchemyUnitOfWork):
+    """Unit of Work implementation for SQLAlchemy databases which are used
+    with an asyncio driver.
+
+    This class manages the lifecycle of a SQLAlchemy asyncio session and
+    provides access to configured repositories, like the
+    `AsyncSqlAlchemyRepository`. It is used as an asynchronous context
+    manager and all transactional operations are coroutines. Like the
+    `SqlAlchemyUnitOfWork`, the repositories are created when they are
+    accessed for the first time in a unit of work context, and a unit of
+    work which is entered again while it is active runs in a SAVEPOINT of
+    the session of the outer context. Because the asyncio sessions are not
+    scoped, only the same instance can be nested. The session and the
+    nesting depth are kept per asyncio task, so concurrent tasks which
+    share a unit of work, like the tasks of `asyncio.gather`, each open
+    their own session.
+
+    Example:
+    ```python
+    async with uow:
+        await uow.pets.add(pet)
+        await uow.commit()
+    ```
+    """
+
+    _database_class = AsyncSqlDatabase
+
+    async def __aenter__(self) -> Self:
+        """Initialize the Unit of Work context.
+
+        When the unit of work is already active in the current task, a
+        savepoint is started instead of a new transaction.
+
+        Returns
+        -------
+        Self
+            The Unit of Work instance.
+        """
+        owner = self._owner()
+        state = get_unit_of_work_state(self, owner)
+        if state is None:
+            session = self._db.get_session()
+            session.info[SAVEPOINTS_KEY] = []
+            summary, token = start_summary()
+            if self._statement_timeout is not None:
+                session.info[STATEMENT_TIMEOUT_KEY] = self._statement_timeout
+            state = UnitOfWorkState(
+                session=session,
+                owner=owner,
+                query_summary=summary,
+                summary_token=token,
+            )
+            set_unit_of_work_state(self, state)
+        else:
+            state.session.info[SAVEPOINTS_KEY].append(
+                await state.session.begin_nested()
+            )
+
+        state.depth += 1
+        self._query_summary = state.query_summary
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Finalize the Unit of Work context. Changes which have not been
+        committed are rolled back. Only the outermost context closes the
+        session."""
+        state = self._state()
+        session = state.session
+        savepoints = session.info.get(SAVEPOINTS_KEY)
+        if savepoints:
+            savepoint = savepoints.pop()
+            if savepoint.is_active:
+                await savepoint.rollback()
+        else:
+            await self.rollback()
+            await session.close()
+            session.info.pop(SAVEPOINTS_KEY, None)
+            session.info.pop(STATEMENT_TIMEOUT_KEY, None)
+            if state.summary_token is not None:
+                end_summary(state.summary_token)
+                state.summary_token = None
+
+        state.depth -= 1
+        if state.depth == 0:
+            set_unit_of_work_state(self, None)
+
+    async def commit(self) -> None:
+        """Commit the current transaction. The cached values of the objects
+        which have been changed in the transaction are invalidated.
+
+        In a nested unit of work the savepoint is released instead, and a
+        new savepoint is started for the changes which follow."""
+        session = self._state().session
+        savepoints = session.info.get(SAVEPOINTS_KEY)
+        if savepoints:
+            if savepoints[-1].is_active:
+                await savepoints[-1].commit()
+            savepoints[-1] = await session.begin_nested()
+            return
+        await session.commit()
+        invalidate_caches(session.sync_session)
+
+    async def flush(self) -> None:
+        """Flush the current transaction."""
+        await self._state().session.flush()
+
+    async def rollback(self) -> None:
+        """Rollback the current transaction.
+
+        In a nested unit of work only the changes since the savepoint are
+        rolled back, and a new savepoint is started for the changes which
+        follow."""
+        session = self._state().session
+        savepoints = session.info.get(SAVEPOINTS_KEY)
+        if savepoints:
+            if savepoints[-1].is_active:
+                await savepoints[-1].rollback()
+            savepoints[-1] = await session.begin_nested()
+            return
+        await session.rollback()
+        discard_invalidations(session.sync_session)
+
+    async def refresh(self, obj: object) -> None:
+        """Refresh the state of a given object.
+
+        Parameters
+        ----------
+        obj
+            The object to refresh.
+        """
+        await self._state().session.refresh(obj)
+
+    @property
+    def session(self) -> AsyncSession | None:
+        """Get the database session of the context of the current task.
+
+        Returns
+        -------
+        AsyncSession | None
+            The current database session, or None outside of the context.
+        """
+        state = self._current_state()
+        return state.session if state else None
+
+    def _owner(self) -> asyncio.Task[Any] | None:
+        """Get the current asyncio task, or None outside of an event
+        loop."""
+        try:
+            return asyncio.current_task()
+        except RuntimeError:
+            return None
@@ -1,28 +1,130 @@
 """Contains the SQLAlchemy Unit of Work implementation."""
 
-from typing import Any, TypeVar
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Self
 
 from sqlalchemy.orm.session import Session
 
 from alpha import exceptions
+from alpha.infra.caches.model_cache import (
+    discard_invalidations,
+    invalidate_caches,
+)
+from alpha.infra.connectors.query_monitor import (
+    QuerySummary,
+    current_summary,
+    end_summary,
+    start_summary,
+)
+from alpha.infra.connectors.routing_session import RoutingSession
+from alpha.infra.connectors.statement_timeout import STATEMENT_TIMEOUT_KEY
 from alpha.interfaces.sql_database import SqlDatabase
 from alpha.repositories.models.repository_model import RepositoryModel
 
-UOW = TypeVar("UOW", bound="SqlAlchemyUnitOfWork")
+SAVEPOINTS_KEY = "alpha_uow_savepoints"
+"""The key in the info dictionary of a session under which the savepoints of
+the nested units of work are stored."""
 
 
-class SqlAlchemyUnitOfWork:
-    """Unit of Work implementation for SQLAlchemy databases.
+@dataclass
+class UnitOfWorkState:
+    """The state of a unit of work context in one thread or asyncio task.
 
-    This class manages the lifecycle of a SQLAlchemy session and provides
-    access to configured repositories for database interactions. It supports
-    transactional operations such as commit, flush, rollback, and refresh.
+    Attributes
+    ----------
+    session
+        The session of the context.
+    owner
+        The thread identifier or the asyncio task which entered the context.
+    depth
+        The number of times the unit of work has been entered by the owner.
+    query_summary
+        The summary of the statements of the context.
+    summary_token
+        The token to end the summary, when the context started it.
+    repositories
+        The repositories which have been created in the context.
+    """
+
+    session: Any
+    owner: Any
+    depth: int = 0
+    query_summary: QuerySummary | None = None
+    summary_token: Any = None
+    repositories: dict[str, Any] = field(default_factory=dict)
+
+
+_states: ContextVar[dict[int, UnitOfWorkState]] = ContextVar(
+    "alpha_uow_states"
+)
+
+
+def get_unit_of_work_state(uow: object, owner: Any) -> UnitOfWorkState | None:
+    """Get the state of the active context of a unit of work.
+
+    The states are stored in a context variable, so every thread and
+    asyncio task has its own states. An asyncio task inherits the context
+    variables of the task which created it, so a state is only returned to
+    the thread or task which entered the context.
+
+    Parameters
+    ----------
+    uow
+        The unit of work
+    owner
+        The current thread identifier or asyncio task
+
+    Returns
+    -------
+    UnitOfWorkState | None
+        The state, or None when the owner has not entered the unit of work
     """
+    state = (_states.get(None) or {}).get(id(uow))
+    if state is None or state.owner != owner:
+        return None
+    return state
+
+
+def set_unit_of_work_state(uow: object, state: UnitOfWorkState | None) -> None:
+    """Store or remove the state of the context of a unit of work in the
+    current thread or asyncio task.
+
+    Parameters
+    ----------
+    uow
+        The unit of work
+    state
+        The state, or None to remove the state
+    """
+    # The mapping is replaced instead of changed, because it is shared with
+    # the asyncio tasks which are created in the context
+    current = _states.get(None)
+    states = dict(current) if current else {}
+    if state is None:
+        states.pop(id(uow), None)
+    else:
+        states[id(uow)] = state
+    _states.set(states)
+
+
+class BaseSqlAlchemyUnitOfWork:
+    """Base class of the SQLAlchemy units of work, which keeps the state of
+    a unit of work context per owner and creates the repositories of the
+    context.
+
+    The subclasses define the database class which they accept and the
+    owner of a context, which is the current thread or asyncio task.
+    """
+
+    _database_class: ClassVar[type[Any]]
 
     def __init__(
         self,
-        db: SqlDatabase,
+        db: Any,
         repos: list[RepositoryModel[Any]],
+        statement_timeout: float | None = None,
     ) -> None:
         """Initialize the Unit of Work with a database and repositories.
 
@@ -32,85 +134,289 @@ class SqlAlchemyUnitOfWork:
             The database instance to use.
         repos
             The list of repository models to use.
+        statement_timeout
+            The number of seconds after which a statement of the unit of
+            work is cancelled with a `StatementTimeoutError`, by default None
+            which results in the statement timeout of the database. A
+            timeout of 0 disables the timeout of the database. Nested units
+            of work use the timeout of the outermost unit of work.
 
         Raises
         ------
         TypeError
-            If the provided database is not a valid SqlDatabase instance.
+            If the provided database is not an instance of the database
+            class of the unit of work, or a repository does not implement
+            its interface.
         """
-        if not isinstance(db, SqlDatabase):  # type: ignore
+        if not isinstance(db, self._database_class):
             raise TypeError("No valid database provided")
 
         self._db = db
         self._repositories = repos
-        self._session: Session | None = None
+        self._statement_timeout = statement_timeout
+        self._query_summary: QuerySummary | None = None
+        self._repository_models: dict[str, RepositoryModel[Any]] = {}
+        # The repositories created by factory functions are checked on
+        # their first creation, because their class is not known before
+        self._unchecked: set[str] = set()
+        for repo in repos:
+            implements = repo.implements_interface()
+            if implements is False:
+                raise TypeError(f"Repository for {repo.name} has no interface")
+            if implements is None:
+                self._unchecked.add(repo.name)
+            self._repository_models[repo.name] = repo
 
-    def __enter__(self: UOW) -> UOW:
-        """Initialize the Unit of Work context.
+    def __getattr__(self, name: str) -> Any:
+        """Create a repository when it is accessed for the first time in the
+        Unit of Work context. The repository is stored in the state of the
+        context of the current owner, and returned until the context exits.
+
+        Parameters
+        ----------
+        name
+            The name of the repository.
 
         Returns
         -------
-        UOW
-            The Unit of Work instance.
+        Any
+            The repository instance.
 
         Raises
         ------
+        AttributeError
+            If no repository with the name is configured.
+        exceptions.DatabaseSessionError
+            If the repository is accessed outside of the context.
         TypeError
-            If the provided repositories list is empty or contains invalid
-            models.
+            If a repository which is created by a factory function does not
+            implement its interface.
         """
-        self._session = self._db.get_session()
+        repo = self.__dict__.get("_repository_models", {}).get(name)
+        if repo is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        state = self._state()
+        repository = state.repositories.get(name)
+        if repository is not None:
+            return repository
 
-        for repo in self._repositories:
-            name: str = repo.name
-            interface: Any = repo.interface
+        repository = repo.repository(
+            session=state.session,
+            default_model=repo.default_model,
+            **dict(repo.additional_config or {}),
+        )
+        if name in self._unchecked:
+            if not isinstance(repository, repo.interface):  # type: ignore
+                raise TypeError(f"Repository for {name} has no interface")
+            self._unchecked.discard(name)
 
-            self.__setattr__(
-                name,
-                repo.repository(
-                    session=self._session, default_model=repo.default_model
-                ),
-            )
+        state.repositories[name] = repository
+        return repository
 
-            if interface:
-                if not isinstance(getattr(self, name), interface):
-                    raise TypeError(f"Repository for {name} has no interface")
+    @property
+    def query_summary(self) -> QuerySummary | None:
+        """Get the summary of the statements of the current or the last
+        unit of work context. The statements are only recorded when the
+        database has a `QueryMonitor`.
 
-        return self
+        Returns
+        -------
+        QuerySummary | None
+            The summary of the statements, or None before the first context.
+        """
+        state = self._current_state()
+        return state.query_summary if state else self._query_summary
+
+    def _owner(self) -> Any:
+        """Get the owner of the contexts which are entered now, like the
+        current thread or asyncio task."""
+        raise NotImplementedError
+
+    def _current_state(self) -> UnitOfWorkState | None:
+        """Get the state of the context of the current owner, or None when
+        the owner has not entered the unit of work."""
+        return get_unit_of_work_state(self, self._owner())
+
+    def _state(self) -> UnitOfWorkState:
+        """Get the state of the context of the current owner.
 
-    def __exit__(self, *args: Any) -> None:
-        """Finalize the Unit of Work context."""
-        if not self._session:
+        Raises
+        ------
+        exceptions.DatabaseSessionError
+            If the current owner has not entered the unit of work.
+        """
+        state = self._current_state()
+        if state is None:
             raise exceptions.DatabaseSessionError(
                 "No active database session is defined"
             )
-        self._session.close()
-        self.rollback()
-        self._session = None  # type: ignore
+        return state
 
-    def commit(self) -> None:
-        """Commit the current transaction."""
-        if not self._session:
-            raise exceptions.DatabaseSessionError(
-                "No active database session is defined"
+
+class SqlAlchemyUnitOfWork(BaseSqlAlchemyUnitOfWork):
+    """Unit of Work implementation for SQLAlchemy databases.
+
+    This class manages the lifecycle of a SQLAlchemy session and provides
+    access to configured repositories for database interactions. It supports
+    transactional operations such as commit, flush, rollback, and refresh.
+
+    The repositories are created when they are accessed for the first time in
+    a unit of work context, so entering a unit of work only creates the
+    session. Whether the repositories implement their interfaces is checked
+    once, when the unit of work is created.
+
+    Units of work can be nested, for example when a service which uses a unit
+    of work calls another service with the same unit of work, or with
+    another unit of work on the same database. A nested unit of work reuses
+    the session of the outer unit of work and runs in a SAVEPOINT, which is
+    started with `begin_nested`. Nesting is detected per thread, from the
+    thread-local session of the database, so a unit of work which is shared
+    by multiple threads, like one of a service singleton, opens a session
+    per thread. Committing a nested unit of work releases
+    its savepoint, so the changes become part of the outer transaction and
+    are written when the outer unit of work commits. Rolling back, or
+    exiting without committing, only discards the changes of the nested
+    unit of work. Only the outermost unit of work closes the session, so all
+    nested units of work use a single connection.
+    """
+
+    _database_class = SqlDatabase
+
+    def __init__(
+        self,
+        db: SqlDatabase,
+        repos: list[RepositoryModel[Any]],
+        read_only: bool = False,
+        statement_timeout: float | None = None,
+    ) -> None:
+        """Initialize the Unit of Work with a database and repositories.
+
+        Parameters
+        ----------
+        db
+            The database instance to use.
+        repos
+            The list of repository models to use.
+        read_only
+            Whether the unit of work only reads, so its statements can be
+            executed on a read replica of the database, by default False.
+            Writes are still executed on the primary database.
+        statement_timeout
+            The number of seconds after which a statement of the unit of
+            work is cancelled with a `StatementTimeoutError`, by default None
+            which results in the statement timeout of the database. A
+            timeout of 0 disables the timeout of the database. Nested units
+            of work use the timeout of the outermost unit of work.
+
+        Raises
+        ------
+        TypeError
+            If the provided database is not a valid SqlDatabase instance, or
+            a repository does not implement its interface.
+        """
+        super().__init__(db, repos, statement_timeout)
+        self._read_only = read_only
+
+    def __enter__(self) -> Self:
+        """Initialize the Unit of Work context.
+
+        When a unit of work is active on the session of the current thread,
+        a savepoint is started instead of a new transaction.
+
+        Returns
+        -------
+        Self
+            The Unit of Work instance.
+        """
+        owner = self._owner()
+        state = get_unit_of_work_state(self, owner)
+        session = state.session if state else self._db.get_session()
+        summary, token = None, None
+        savepoints: list[Any] | None = session.info.get(SAVEPOINTS_KEY)
+        if savepoints is None:
+            session.info[SAVEPOINTS_KEY] = []
+            if isinstance(session, RoutingSession):
+                session.read_only = self._read_only
+            summary, token = start_summary()
+            if self._statement_timeout is not None:
+                session.info[STATEMENT_TIMEOUT_KEY] = self._statement_timeout
+        else:
+            savepoints.append(session.begin_nested())
+            summary = current_summary()
+
+        if state is None:
+            state = UnitOfWorkState(
+                session=session,
+                owner=owner,
+                query_summary=summary,
+                summary_token=token,
             )
-        self._session.commit()
+            set_unit_of_work_state(self, state)
+        state.depth += 1
+        self._query_summary = state.query_summary
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Finalize the Unit of Work context. The outermost unit of work
+        closes the session, a nested unit of work rolls back the changes
+        which have not been committed to its savepoint."""
+        state = self._state()
+        session = state.session
+        savepoints = session.info.get(SAVEPOINTS_KEY)
+        if savepoints:
+            savepoint = savepoints.pop()
+            if savepoint.is_active:
+                savepoint.rollback()
+        else:
+            session.close()
+            self.rollback()
+            session.info.pop(SAVEPOINTS_KEY, None)
+            session.info.pop(STATEMENT_TIMEOUT_KEY, None)
+            if state.summary_token is not None:
+                end_summary(state.summary_token)
+                state.summary_token = None
+
+        state.depth -= 1
+        if state.depth == 0:
+            set_unit_of_work_state(self, None)
+
+    def commit(self) -> None:
+        """Commit the current transaction. The cached values of the objects
+        which have been changed in the transaction are invalidated.
+
+        In a nested unit of work the savepoint is released instead, and a
+        new savepoint is started for the changes which follow."""
+        session = self._state().session
+        savepoints = session.info.get(SAVEPOINTS_KEY)
+        if savepoints:
+            if savepoints[-1].is_active:
+                savepoints[-1].commit()
+            savepoints[-1] = session.begin_nested()
+            return
+        session.commit()
+        invalidate_caches(session)
 
     def flush(self) -> None:
         """Flush the current transaction."""
-        if not self._session:
-            raise exceptions.DatabaseSessionError(
-                "No active database session is defined"
-            )
-        self._session.flush()
+        self._state().session.flush()
 
     def rollback(self) -> None:
-        """Rollback the current transaction."""
-        if not self._session:
-            raise exceptions.DatabaseSessionError(
-                "No active database session is defined"
-            )
-        self._session.rollback()
+        """Rollback the current transaction.
+
+        In a nested unit of work only the changes since the savepoint are
+        rolled back, and a new savepoint is started for the changes which
+        follow."""
+        session = self._state().session
+        savepoints = session.info.get(SAVEPOINTS_KEY)
+        if savepoints:
+            if savepoints[-1].is_active:
+                savepoints[-1].rollback()
+            savepoints[-1] = session.begin_nested()
+            return
+        session.rollback()
+        discard_invalidations(session)
 
     def refresh(self, obj: object) -> None:
         """Refresh the state of a given object.
@@ -120,19 +426,20 @@ class SqlAlchemyUnitOfWork:
         obj
             The object to refresh.
         """
-        if not self._session:
-            raise exceptions.DatabaseSessionError(
-                "No active database session is defined"
-            )
-        self._session.refresh(obj)
+        self._state().session.refresh(obj)
 
     @property
     def session(self) -> Session | None:
-        """Get the current database session.
+        """Get the database session of the context of the current thread.
 
         Returns
         -------
         Session | None
-            The current database session.
+            The current database session, or None outside of the context.
         """
-        return self._session
+        state = self._current_state()
+        return state.session if state else None
+
+    def _owner(self) -> int:
+        """Get the identifier of the current thread."""
+        return threading.get_ident()
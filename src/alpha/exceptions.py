@@ -85,6 +85,16 @@ class DatabaseSessionError(InternalServerErrorException):
     """Raised when there is an error with the database session."""
 
 
+class StatementTimeoutError(GatewayTimeoutException):
+    """Raised when a database statement is cancelled because it exceeded the
+    statement timeout."""
+
+
+class CircuitOpenException(ServiceUnavailableException):
+    """Raised when a request is not sent because the circuit breaker of the
+    host is open."""
+
+
 # ORM Related Exceptions
 class InstrumentedAttributeMissing(Exception):
     """Raised when an expected instrumented attribute is missing in the ORM model."""
@@ -2,10 +2,36 @@ from alpha.infra.connectors.oidc_connector import (
     OIDCConnector,
     KeyCloakOIDCConnector,
 )
+from alpha.infra.caches.file_cache import FileCache
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.infra.caches.shared_cache import LocalCacheClient, SharedCache
+from alpha.infra.caches.statement_cache import StatementCache
+from alpha.infra.connectors.async_sql_alchemy import AsyncSqlAlchemyDatabase
+from alpha.infra.connectors.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from alpha.infra.connectors.pool_monitor import PoolMonitor
+from alpha.infra.connectors.query_monitor import (
+    QueryMonitor,
+    QuerySummary,
+    StatementRecord,
+)
+from alpha.infra.connectors.routing_session import RoutingSession
 from alpha.infra.connectors.sql_alchemy import SqlAlchemyDatabase
 from alpha.infra.models.filter_operators import And, Or, FilterOperator
+from alpha.infra.models.cached_response import CachedResponse
 from alpha.infra.models.json_patch import JsonPatch
 from alpha.infra.models.order_by import OrderBy, Order
+from alpha.infra.models.load_option import LoadOption, LoadStrategy
+from alpha.infra.models.pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    PagePagination,
+    Pagination,
+)
+from alpha.infra.models.retry_policy import RetryPolicy
 from alpha.infra.models.search_filter import SearchFilter, Operator
 
 # Optional LDAP support - only import if ldap3 is available
@@ -20,12 +46,34 @@ __all__ = [
     "OIDCConnector",
     "KeyCloakOIDCConnector",
     "SqlAlchemyDatabase",
+    "AsyncSqlAlchemyDatabase",
+    "PoolMonitor",
+    "CircuitBreaker",
+    "CircuitState",
+    "QueryMonitor",
+    "QuerySummary",
+    "StatementRecord",
+    "RoutingSession",
+    "MemoryCache",
+    "FileCache",
+    "LocalCacheClient",
+    "SharedCache",
+    "StatementCache",
     "And",
     "Or",
     "FilterOperator",
     "JsonPatch",
     "OrderBy",
     "Order",
+    "LoadOption",
+    "LoadStrategy",
+    "Pagination",
+    "PagePagination",
+    "OffsetPagination",
+    "CursorPagination",
+    "LinkHeaderPagination",
+    "RetryPolicy",
+    "CachedResponse",
     "SearchFilter",
     "Operator",
 ]
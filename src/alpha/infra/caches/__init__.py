@@ -0,0 +1,14 @@
+from alpha.infra.caches.file_cache import FileCache
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.infra.caches.model_cache import ModelCache
+from alpha.infra.caches.shared_cache import LocalCacheClient, SharedCache
+from alpha.infra.caches.statement_cache import StatementCache
+
+__all__ = [
+    "FileCache",
+    "LocalCacheClient",
+    "MemoryCache",
+    "ModelCache",
+    "SharedCache",
+    "StatementCache",
+]
@@ -0,0 +1,144 @@
+"""Contains the FileCache class, a cache which stores its values in files
+in a directory."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+_SUFFIX = ".cache"
+
+
+class FileCache:
+    """A cache which stores every value in a file in a directory, so the
+    values survive a restart and are shared by the processes of a host.
+
+    Every value is written to a temporary file which replaces the file of
+    the key, so readers never see a partially written value. The values are
+    serialized with pickle. Only use a directory which is not writable by
+    untrusted parties.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        ttl: float | None = 300,
+        maxsize: int | None = 4096,
+    ) -> None:
+        """Initialize the file cache. The directory is created if it does
+        not exist.
+
+        Parameters
+        ----------
+        directory
+            The directory in which the values are stored
+        ttl
+            The default number of seconds after which a value expires, by
+            default 300. None results in values that do not expire.
+        maxsize
+            The maximum number of values to store, by default 4096. When the
+            cache is full the least recently written values are removed.
+            None results in no limit.
+
+        Raises
+        ------
+        ValueError
+            When the maxsize is not a positive integer
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("The maxsize has to be a positive integer")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob(f"*{_SUFFIX}"))
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+
+        Returns
+        -------
+        Any | None
+            The cached value, or None when the key is not cached or the value
+            has expired
+        """
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                expires, value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if expires is not None and expires <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value in the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+        value
+            The value to store
+        ttl
+            The number of seconds after which the value expires, by default
+            None which results in using the ttl of the cache
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.time() + ttl
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump((expires, value), file)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        if self.maxsize is not None:
+            self._evict(self.maxsize)
+
+    def delete(self, *keys: str) -> None:
+        """Remove values from the cache.
+
+        Parameters
+        ----------
+        keys
+            The keys of the values to remove
+        """
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def _evict(self, maxsize: int) -> None:
+        """Remove the least recently written values while the cache holds
+        more than maxsize values."""
+        paths = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                paths.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                # Removed by another process
+                continue
+        for _, path in sorted(paths)[: len(paths) - maxsize]:
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Get the path of the file of a key."""
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}{_SUFFIX}"
@@ -0,0 +1,104 @@
+"""Contains the MemoryCache class, an in-process LRU cache with expiring
+values."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class MemoryCache:
+    """A thread-safe in-process LRU cache with a time-to-live for every
+    value.
+
+    The values are stored as-is, so the cache is only shared by the threads
+    of a single process. Use a `SharedCache` to share values between
+    processes.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 300) -> None:
+        """Initialize the memory cache.
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of values to store, by default 1024. When the
+            cache is full the least recently used value is removed.
+        ttl
+            The default number of seconds after which a value expires, by
+            default 300. None results in values that do not expire.
+        """
+        if maxsize < 1:
+            raise ValueError("The maxsize has to be a positive integer")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._values: OrderedDict[str, tuple[float | None, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+
+        Returns
+        -------
+        Any | None
+            The cached value, or None when the key is not cached or the value
+            has expired
+        """
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires is not None and expires <= time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value in the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+        value
+            The value to store
+        ttl
+            The number of seconds after which the value expires, by default
+            None which results in using the ttl of the cache
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._values[key] = (expires, value)
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        """Remove values from the cache.
+
+        Parameters
+        ----------
+        keys
+            The keys of the values to remove
+        """
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._values.clear()
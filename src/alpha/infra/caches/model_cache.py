@@ -0,0 +1,300 @@
+"""Contains the ModelCache class, which caches the column values of domain
+model instances in a `CacheBackend`, and the functions which are used to
+invalidate the cached values when a transaction is committed."""
+
+import copy
+import itertools
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import (
+    Mapper,
+    Session,
+    class_mapper,
+    make_transient_to_detached,
+)
+
+from alpha.interfaces.cache import CacheBackend
+from alpha.utils.logging_level_checker import logging_level_checker as llc
+
+logger = logging.getLogger(__name__)
+
+CACHES_KEY = "alpha_model_caches"
+INVALIDATIONS_KEY = "alpha_cache_invalidations"
+
+
+class ModelCache:
+    """A read-through cache for domain model instances which are retrieved
+    by a key attribute, like the primary key or a unique username.
+
+    Only the values of the mapped columns are cached. When an instance is
+    retrieved from the cache, it is attached to the session as if it was
+    loaded from the database, so relationships are lazy loaded as usual.
+
+    The cache keeps track of the instances which are added, updated, patched
+    or removed in a session. Their cached values are removed by the
+    `invalidate_caches` function, which is called by the
+    `SqlAlchemyUnitOfWork` when the transaction is committed. The cache is
+    bypassed by sessions with pending changes, so uncommitted values are
+    never cached or hidden by cached values.
+    """
+
+    def __init__(
+        self, backend: CacheBackend, keys: Iterable[str] = ("id",)
+    ) -> None:
+        """Initialize the model cache.
+
+        Parameters
+        ----------
+        backend
+            The key-value store in which the values are cached
+        keys
+            The attributes by which instances can be retrieved from the
+            cache, by default ("id",). The values of these attributes have to
+            be unique.
+        """
+        self.backend = backend
+        self.keys = tuple(keys)
+
+    def key(self, model: Any, attr: str, value: Any) -> str:
+        """Create the cache key of an instance.
+
+        Parameters
+        ----------
+        model
+            Domain model type
+        attr
+            The name of the key attribute
+        value
+            The value of the key attribute
+
+        Returns
+        -------
+        str
+            The cache key
+        """
+        return f"{model.__module__}.{model.__qualname__}:{attr}:{value!r}"
+
+    def register(self, session: Session, model: Any) -> None:
+        """Register the cache for a domain model in a session, so the
+        changes to instances of the model are tracked.
+
+        Parameters
+        ----------
+        session
+            The database session
+        model
+            Domain model type
+        """
+        session.info.setdefault(CACHES_KEY, {})[model] = self
+        if not event.contains(session, "after_flush", _record_invalidations):
+            event.listen(session, "after_flush", _record_invalidations)
+
+    def is_bypassed(self, session: Session) -> bool:
+        """Check whether the cache has to be bypassed because the session
+        contains changes which are not committed yet.
+
+        Parameters
+        ----------
+        session
+            The database session
+
+        Returns
+        -------
+        bool
+            True when the session contains uncommitted changes
+        """
+        return bool(
+            session.info.get(INVALIDATIONS_KEY)
+            or session.new
+            or session.deleted
+            or session.dirty
+        )
+
+    def load(
+        self, session: Session, model: Any, attr: str, value: Any
+    ) -> Any | None:
+        """Get an instance from the cache and attach it to the session. When
+        the session already contains the instance, the instance from the
+        session is returned.
+
+        Parameters
+        ----------
+        session
+            The database session
+        model
+            Domain model type
+        attr
+            The name of the key attribute
+        value
+            The value of the key attribute
+
+        Returns
+        -------
+        Any | None
+            The instance or None when it is not cached
+        """
+        if attr not in self.keys or self.is_bypassed(session):
+            return None
+        key = self.key(model, attr, value)
+        values = self.backend.get(key)
+        if values is None:
+            return None
+
+        mapper = class_mapper(model)
+        try:
+            identity = mapper.identity_key_from_primary_key(
+                tuple(
+                    values[mapper.get_property_by_column(column).key]
+                    for column in mapper.primary_key
+                )
+            )
+        except KeyError:
+            self.backend.delete(key)
+            return None
+
+        obj = session.identity_map.get(identity)
+        if obj is not None:
+            return obj
+
+        obj = mapper.class_manager.new_instance()
+        for name, attr_value in values.items():
+            setattr(obj, name, copy.deepcopy(attr_value))
+        make_transient_to_detached(obj)
+        session.add(obj)
+        if llc("debug"):
+            logger.debug("retrieved object from cache: %s", key)
+        return obj
+
+    def store(self, session: Session, obj: Any) -> None:
+        """Store the column values of an instance in the cache, by all the
+        key attributes of the cache.
+
+        Parameters
+        ----------
+        session
+            The database session from which the instance is loaded
+        obj
+            The domain model instance
+        """
+        if self.is_bypassed(session):
+            return
+        mapper: Mapper[Any] = inspect(obj).mapper
+        values = copy.deepcopy(
+            {prop.key: getattr(obj, prop.key) for prop in mapper.column_attrs}
+        )
+        for attr in self.keys:
+            if values.get(attr) is not None:
+                self.backend.set(
+                    self.key(mapper.class_, attr, values[attr]), values
+                )
+
+    def invalidate_all(self, session: Session) -> None:
+        """Clear the cache when the transaction of the session is committed.
+        Used for statements which change rows that are not loaded in the
+        session.
+
+        Parameters
+        ----------
+        session
+            The database session
+        """
+        session.info.setdefault(INVALIDATIONS_KEY, {})[self] = None
+
+    def _object_keys(self, obj: Any) -> set[str] | None:
+        """Determine the cache keys of the current and previous values of the
+        key attributes of an instance.
+
+        Parameters
+        ----------
+        obj
+            The domain model instance
+
+        Returns
+        -------
+        set[str] | None
+            The cache keys, or None when the value of a key attribute is
+            unknown
+        """
+        state = inspect(obj)
+        keys: set[str] = set()
+        for attr in self.keys:
+            if attr not in state.mapper.attrs:
+                continue
+            history = state.attrs[attr].history
+            values = [state.dict.get(attr), *history.deleted]
+            if attr not in state.dict and not history.deleted:
+                return None
+            for value in values:
+                if value is not None:
+                    keys.add(self.key(state.mapper.class_, attr, value))
+        return keys
+
+
+def invalidate_caches(session: Session) -> None:
+    """Remove the cached values of all instances which have been changed in
+    the session. Should be called after the transaction is committed.
+
+    Parameters
+    ----------
+    session
+        The database session
+    """
+    invalidations: dict[ModelCache, set[str] | None] = session.info.pop(
+        INVALIDATIONS_KEY, {}
+    )
+    for cache, keys in invalidations.items():
+        if keys is None:
+            cache.backend.clear()
+        elif keys:
+            cache.backend.delete(*keys)
+        if llc("debug"):
+            logger.debug("invalidated cached objects: %s", keys or "all")
+
+
+def discard_invalidations(session: Session) -> None:
+    """Forget the changed instances of the session. Should be called after
+    the transaction is rolled back.
+
+    Parameters
+    ----------
+    session
+        The database session
+    """
+    session.info.pop(INVALIDATIONS_KEY, None)
+
+
+def _record_invalidations(session: Session, flush_context: Any) -> None:
+    """Record the cache keys of all instances which are flushed. Used as
+    `after_flush` event listener, in which the session still contains the
+    pre-flush state of the instances.
+
+    Parameters
+    ----------
+    session
+        The database session
+    flush_context
+        The internal state of the flush
+    """
+    caches: dict[Any, ModelCache] = session.info.get(CACHES_KEY, {})
+    if not caches:
+        return
+    invalidations: dict[ModelCache, set[str] | None] = session.info.setdefault(
+        INVALIDATIONS_KEY, {}
+    )
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        cache = next(
+            (caches[cls] for cls in type(obj).__mro__ if cls in caches), None
+        )
+        if cache is None:
+            continue
+        keys = invalidations.setdefault(cache, set())
+        if keys is None:
+            continue
+        obj_keys = cache._object_keys(obj)
+        if obj_keys is None:
+            invalidations[cache] = None
+        else:
+            keys.update(obj_keys)
@@ -0,0 +1,156 @@
+"""Contains the SharedCache class, a cache which stores its values in an
+out-of-process key-value store, and the LocalCacheClient class which can be
+used as a local stand-in for such a store."""
+
+import fnmatch
+import math
+import pickle
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+
+class CacheClient(Protocol):
+    """Interface of the key-value store client used by the `SharedCache`.
+
+    The interface is compatible with the `redis.Redis` client.
+    """
+
+    def get(self, name: str) -> bytes | None: ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any: ...
+
+    def delete(self, *names: str) -> Any: ...
+
+    def scan_iter(self, match: str) -> Iterator[Any]: ...
+
+
+class SharedCache:
+    """A cache which stores its values in an out-of-process key-value store,
+    like Redis, so the values are shared by multiple processes.
+
+    The values are serialized with pickle. Only use a store which is not
+    writable by untrusted parties.
+    """
+
+    def __init__(
+        self,
+        client: CacheClient | None = None,
+        prefix: str = "alpha:",
+        ttl: float | None = 300,
+    ) -> None:
+        """Initialize the shared cache.
+
+        Parameters
+        ----------
+        client
+            The client of the key-value store, for example a `redis.Redis`
+            instance, by default None which results in using a
+            `LocalCacheClient`
+        prefix
+            The prefix of all keys stored by this cache, by default "alpha:"
+        ttl
+            The default number of seconds after which a value expires, by
+            default 300. None results in values that do not expire.
+        """
+        self.client: CacheClient = client or LocalCacheClient()
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+
+        Returns
+        -------
+        Any | None
+            The cached value, or None when the key is not cached or the value
+            has expired
+        """
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value in the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+        value
+            The value to store
+        ttl
+            The number of seconds after which the value expires, by default
+            None which results in using the ttl of the cache
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self.client.set(
+            self.prefix + key,
+            pickle.dumps(value),
+            ex=None if ttl is None else max(1, math.ceil(ttl)),
+        )
+
+    def delete(self, *keys: str) -> None:
+        """Remove values from the cache.
+
+        Parameters
+        ----------
+        keys
+            The keys of the values to remove
+        """
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+    def clear(self) -> None:
+        """Remove all values with the prefix of this cache from the store."""
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class LocalCacheClient:
+    """An in-process key-value store which implements the subset of the
+    Redis client interface that is used by the `SharedCache`.
+
+    It can be used in development and tests in place of an out-of-process
+    store.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[float | None, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            item = self._values.get(name)
+            if item is None:
+                return None
+            expires, value = item
+            if expires is not None and expires <= time.monotonic():
+                del self._values[name]
+                return None
+            return value
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        expires = None if ex is None else time.monotonic() + ex
+        with self._lock:
+            self._values[name] = (expires, value)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(
+                self._values.pop(name, None) is not None for name in names
+            )
+
+    def scan_iter(self, match: str = "*") -> Iterator[str]:
+        with self._lock:
+            names = list(self._values)
+        return iter(fnmatch.filter(names, match))
@@ -0,0 +1,114 @@
+"""Contains the StatementCache class, which stores parameterised SQL
+statements by the shape of the query they were built for.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class StatementCache:
+    """A thread-safe LRU cache which stores prebuilt SQL statements.
+
+    The `SqlAlchemyRepository` uses this cache to store the statements it
+    builds for a query shape, which is the combination of the domain model,
+    the filters, the ordering, the keys of `filter_by` and the use of a limit
+    or offset. The values of the filters are not part of the shape but are
+    bound as parameters when the statement is executed, so repeated queries
+    with the same shape reuse the same statement object. Neither is the type
+    of result, because the cached statement returns all rows, a single row or
+    a count depending on how it is executed.
+
+    Attributes
+    ----------
+    maxsize
+        The maximum number of statements to store
+    hits
+        The number of lookups which found a statement
+    misses
+        The number of lookups which did not find a statement
+    """
+
+    def __init__(self, maxsize: int = 500) -> None:
+        """Initialize the statement cache.
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of statements to store, by default 500. When
+            the cache is full the least recently used statement is removed.
+        """
+        if maxsize < 1:
+            raise ValueError("The maxsize has to be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._statements: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a statement from the cache and count the lookup as a hit or a
+        miss.
+
+        Parameters
+        ----------
+        key
+            The shape of the query
+
+        Returns
+        -------
+        Any | None
+            The cached statement or None when the shape is not cached
+        """
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is None:
+                self.misses += 1
+                return None
+            self._statements.move_to_end(key)
+            self.hits += 1
+            return statement
+
+    def set(self, key: Hashable, statement: Any) -> None:
+        """Store a statement in the cache.
+
+        Parameters
+        ----------
+        key
+            The shape of the query
+        statement
+            The statement to store
+        """
+        with self._lock:
+            self._statements[key] = statement
+            self._statements.move_to_end(key)
+            while len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all statements from the cache and reset the counters."""
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of hits, misses, stored statements and the maximum
+            number of statements
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._statements),
+                "maxsize": self.maxsize,
+            }
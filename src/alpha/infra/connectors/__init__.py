@@ -2,6 +2,18 @@ from alpha.infra.connectors.oidc_connector import (
     OIDCConnector,
     KeyCloakOIDCConnector,
 )
+from alpha.infra.connectors.async_sql_alchemy import AsyncSqlAlchemyDatabase
+from alpha.infra.connectors.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from alpha.infra.connectors.pool_monitor import PoolMonitor
+from alpha.infra.connectors.query_monitor import (
+    QueryMonitor,
+    QuerySummary,
+    StatementRecord,
+)
+from alpha.infra.connectors.routing_session import RoutingSession
 from alpha.infra.connectors.sql_alchemy import SqlAlchemyDatabase
 
 # Optional LDAP support - only import if ldap3 is available
@@ -16,6 +28,14 @@ __all__ = [
     "OIDCConnector",
     "KeyCloakOIDCConnector",
     "SqlAlchemyDatabase",
+    "AsyncSqlAlchemyDatabase",
+    "PoolMonitor",
+    "CircuitBreaker",
+    "CircuitState",
+    "QueryMonitor",
+    "QuerySummary",
+    "StatementRecord",
+    "RoutingSession",
 ]
 
 # Conditionally add LDAP-related exports if available
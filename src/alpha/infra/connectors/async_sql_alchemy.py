@@ -0,0 +1,317 @@
+"""Asyncio SQL Alchemy Database Connector module"""
+
+import os
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+
+from alpha import exceptions
+from alpha.infra.connectors.pool_monitor import PoolMonitor
+from alpha.infra.connectors.query_monitor import QueryMonitor
+from alpha.infra.connectors.sql_alchemy import (
+    _databases,
+    enable_sqlite_savepoints,
+)
+from alpha.infra.connectors.statement_timeout import (
+    enable_statement_timeouts,
+    listen_statement_timeouts,
+)
+from alpha.interfaces.sql_mapper import SqlMapper
+
+
+class AsyncSqlAlchemyDatabase:
+    """Asyncio SQL Alchemy Database Connector class. This class provides
+    methods to connect to a SQL database by using an asyncio driver, like
+    asyncpg, aiomysql or aiosqlite, manage asyncio sessions, and create or
+    drop tables based on SQL Alchemy metadata.
+
+    Because the connection to the database can only be used in a coroutine,
+    the schema and the tables are not created when the instance is
+    initialized, but when the `initialize` method is awaited.
+
+    Parameters
+    ----------
+    host
+        Hostname of the database server, by default ""
+    port
+        Port number of the database server, by default None
+    username
+        Username for the database, by default ""
+    password
+        Password for the database, by default ""
+    db_name
+        Database name, by default ""
+    db_type
+        Database type, by default "postgresql+asyncpg"
+    conn_str
+        Connection string. Can be used instead of host, port, username,
+        password, and db_name, by default None
+    schema_name
+        Schema name, by default "public"
+    create_schema
+        Whether `initialize` creates the schema if it does not exist, by
+        default True
+    create_tables
+        Whether `initialize` creates the tables if they do not exist, by
+        default True
+    pool_pre_ping
+        Whether to enable pool pre-ping, by default True
+    pool_size
+        The number of connections to keep open in the pool, by default None
+        which results in using the default of SQL Alchemy (5)
+    max_overflow
+        The number of connections which can be opened in addition to the
+        pool size, by default None which results in using the default of
+        SQL Alchemy (10)
+    pool_recycle
+        The number of seconds after which a connection is replaced, by
+        default None which results in never recycling connections
+    pool_timeout
+        The number of seconds to wait for a free connection, by default None
+        which results in using the default of SQL Alchemy (30)
+    pool_use_lifo
+        Whether to reuse the most recently returned connection first, by
+        default None which results in first-in-first-out
+    query_monitor
+        Monitor of the statements of the database, by default None
+    statement_timeout
+        The number of seconds after which a statement is cancelled with a
+        `StatementTimeoutError`, by default None which results in no
+        timeout. Units of work can override the timeout. The timeout is
+        applied on PostgreSQL and MySQL like by `SqlAlchemyDatabase`, and
+        is not supported on SQLite.
+    sqlite_savepoints
+        Whether SQL Alchemy begins the transactions of a file based SQLite
+        database instead of the aiosqlite driver, by default False. Enable
+        it to roll back nested units of work on SQLite, see
+        `enable_sqlite_savepoints`. Has no effect on other databases.
+    mapper
+        SQL Mapper instance, by default None
+
+    Raises
+    ------
+    exceptions.MissingDependencyException
+        When the greenlet package, which is required by the asyncio
+        extension of SQL Alchemy, is not installed
+    """
+
+    def __init__(
+        self,
+        host: str = "",
+        port: int | None = None,
+        username: str = "",
+        password: str = "",
+        db_name: str = "",
+        db_type: str = "postgresql+asyncpg",
+        conn_str: str | None = None,
+        schema_name: str = "public",
+        create_schema: bool = True,
+        create_tables: bool = True,
+        pool_pre_ping: bool = True,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_recycle: int | None = None,
+        pool_timeout: float | None = None,
+        pool_use_lifo: bool | None = None,
+        query_monitor: QueryMonitor | None = None,
+        statement_timeout: float | None = None,
+        sqlite_savepoints: bool = False,
+        mapper: SqlMapper | None = None,
+    ) -> None:
+        try:
+            import greenlet  # type: ignore  # noqa: F401
+        except ImportError:
+            raise exceptions.MissingDependencyException(
+                "The greenlet package is required to use an asyncio "
+                "database. Install it by using the 'asyncio' extra"
+            )
+
+        self._host = host
+        self._port = port
+        self._username = username
+        self._password = password
+        self._db_name = db_name
+        self._db_type = db_type
+        self._schema_name = schema_name
+        self._mapper = mapper
+        self._query_monitor = query_monitor
+        self._statement_timeout = statement_timeout
+        self._create_schema = create_schema
+        self._create_tables = create_tables
+
+        if conn_str is None:
+            conn_str = (
+                f"{self._db_type}://{self._username}:"
+                + f"{self._password}@{self._host}:{self._port}/{self._db_name}"
+            )
+        self._connection_string = conn_str
+
+        # Options which are not set are left to the defaults of the pool
+        pool_options: dict[str, Any] = {
+            key: value
+            for key, value in {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_recycle": pool_recycle,
+                "pool_timeout": pool_timeout,
+                "pool_use_lifo": pool_use_lifo,
+            }.items()
+            if value is not None
+        }
+        pool_options["pool_pre_ping"] = pool_pre_ping
+
+        self._pool_monitor = PoolMonitor()
+        url = sa.make_url(self._connection_string)
+        dialect: Any = url.get_dialect()
+        self._engine = create_async_engine(
+            url,
+            poolclass=self._pool_monitor.pool_class(
+                dialect.get_pool_class(url)
+            ),
+            **pool_options,
+        )
+        self._pool_monitor.attach(self._engine.sync_engine)
+        if self._query_monitor:
+            self._query_monitor.attach(self._engine.sync_engine)
+        if sqlite_savepoints:
+            enable_sqlite_savepoints(self._engine.sync_engine)
+        enable_statement_timeouts(self._engine.sync_engine)
+        self._pid = os.getpid()
+        _databases.add(self)
+        # The events of asyncio sessions are dispatched by their
+        # synchronous session. A subclass per database keeps the listeners
+        # of the databases apart.
+        sync_session_class: type[Session] = type(
+            "AsyncSqlAlchemySession", (Session,), {}
+        )
+        listen_statement_timeouts(sync_session_class, statement_timeout)
+        self._session_factory = async_sessionmaker(
+            bind=self._engine,
+            autoflush=True,
+            expire_on_commit=False,
+            sync_session_class=sync_session_class,
+        )
+
+        if self._mapper and not self._mapper.started:
+            self._mapper.start_mapping()
+
+    async def initialize(self) -> None:
+        """Create the schema and the tables of the mapper, when they do not
+        exist and their creation is enabled."""
+        if self._create_schema:
+            async with self._engine.begin() as connection:
+                await connection.run_sync(self._ensure_schema)
+        if self._mapper and self._create_tables:
+            await self.create_tables(self._mapper.metadata)
+
+    def get_session(self) -> AsyncSession:
+        """Get a new SQL Alchemy asyncio session
+
+        Returns
+        -------
+        AsyncSession
+            SQL Alchemy asyncio session instance
+        """
+        if self._pid != os.getpid():
+            self.reset_after_fork()
+        return self._session_factory()
+
+    def reset_after_fork(self) -> None:
+        """Discard the connections which are inherited from the parent
+        process after a fork. The pool of the child process opens its own
+        connections when they are needed. This method is called
+        automatically in the child process of `os.fork()`.
+        """
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        self._pid = pid
+        self._engine.sync_engine.dispose(close=False)
+        self._pool_monitor.reset()
+
+    def engine(self) -> AsyncEngine:
+        """Get the SQL Alchemy asyncio engine
+
+        Returns
+        -------
+        AsyncEngine
+            SQL Alchemy asyncio engine instance
+        """
+        return self._engine
+
+    @property
+    def query_monitor(self) -> QueryMonitor | None:
+        """The monitor of the statements of the database, or None when the
+        statements are not monitored."""
+        return self._query_monitor
+
+    @property
+    def statement_timeout(self) -> float | None:
+        """The default statement timeout of the units of work in seconds,
+        or None when statements are not cancelled."""
+        return self._statement_timeout
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Get the statistics of the connection pool of the engine.
+
+        Returns
+        -------
+        dict[str, Any]
+            The same statistics as `SqlAlchemyDatabase.pool_stats`
+        """
+        return self._pool_monitor.stats(self._engine.pool)
+
+    async def create_tables(
+        self, metadata: sa.MetaData, tables: list[sa.Table] | None = None
+    ) -> None:
+        """Create tables in the database
+
+        Parameters
+        ----------
+        metadata
+            SQL Alchemy MetaData instance
+        tables
+            List of tables to create, by default None
+        """
+        async with self._engine.begin() as connection:
+            await connection.run_sync(metadata.create_all, tables=tables)
+
+    async def drop_tables(
+        self, metadata: sa.MetaData, tables: list[sa.Table] | None = None
+    ) -> None:
+        """Drop tables from the database
+
+        Parameters
+        ----------
+        metadata
+            SQL Alchemy MetaData instance
+        tables
+            List of tables to drop, by default None
+        """
+        async with self._engine.begin() as connection:
+            await connection.run_sync(metadata.drop_all, tables=tables)
+
+    async def dispose(self) -> None:
+        """Close all connections of the pool. Should be awaited before the
+        event loop is closed."""
+        await self._engine.dispose()
+
+    def _ensure_schema(self, connection: sa.Connection) -> None:
+        """Create the schema in the database if it does not exist
+
+        Parameters
+        ----------
+        connection
+            SQL Alchemy connection, which is provided by `run_sync`
+        """
+        if not hasattr(connection.dialect, "has_schema"):
+            return
+        if not sa.inspect(connection).has_schema(self._schema_name):
+            connection.execute(sa.schema.CreateSchema(self._schema_name))
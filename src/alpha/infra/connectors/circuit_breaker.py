@@ -0,0 +1,315 @@
+"""Contains the CircuitBreaker class, which stops sending requests to a host
+of a REST API while the host is unhealthy."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from alpha import exceptions
+
+CIRCUIT_BREAKER_LOGGER = "alpha.http"
+"""The name of the logger to which the state transitions are written."""
+
+
+class CircuitState(Enum):
+    """An enumeration of the states of the circuit of a host.
+
+    Attributes
+    ----------
+    CLOSED
+        Requests are sent to the host.
+    OPEN
+        Requests fail fast with a `CircuitOpenException`, without being sent
+        to the host.
+    HALF_OPEN
+        A limited number of trial requests are sent to the host, to test
+        whether it has recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    """The state of the circuit of a host."""
+
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    trials: int = 0
+
+
+class CircuitBreaker:
+    """A per-host circuit breaker for the requests of the REST API
+    repositories.
+
+    The circuit of a host opens after `failure_threshold` consecutive failed
+    requests. While the circuit is open, requests to the host fail fast with
+    a `CircuitOpenException`, so an unhealthy API is not loaded with
+    requests and retries which would fail anyway. After `recovery_timeout`
+    seconds the circuit is half-open and at most `half_open_max_calls` trial
+    requests are sent. A successful trial closes the circuit, a failed trial
+    opens it again.
+
+    A request fails when sending it raises an exception, or when the status
+    code of the response is one of the `failure_statuses`. Client errors do
+    not fail a request, because they do not indicate an unhealthy host.
+
+    One circuit breaker can be shared by many repositories, so all requests
+    to a host use the same circuit. The state transitions are written to the
+    `alpha.http` logger, passed to the optional `on_state_change` callback,
+    and counted in the statistics of `stats()`.
+
+    Example:
+    ```python
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+    users = RestApiRepository[User](
+        host="users.example.com", circuit_breaker=breaker
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_statuses: frozenset[int] = frozenset({500, 502, 503, 504}),
+        on_state_change: (
+            Callable[[str, CircuitState, CircuitState], Any] | None
+        ) = None,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Parameters
+        ----------
+        failure_threshold
+            The number of consecutive failed requests which opens the
+            circuit of a host, by default 5
+        recovery_timeout
+            The number of seconds after which an open circuit becomes
+            half-open, by default 30.0
+        half_open_max_calls
+            The maximum number of trial requests of a half-open circuit, by
+            default 1
+        failure_statuses
+            The status codes of the responses which count as failures, by
+            default 500, 502, 503 and 504
+        on_state_change
+            A callable which is called with the host, the previous state and
+            the new state of every state transition, for example to update a
+            metrics gauge, by default None
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_statuses = failure_statuses
+        self.on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+        self._counters: dict[str, int] = {}
+        self.reset()
+
+    def state(self, host: str) -> CircuitState:
+        """Get the state of the circuit of a host.
+
+        Parameters
+        ----------
+        host
+            The host, including the port if specified in the URL
+
+        Returns
+        -------
+        CircuitState
+            The state of the circuit
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                return CircuitState.CLOSED
+            if self._recovered(circuit):
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def before_request(self, host: str) -> None:
+        """Check whether a request to a host may be sent. Call
+        `record_success` or `record_failure` with the outcome of every
+        permitted request.
+
+        Parameters
+        ----------
+        host
+            The host, including the port if specified in the URL
+
+        Raises
+        ------
+        exceptions.CircuitOpenException
+            If the circuit of the host is open, or half-open with the
+            maximum number of trial requests in flight.
+        """
+        transition = None
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            if self._recovered(circuit):
+                transition = self._transition(
+                    host, circuit, CircuitState.HALF_OPEN
+                )
+            if circuit.state is CircuitState.OPEN or (
+                circuit.state is CircuitState.HALF_OPEN
+                and circuit.trials >= self.half_open_max_calls
+            ):
+                self._counters["rejected"] += 1
+                rejected = True
+            else:
+                if circuit.state is CircuitState.HALF_OPEN:
+                    circuit.trials += 1
+                rejected = False
+        self._notify(transition)
+        if rejected:
+            raise exceptions.CircuitOpenException(
+                f"Service Unavailable: The circuit breaker of {host} is open "
+                "because of previous failed requests."
+            )
+
+    def record_success(self, host: str) -> None:
+        """Record a successful request to a host, which closes a half-open
+        circuit.
+
+        Parameters
+        ----------
+        host
+            The host, including the port if specified in the URL
+        """
+        transition = None
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.failures = 0
+            if circuit.state is not CircuitState.CLOSED:
+                transition = self._transition(
+                    host, circuit, CircuitState.CLOSED
+                )
+        self._notify(transition)
+
+    def record_failure(self, host: str) -> None:
+        """Record a failed request to a host, which opens the circuit when
+        it is half-open or when the failure threshold is reached.
+
+        Parameters
+        ----------
+        host
+            The host, including the port if specified in the URL
+        """
+        transition = None
+        with self._lock:
+            self._counters["failures"] += 1
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.failures += 1
+            if circuit.state is CircuitState.HALF_OPEN or (
+                circuit.state is CircuitState.CLOSED
+                and circuit.failures >= self.failure_threshold
+            ):
+                transition = self._transition(host, circuit, CircuitState.OPEN)
+        self._notify(transition)
+
+    def record_response(self, host: str, status_code: int) -> None:
+        """Record the response of a request to a host as a success or a
+        failure, depending on the status code.
+
+        Parameters
+        ----------
+        host
+            The host, including the port if specified in the URL
+        status_code
+            The status code of the response
+        """
+        if status_code in self.failure_statuses:
+            self.record_failure(host)
+        else:
+            self.record_success(host)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the statistics of the circuit breaker.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number of transitions to each state, the number of failed and
+            rejected requests, and the state and consecutive failures of the
+            circuit of every host.
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._counters)
+            stats["hosts"] = {
+                host: {
+                    "state": (
+                        CircuitState.HALF_OPEN
+                        if self._recovered(circuit)
+                        else circuit.state
+                    ).value,
+                    "consecutive_failures": circuit.failures,
+                }
+                for host, circuit in self._circuits.items()
+            }
+        return stats
+
+    def reset(self) -> None:
+        """Close all circuits and reset the counters."""
+        with self._lock:
+            self._circuits = {}
+            self._counters = {
+                "opened": 0,
+                "half_opened": 0,
+                "closed": 0,
+                "failures": 0,
+                "rejected": 0,
+            }
+
+    def _recovered(self, circuit: _Circuit) -> bool:
+        """Check whether an open circuit has reached its recovery timeout."""
+        return (
+            circuit.state is CircuitState.OPEN
+            and time.monotonic() - circuit.opened_at >= self.recovery_timeout
+        )
+
+    def _transition(
+        self, host: str, circuit: _Circuit, state: CircuitState
+    ) -> tuple[str, CircuitState, CircuitState]:
+        """Change the state of a circuit. Has to be called with the lock
+        held."""
+        previous = circuit.state
+        circuit.state = state
+        circuit.trials = 0
+        if state is CircuitState.OPEN:
+            circuit.opened_at = time.monotonic()
+            self._counters["opened"] += 1
+        elif state is CircuitState.HALF_OPEN:
+            self._counters["half_opened"] += 1
+        else:
+            circuit.failures = 0
+            self._counters["closed"] += 1
+        return host, previous, state
+
+    def _notify(
+        self, transition: tuple[str, CircuitState, CircuitState] | None
+    ) -> None:
+        """Log a state transition and call the `on_state_change` callback,
+        outside of the lock."""
+        if transition is None:
+            return
+        host, previous, state = transition
+        level = logging.WARNING if state is CircuitState.OPEN else logging.INFO
+        logging.getLogger(CIRCUIT_BREAKER_LOGGER).log(
+            level,
+            "Circuit breaker of %s changed from %s to %s",
+            host,
+            previous.value,
+            state.value,
+        )
+        if self.on_state_change:
+            self.on_state_change(host, previous, state)
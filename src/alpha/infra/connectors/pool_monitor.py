@@ -0,0 +1,227 @@
+"""Contains the PoolMonitor class, which collects statistics of a SQLAlchemy
+connection pool from pool events."""
+
+import bisect
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, PoolProxiedConnection
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""The default upper bounds in seconds of the buckets of the checkout
+latency histogram."""
+
+
+class PoolMonitor:
+    """Collects statistics of a connection pool, like the number of checked
+    out connections, the latency of checkouts and the number of invalidated
+    connections.
+
+    The statistics are fed by pool events. The checkout latency includes
+    the time spent waiting for a free connection, opening a new connection
+    and the pre-ping. It is measured by the pool class which is returned by
+    `pool_class`.
+    """
+
+    def __init__(
+        self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        """Initialize the pool monitor.
+
+        Parameters
+        ----------
+        buckets
+            The ascending upper bounds in seconds of the buckets of the
+            checkout latency histogram, by default DEFAULT_LATENCY_BUCKETS
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._counters: dict[str, int] = {}
+        self._latency_counts: list[int] = []
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        self.reset()
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to the pool events of an engine. The listeners are kept
+        when the pool is recreated by `Engine.dispose()`.
+
+        Parameters
+        ----------
+        engine
+            The engine of which the pool is monitored
+        """
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "soft_invalidate", self._on_soft_invalidate)
+        event.listen(engine, "close", self._on_close)
+
+    def pool_class(self, base: type[Pool]) -> type[Pool]:
+        """Create a subclass of a pool class which reports the latency of
+        every checkout to this monitor.
+
+        Parameters
+        ----------
+        base
+            The pool class of the engine
+
+        Returns
+        -------
+        type[Pool]
+            The pool class which measures checkouts
+        """
+        return type(base.__name__, (_TimedPool, base), {"monitor": self})
+
+    @property
+    def checked_out(self) -> int:
+        """The number of connections which are checked out of the pool."""
+        return self._checked_out
+
+    def record_checkout(self, seconds: float) -> None:
+        """Add the latency of a checkout to the histogram.
+
+        Parameters
+        ----------
+        seconds
+            The duration of the checkout in seconds
+        """
+        with self._lock:
+            self._latency_counts[
+                bisect.bisect_left(self.buckets, seconds)
+            ] += 1
+            self._latency_sum += seconds
+            self._latency_max = max(self._latency_max, seconds)
+
+    def record_checkout_timeout(self) -> None:
+        """Count a checkout which timed out waiting for a connection."""
+        with self._lock:
+            self._counters["checkout_timeouts"] += 1
+
+    def stats(self, pool: Pool | None = None) -> dict[str, Any]:
+        """Get the statistics of the pool.
+
+        Parameters
+        ----------
+        pool
+            The monitored pool, by default None. When supplied, the size and
+            overflow of a `QueuePool` are included.
+
+        Returns
+        -------
+        dict[str, Any]
+            The counters of the pool events, the number of checked out
+            connections and a cumulative histogram of the checkout latency,
+            keyed by the upper bound of each bucket.
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._counters)
+            stats["checked_out"] = self._checked_out
+            cumulative = 0
+            histogram: dict[str, int] = {}
+            bounds = [*map(str, self.buckets), "+Inf"]
+            for bound, count in zip(bounds, self._latency_counts):
+                cumulative += count
+                histogram[bound] = cumulative
+            stats["checkout_latency"] = {
+                "count": cumulative,
+                "sum": self._latency_sum,
+                "max": self._latency_max,
+                "buckets": histogram,
+            }
+
+        for name in ("size", "overflow", "checkedin"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                stats["checked_in" if name == "checkedin" else name] = method()
+        return stats
+
+    def reset(self) -> None:
+        """Reset the counters and the histogram."""
+        with self._lock:
+            self._checked_out = 0
+            self._counters = {
+                "connects": 0,
+                "checkouts": 0,
+                "checkins": 0,
+                "checkout_timeouts": 0,
+                "invalidated": 0,
+                "invalidated_by_pre_ping": 0,
+                "soft_invalidated": 0,
+                "closed": 0,
+            }
+            self._latency_counts = [0] * (len(self.buckets) + 1)
+            self._latency_sum = 0.0
+            self._latency_max = 0.0
+
+    def _increment(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _on_connect(self, dbapi_connection: Any, record: Any) -> None:
+        self._increment("connects")
+
+    def _on_checkout(
+        self, dbapi_connection: Any, record: Any, proxy: Any
+    ) -> None:
+        with self._lock:
+            self._counters["checkouts"] += 1
+            self._checked_out += 1
+
+    def _on_checkin(self, dbapi_connection: Any, record: Any) -> None:
+        with self._lock:
+            self._counters["checkins"] += 1
+            self._checked_out = max(0, self._checked_out - 1)
+
+    def _on_invalidate(
+        self, dbapi_connection: Any, record: Any, exception: Any
+    ) -> None:
+        with self._lock:
+            self._counters["invalidated"] += 1
+            # A failed pre-ping raises a DisconnectionError on checkout
+            if isinstance(exception, exc.DisconnectionError):
+                self._counters["invalidated_by_pre_ping"] += 1
+
+    def _on_soft_invalidate(
+        self, dbapi_connection: Any, record: Any, exception: Any
+    ) -> None:
+        self._increment("soft_invalidated")
+
+    def _on_close(self, dbapi_connection: Any, record: Any) -> None:
+        self._increment("closed")
+
+
+class _TimedPool(Pool):
+    """Pool mixin which reports the duration of every checkout to the
+    `PoolMonitor` of the class. The class attribute survives the recreation
+    of the pool by `Engine.dispose()`."""
+
+    monitor: PoolMonitor
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.monitor.record_checkout_timeout()
+            raise
+        self.monitor.record_checkout(time.perf_counter() - start)
+        return connection
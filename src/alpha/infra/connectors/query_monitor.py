@@ -0,0 +1,462 @@
+"""Contains the QueryMonitor class, which measures the SQL statements of an
+engine from engine events, and the QuerySummary class, which collects the
+statements of a unit of work."""
+
+import contextvars
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SLOW_QUERY_LOGGER = "alpha.sql.slow"
+"""The name of the logger to which the slow statements are written."""
+
+QUERY_LOGGER = "alpha.sql"
+"""The name of the logger to which the possible N+1 patterns and the
+summaries of the units of work are written."""
+
+ORIGIN_MODULES: tuple[str, ...] = ("alpha.repositories.",)
+"""The prefixes of the modules of which the public methods are reported as
+the origin of a statement."""
+
+_START_KEY = "alpha_query_start"
+
+_LIBRARY_MODULES = ("alpha.", "sqlalchemy.")
+
+_ORIGIN_DEPTH = 64
+
+# The origin names of the code objects on the stack of a statement. An empty
+# name marks a library frame and None a frame of the application.
+_code_origins: dict[CodeType, str | None] = {}
+_code_origins_modules: tuple[str, ...] = ORIGIN_MODULES
+
+_summary: contextvars.ContextVar["QuerySummary | None"] = (
+    contextvars.ContextVar("alpha_query_summary", default=None)
+)
+
+
+@dataclass
+class StatementRecord:
+    """A statement which has been executed on a monitored engine
+
+    Attributes
+    ----------
+    statement
+        The SQL statement with placeholders for the bound parameters, which
+        is used as the shape of the statement
+    duration
+        The duration of the execution in seconds
+    rowcount
+        The number of rows of an INSERT, UPDATE or DELETE statement which
+        are reported by the `rowcount` of the cursor, or None for other
+        statements and when the driver does not report it
+    origin
+        The repository method which executed the statement, like
+        "SqlAlchemyRepository.get_by_id", or None when the statement was not
+        executed by a repository
+    """
+
+    statement: str
+    duration: float
+    rowcount: int | None
+    origin: str | None
+
+
+class QuerySummary:
+    """The statements which are executed in a unit of work, when the
+    database of the unit of work has a `QueryMonitor`."""
+
+    def __init__(self) -> None:
+        self.records: list[StatementRecord] = []
+        self.slow: list[StatementRecord] = []
+        self.n_plus_one: dict[str, int] = {}
+        self._shapes: Counter[str] = Counter()
+
+    @property
+    def count(self) -> int:
+        """The number of executed statements."""
+        return len(self.records)
+
+    @property
+    def duration(self) -> float:
+        """The total duration of the executed statements in seconds."""
+        return sum(record.duration for record in self.records)
+
+    def shapes(self) -> dict[str, int]:
+        """Get the number of executions per statement shape.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of executions keyed by the statement, most executed
+            first
+        """
+        return dict(self._shapes.most_common())
+
+    def add(self, record: StatementRecord) -> int:
+        """Add an executed statement.
+
+        Parameters
+        ----------
+        record
+            The executed statement
+
+        Returns
+        -------
+        int
+            The number of executions of the shape of the statement in this
+            summary
+        """
+        self.records.append(record)
+        self._shapes[record.statement] += 1
+        return self._shapes[record.statement]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the summary as a dictionary.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number and the total duration of the statements, the number
+            of statements per origin, and the slow statements and the
+            possible N+1 patterns
+        """
+        return {
+            "statements": self.count,
+            "duration": self.duration,
+            "origins": dict(
+                Counter(
+                    record.origin or "<unknown>" for record in self.records
+                ).most_common()
+            ),
+            "slow": [record.statement for record in self.slow],
+            "n_plus_one": dict(self.n_plus_one),
+        }
+
+    def __str__(self) -> str:
+        text = (
+            f"{self.count} statements in {self.duration * 1000:.1f} ms, "
+            f"{len(self.slow)} slow"
+        )
+        for statement, count in self.n_plus_one.items():
+            text += f", possible N+1: {count}x {_shorten(statement)}"
+        return text
+
+
+def current_summary() -> QuerySummary | None:
+    """Get the summary of the unit of work which is active in the current
+    thread or asyncio task.
+
+    Returns
+    -------
+    QuerySummary | None
+        The summary of the active unit of work, or None outside of a unit
+        of work
+    """
+    return _summary.get()
+
+
+def start_summary() -> tuple[QuerySummary, contextvars.Token[Any]]:
+    """Start collecting the statements of a unit of work in a new summary.
+
+    Returns
+    -------
+    tuple[QuerySummary, contextvars.Token[Any]]
+        The new summary, and the token which is passed to `end_summary`
+    """
+    summary = QuerySummary()
+    return summary, _summary.set(summary)
+
+
+def end_summary(token: contextvars.Token[Any]) -> None:
+    """Stop collecting the statements of a unit of work, and write the
+    summary to the debug log when statements have been executed.
+
+    Parameters
+    ----------
+    token
+        The token which is returned by `start_summary`
+    """
+    summary = _summary.get()
+    try:
+        _summary.reset(token)
+    except ValueError:
+        # The token was created in another context, like another task
+        _summary.set(None)
+    logger = logging.getLogger(QUERY_LOGGER)
+    if summary and summary.records and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Unit of work executed %s", summary)
+
+
+class QueryMonitor:
+    """Measures the statements which are executed on an engine.
+
+    For every statement the duration, the row count of the cursor and the
+    repository method which executed it are recorded in the
+    `QuerySummary` of the active unit of work, and aggregated per origin.
+    Statements which take longer than `slow_query_threshold` are written to
+    the `alpha.sql.slow` logger. When the same statement shape is executed
+    more than `n_plus_one_threshold` times in a unit of work, which is
+    typical for lazy loading in a loop, a warning is written to the
+    `alpha.sql` logger once per shape and unit of work.
+
+    Example:
+    ```python
+    monitor = QueryMonitor(slow_query_threshold=0.2)
+    db = SqlAlchemyDatabase(..., query_monitor=monitor)
+
+    with uow:
+        uow.users.get_by_id(1)
+    print(uow.query_summary.as_dict())
+    print(monitor.stats())
+    ```
+    """
+
+    def __init__(
+        self,
+        slow_query_threshold: float | None = 0.5,
+        n_plus_one_threshold: int | None = 10,
+    ) -> None:
+        """Initialize the query monitor.
+
+        Parameters
+        ----------
+        slow_query_threshold
+            The duration in seconds above which a statement is logged as a
+            slow statement, by default 0.5. None disables the slow query log.
+        n_plus_one_threshold
+            The number of executions of the same statement shape in one unit
+            of work above which a possible N+1 pattern is reported, by
+            default 10. None disables the detection.
+        """
+        self.slow_query_threshold = slow_query_threshold
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._lock = threading.Lock()
+        self._origins: dict[str, dict[str, float]] = {}
+        self._counters: dict[str, int] = {}
+        self.reset()
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to the statement events of an engine.
+
+        Parameters
+        ----------
+        engine
+            The engine of which the statements are measured
+        """
+        event.listen(engine, "before_cursor_execute", self._on_before)
+        event.listen(engine, "after_cursor_execute", self._on_after)
+        event.listen(engine, "handle_error", self._on_error)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the statistics of the measured statements.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number of statements, slow statements and possible N+1
+            patterns, and the number, total and maximum duration of the
+            statements per origin, keyed by the repository method.
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._counters)
+            stats["origins"] = {
+                origin: dict(values)
+                for origin, values in self._origins.items()
+            }
+        return stats
+
+    def reset(self) -> None:
+        """Reset the statistics."""
+        with self._lock:
+            self._counters = {"statements": 0, "slow": 0, "n_plus_one": 0}
+            self._origins = {}
+
+    def record(self, record: StatementRecord) -> None:
+        """Record an executed statement in the statistics and the summary of
+        the active unit of work, and report slow statements and possible N+1
+        patterns.
+
+        Parameters
+        ----------
+        record
+            The executed statement
+        """
+        slow = (
+            self.slow_query_threshold is not None
+            and record.duration > self.slow_query_threshold
+        )
+        summary = _summary.get()
+        executions = summary.add(record) if summary else 0
+        n_plus_one = (
+            self.n_plus_one_threshold is not None
+            and executions == self.n_plus_one_threshold + 1
+        )
+
+        with self._lock:
+            self._counters["statements"] += 1
+            self._counters["slow"] += slow
+            self._counters["n_plus_one"] += n_plus_one
+            origin = self._origins.setdefault(
+                record.origin or "<unknown>",
+                {"count": 0, "duration": 0.0, "max": 0.0},
+            )
+            origin["count"] += 1
+            origin["duration"] += record.duration
+            origin["max"] = max(origin["max"], record.duration)
+
+        if slow:
+            if summary:
+                summary.slow.append(record)
+            logging.getLogger(SLOW_QUERY_LOGGER).warning(
+                "Slow statement (%.1f ms, %s rows affected) by %s: %s",
+                record.duration * 1000,
+                "?" if record.rowcount is None else record.rowcount,
+                record.origin or "<unknown>",
+                record.statement,
+            )
+        if n_plus_one and summary:
+            summary.n_plus_one[record.statement] = executions
+            logging.getLogger(QUERY_LOGGER).warning(
+                "Possible N+1 pattern: statement executed more than %d "
+                "times in one unit of work by %s: %s",
+                self.n_plus_one_threshold,
+                record.origin or "<unknown>",
+                record.statement,
+            )
+        elif summary and record.statement in summary.n_plus_one:
+            summary.n_plus_one[record.statement] = executions
+
+    def _on_before(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    def _on_after(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        duration = time.perf_counter() - conn.info[_START_KEY].pop()
+        # The row count of other statements is not defined by the DBAPI
+        rowcount = None
+        if context is not None and (
+            context.isinsert or context.isupdate or context.isdelete
+        ):
+            rowcount = getattr(cursor, "rowcount", -1)
+        self.record(
+            StatementRecord(
+                statement=statement,
+                duration=duration,
+                rowcount=(
+                    rowcount if rowcount is None or rowcount >= 0 else None
+                ),
+                origin=_origin(sys._getframe(1)),
+            )
+        )
+
+    def _on_error(self, context: Any) -> None:
+        # Discard the start time of the statement which failed
+        if context.connection is None:
+            return
+        starts = context.connection.info.get(_START_KEY)
+        if starts:
+            starts.pop()
+
+
+def _origin(frame: FrameType | None) -> str | None:
+    """Find the outermost public method of a repository on the stack.
+
+    The stack is searched up to the first frame of the application, which
+    is a frame outside of alpha and SQLAlchemy, and at most `_ORIGIN_DEPTH`
+    frames deep. The origin of every code object is only determined once.
+
+    Parameters
+    ----------
+    frame
+        The frame from which the stack is searched
+
+    Returns
+    -------
+    str | None
+        The qualified name of the method, like
+        "SqlAlchemyRepository.get_by_id", or None when no repository method
+        is on the stack
+    """
+    global _code_origins_modules
+    if _code_origins_modules is not ORIGIN_MODULES:
+        _code_origins.clear()
+        _code_origins_modules = ORIGIN_MODULES
+
+    origin = None
+    for _ in range(_ORIGIN_DEPTH):
+        if frame is None:
+            break
+        code = frame.f_code
+        try:
+            name = _code_origins[code]
+        except KeyError:
+            name = _code_origins[code] = _code_origin(
+                code, frame.f_globals.get("__name__", "")
+            )
+        if name is None:
+            break
+        if name:
+            origin = name
+        frame = frame.f_back
+    return origin
+
+
+def _code_origin(code: CodeType, module: str) -> str | None:
+    """Determine whether a code object can be the origin of a statement.
+
+    Parameters
+    ----------
+    code
+        The code object of a frame
+    module
+        The name of the module of the frame
+
+    Returns
+    -------
+    str | None
+        The qualified name of a public method of an origin module, an
+        empty string for other code of alpha and SQLAlchemy, or None for
+        the code of the application
+    """
+    if not module.startswith(_LIBRARY_MODULES + ORIGIN_MODULES):
+        return None
+    qualname = code.co_qualname
+    # Functions, private methods, lambdas and comprehensions are skipped
+    if (
+        module.startswith(ORIGIN_MODULES)
+        and code.co_name[0] not in "_<"
+        and "." in qualname
+        and "<locals>" not in qualname
+    ):
+        return qualname
+    return ""
+
+
+def _shorten(statement: str, length: int = 80) -> str:
+    statement = " ".join(statement.split())
+    return (
+        statement if len(statement) <= length else statement[:length] + "..."
+    )
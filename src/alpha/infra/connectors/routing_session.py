@@ -0,0 +1,154 @@
+"""Contains the RoutingSession class, a SQLAlchemy session which routes
+read-only statements to read replicas, and the ReplicaRouter class which
+balances the statements over the replicas."""
+
+import itertools
+import threading
+from typing import Any, Literal
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from alpha.infra.connectors.pool_monitor import PoolMonitor
+
+READ_ONLY_OPTION = "alpha_read_only"
+"""The execution option which marks a statement as read-only, so it can be
+executed on a read replica."""
+
+
+class ReplicaRouter:
+    """Selects the read replica on which read-only statements are executed.
+
+    Two balancing strategies are supported: "round_robin", which selects
+    the replicas in turn, and "least_connections", which selects the replica
+    with the fewest checked out connections in this process.
+    """
+
+    def __init__(
+        self,
+        replicas: list[tuple[Engine, PoolMonitor]],
+        balancing: Literal["round_robin", "least_connections"] = "round_robin",
+    ) -> None:
+        """Initialize the replica router.
+
+        Parameters
+        ----------
+        replicas
+            The engines of the replicas, with the monitors of their pools
+        balancing
+            The balancing strategy, by default "round_robin"
+
+        Raises
+        ------
+        ValueError
+            When the balancing strategy is unknown
+        """
+        if balancing not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unknown replica balancing: {balancing}")
+        self.replicas = replicas
+        self.balancing = balancing
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def choose(self) -> Engine:
+        """Select a replica.
+
+        Returns
+        -------
+        Engine
+            The engine of the selected replica
+        """
+        if self.balancing == "least_connections":
+            engine, _ = min(
+                self.replicas, key=lambda replica: replica[1].checked_out
+            )
+            return engine
+        with self._lock:
+            ix = next(self._counter) % len(self.replicas)
+        return self.replicas[ix][0]
+
+
+class RoutingSession(Session):
+    """A session which executes read-only statements on a read replica and
+    all other statements on the primary database.
+
+    A statement is read-only when the session is read-only, for example in
+    a read-only unit of work, or when the statement has the
+    `READ_ONLY_OPTION` execution option, which is set by the repository
+    methods with `read_only=True`. Flushes and INSERT, UPDATE and DELETE
+    statements are always executed on the primary database. With
+    read-your-writes enabled, all statements are executed on the primary
+    database after the first write, until the session is closed, so they
+    see the written rows regardless of the replication lag.
+
+    The replica is selected once per session, so all read-only statements
+    of a unit of work see the same state. Without a router the session
+    behaves like a regular session.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        router: ReplicaRouter | None = None,
+        read_your_writes: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the routing session.
+
+        Parameters
+        ----------
+        router
+            The router which selects the replica, by default None
+        read_your_writes
+            Whether to execute all statements on the primary database after
+            the first write, by default True
+        """
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self.read_your_writes = read_your_writes
+        self.read_only = False
+        self._written = False
+        self._replica: Engine | None = None
+
+    def get_bind(
+        self, mapper: Any = None, clause: Any = None, **kwargs: Any
+    ) -> Any:
+        """Select the engine on which a statement is executed.
+
+        Parameters
+        ----------
+        mapper
+            The mapper of the statement, by default None
+        clause
+            The statement, by default None
+
+        Returns
+        -------
+        Engine | Connection
+            The primary database or a read replica
+        """
+        if self.router is None or not self.router.replicas:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        if self._flushing or isinstance(clause, UpdateBase):
+            self._written = True
+        elif not (self._written and self.read_your_writes) and (
+            self.read_only
+            or (
+                clause is not None
+                and clause._execution_options.get(READ_ONLY_OPTION)
+            )
+        ):
+            if self._replica is None:
+                self._replica = self.router.choose()
+            return self._replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def close(self) -> None:
+        """Close the session and forget the selected replica and the
+        writes."""
+        super().close()
+        self.read_only = False
+        self._written = False
+        self._replica = None
@@ -1,5 +1,9 @@
 """SQL Alchemy Database Connector module"""
 
+import os
+import weakref
+from typing import Any, Literal
+
 import sqlalchemy as sa
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import (
@@ -8,8 +12,74 @@ from sqlalchemy.orm import (
 )
 from sqlalchemy.orm.session import Session
 
+from alpha.infra.connectors.pool_monitor import PoolMonitor
+from alpha.infra.connectors.query_monitor import QueryMonitor
+from alpha.infra.connectors.routing_session import (
+    ReplicaRouter,
+    RoutingSession,
+)
+from alpha.infra.connectors.statement_timeout import (
+    enable_statement_timeouts,
+    listen_statement_timeouts,
+)
 from alpha.interfaces.sql_mapper import SqlMapper
 
+# Contains the SqlAlchemyDatabase and AsyncSqlAlchemyDatabase instances
+_databases: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def reset_databases_after_fork() -> None:
+    """Reset the engines of all `SqlAlchemyDatabase` and
+    `AsyncSqlAlchemyDatabase` instances in a forked child process, so every
+    process uses its own connections. Registered with `os.register_at_fork`
+    and used by the gunicorn `post_fork` hook.
+    """
+    for database in list(_databases):
+        database.reset_after_fork()
+
+
+def enable_sqlite_savepoints(engine: Engine) -> None:
+    """Let SQL Alchemy begin the transactions of a SQLite engine which uses
+    the pysqlite or aiosqlite driver.
+
+    These drivers only begin a transaction before a DML statement, so a
+    SAVEPOINT at the start of a transaction is released as if it was the
+    transaction itself, which commits the nested changes. With these
+    listeners the driver runs in autocommit mode and SQL Alchemy emits the
+    BEGIN statement, so nested units of work can be rolled back. Other
+    engines and in-memory databases are left alone, because all sessions of
+    an in-memory database share a single connection.
+
+    This changes the transaction handling of the driver for every
+    connection of the engine, for example a transaction is now also begun
+    before a SELECT statement, which holds a shared lock on the database
+    file until the transaction ends. The databases only call this function
+    when they are created with `sqlite_savepoints=True`.
+
+    Parameters
+    ----------
+    engine
+        SQL Alchemy engine instance
+    """
+    if engine.driver not in ("pysqlite", "aiosqlite") or (
+        engine.url.database in (None, "", ":memory:")
+    ):
+        return
+
+    @sa.event.listens_for(engine, "connect")
+    def disable_driver_transactions(
+        dbapi_connection: Any, connection_record: Any
+    ) -> None:
+        dbapi_connection.isolation_level = None
+
+    @sa.event.listens_for(engine, "begin")
+    def begin_transaction(connection: sa.Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_databases_after_fork)
+
 
 class SqlAlchemyDatabase:
     """SQL Alchemy Database Connector class. This class provides methods to
@@ -44,6 +114,50 @@ class SqlAlchemyDatabase:
         Whether to create tables if they do not exist, by default True
     pool_pre_ping
         Whether to enable pool pre-ping, by default True
+    pool_size
+        The number of connections to keep open in the pool, by default None
+        which results in using the default of SQL Alchemy (5)
+    max_overflow
+        The number of connections which can be opened in addition to the
+        pool size, by default None which results in using the default of
+        SQL Alchemy (10)
+    pool_recycle
+        The number of seconds after which a connection is replaced, by
+        default None which results in never recycling connections
+    pool_timeout
+        The number of seconds to wait for a free connection, by default None
+        which results in using the default of SQL Alchemy (30)
+    pool_use_lifo
+        Whether to reuse the most recently returned connection first, which
+        allows the database to close idle connections, by default None
+        which results in first-in-first-out
+    replica_urls
+        Connection strings of read replicas of the database, by default
+        None. Read-only units of work and repository reads with
+        `read_only=True` are executed on the replicas. The pool options
+        apply to every replica.
+    replica_balancing
+        How the replicas are selected, "round_robin" or
+        "least_connections", by default "round_robin"
+    read_your_writes
+        Whether a session executes all statements on the primary database
+        after the first write, so it sees its own writes, by default True
+    query_monitor
+        Monitor of the statements of the primary database and the replicas,
+        which records the duration of every statement and reports slow
+        statements and possible N+1 patterns, by default None
+    statement_timeout
+        The number of seconds after which a statement is cancelled with a
+        `StatementTimeoutError`, by default None which results in no
+        timeout. Units of work can override the timeout. The timeout is
+        applied with `SET LOCAL statement_timeout` on PostgreSQL, the
+        `max_execution_time` session variable on MySQL, which only limits
+        SELECT statements, and a progress handler on SQLite.
+    sqlite_savepoints
+        Whether SQL Alchemy begins the transactions of a file based SQLite
+        database instead of the pysqlite driver, by default False. Enable
+        it to roll back nested units of work on SQLite, see
+        `enable_sqlite_savepoints`. Has no effect on other databases.
     mapper
         SQL Mapper instance, by default None
     """
@@ -61,6 +175,19 @@ class SqlAlchemyDatabase:
         create_schema: bool = True,
         create_tables: bool = True,
         pool_pre_ping: bool = True,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_recycle: int | None = None,
+        pool_timeout: float | None = None,
+        pool_use_lifo: bool | None = None,
+        replica_urls: list[str] | None = None,
+        replica_balancing: Literal[
+            "round_robin", "least_connections"
+        ] = "round_robin",
+        read_your_writes: bool = True,
+        query_monitor: QueryMonitor | None = None,
+        statement_timeout: float | None = None,
+        sqlite_savepoints: bool = False,
         mapper: SqlMapper | None = None,
     ) -> None:
         self._host = host
@@ -71,6 +198,9 @@ class SqlAlchemyDatabase:
         self._db_type = db_type
         self._schema_name = schema_name
         self._mapper = mapper
+        self._sqlite_savepoints = sqlite_savepoints
+        self._query_monitor = query_monitor
+        self._statement_timeout = statement_timeout
 
         if conn_str is None:
             conn_str = (
@@ -79,14 +209,50 @@ class SqlAlchemyDatabase:
             )
         self._connection_string = conn_str
 
-        self._engine = sa.create_engine(
-            self._connection_string, pool_pre_ping=pool_pre_ping
+        # Options which are not set are left to the defaults of the pool
+        pool_options: dict[str, Any] = {
+            key: value
+            for key, value in {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_recycle": pool_recycle,
+                "pool_timeout": pool_timeout,
+                "pool_use_lifo": pool_use_lifo,
+            }.items()
+            if value is not None
+        }
+        pool_options["pool_pre_ping"] = pool_pre_ping
+
+        self._pool_monitor = PoolMonitor()
+        self._engine = self._create_engine(
+            self._connection_string, self._pool_monitor, pool_options
         )
-        self._session_factory = scoped_session(
-            sessionmaker(
-                bind=self._engine, autocommit=False, expire_on_commit=False
+        self._replicas: list[tuple[Engine, PoolMonitor]] = []
+        for replica_url in replica_urls or []:
+            monitor = PoolMonitor()
+            self._replicas.append(
+                (
+                    self._create_engine(replica_url, monitor, pool_options),
+                    monitor,
+                )
             )
+        router = (
+            ReplicaRouter(self._replicas, balancing=replica_balancing)
+            if self._replicas
+            else None
+        )
+        self._pid = os.getpid()
+        _databases.add(self)
+        session_factory = sessionmaker(
+            bind=self._engine,
+            class_=RoutingSession,
+            autocommit=False,
+            expire_on_commit=False,
+            router=router,
+            read_your_writes=read_your_writes,
         )
+        listen_statement_timeouts(session_factory, statement_timeout)
+        self._session_factory = scoped_session(session_factory)
 
         if self._mapper:
             if not self._mapper.started:
@@ -105,8 +271,33 @@ class SqlAlchemyDatabase:
         Session
             SQL Alchemy session instance
         """
+        if self._pid != os.getpid():
+            self.reset_after_fork()
         return self._session_factory()
 
+    def reset_after_fork(self) -> None:
+        """Discard the connections and sessions which are inherited from the
+        parent process after a fork. The pool of the child process opens its
+        own connections when they are needed.
+
+        The inherited connections are not closed, because they are still
+        used by the parent process. This method is called automatically in
+        the child process of `os.fork()`, and does nothing when the engine
+        has already been reset in the current process.
+        """
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        self._pid = pid
+        self._engine.dispose(close=False)
+        for engine, monitor in self._replicas:
+            engine.dispose(close=False)
+            monitor.reset()
+        # The sessions are dropped without closing them, because closing
+        # would roll back the transactions on the connections of the parent
+        self._session_factory.registry.clear()
+        self._pool_monitor.reset()
+
     def engine(self) -> Engine:
         """Get the SQL Alchemy engine
 
@@ -117,6 +308,51 @@ class SqlAlchemyDatabase:
         """
         return self._engine
 
+    def replicas(self) -> list[Engine]:
+        """Get the SQL Alchemy engines of the read replicas
+
+        Returns
+        -------
+        list[Engine]
+            SQL Alchemy engine instances
+        """
+        return [engine for engine, _ in self._replicas]
+
+    @property
+    def query_monitor(self) -> QueryMonitor | None:
+        """The monitor of the statements of the primary database and the
+        replicas, or None when the statements are not monitored."""
+        return self._query_monitor
+
+    @property
+    def statement_timeout(self) -> float | None:
+        """The default statement timeout of the units of work in seconds,
+        or None when statements are not cancelled."""
+        return self._statement_timeout
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Get the statistics of the connection pool of the engine.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number of checked out connections, the counters of the pool
+            events, like connects, checkouts, checkout timeouts and
+            connections invalidated by the pre-ping, and a cumulative
+            histogram of the checkout latency in seconds. For a `QueuePool`
+            the size, overflow and number of checked in connections are
+            included as well. When the database has read replicas, the
+            statistics of their pools are included as a list under the
+            "replicas" key.
+        """
+        stats = self._pool_monitor.stats(self._engine.pool)
+        if self._replicas:
+            stats["replicas"] = [
+                monitor.stats(engine.pool)
+                for engine, monitor in self._replicas
+            ]
+        return stats
+
     def create_tables(
         self, metadata: sa.MetaData, tables: list[sa.Table] | None = None
     ) -> None:
@@ -145,6 +381,43 @@ class SqlAlchemyDatabase:
         """
         metadata.drop_all(self._engine, tables=tables)
 
+    def _create_engine(
+        self,
+        conn_str: str,
+        monitor: PoolMonitor,
+        pool_options: dict[str, Any],
+    ) -> Engine:
+        """Create an engine of which the pool is monitored
+
+        Parameters
+        ----------
+        conn_str
+            Connection string
+        monitor
+            The monitor of the pool
+        pool_options
+            The options of the pool
+
+        Returns
+        -------
+        Engine
+            SQL Alchemy engine instance
+        """
+        url = sa.make_url(conn_str)
+        dialect: Any = url.get_dialect()
+        engine = sa.create_engine(
+            url,
+            poolclass=monitor.pool_class(dialect.get_pool_class(url)),
+            **pool_options,
+        )
+        monitor.attach(engine)
+        if self._query_monitor:
+            self._query_monitor.attach(engine)
+        if self._sqlite_savepoints:
+            enable_sqlite_savepoints(engine)
+        enable_statement_timeouts(engine)
+        return engine
+
     def _create_schema(self, engine: Engine, schema_name: str) -> None:
         """Create a schema in the database if it does not exist
 
@@ -0,0 +1,176 @@
+"""Contains the functions which apply statement timeouts to the transactions
+of a session and convert cancelled statements into a
+`StatementTimeoutError`."""
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.orm import Session, SessionTransaction
+
+from alpha import exceptions
+
+STATEMENT_TIMEOUT_KEY = "alpha_statement_timeout"
+"""The key in the info dictionary of a session under which the statement
+timeout of the active unit of work is stored, in seconds. A timeout of 0
+disables the timeout of the database."""
+
+_APPLIED_KEY = "alpha_applied_statement_timeout"
+_DEADLINE_KEY = "alpha_statement_deadline"
+
+# The number of SQLite virtual machine instructions between the calls of the
+# progress handler
+_SQLITE_PROGRESS_STEPS = 1000
+
+# The SQLSTATE of PostgreSQL for a cancelled statement, which is also used
+# for statements which are cancelled by pg_cancel_backend or the user, and
+# the message which identifies the statement timeout
+_PG_QUERY_CANCELED = "57014"
+_PG_TIMEOUT_MESSAGE = "canceling statement due to statement timeout"
+
+# The error code of MySQL for a statement which exceeded max_execution_time
+_MYSQL_QUERY_TIMEOUT = 3024
+
+
+def enable_statement_timeouts(engine: Engine) -> None:
+    """Prepare an engine for statement timeouts. Cancelled statements raise
+    a `StatementTimeoutError`, and SQLite connections of the pysqlite driver
+    get a progress handler which interrupts statements after their deadline.
+
+    Parameters
+    ----------
+    engine
+        SQL Alchemy engine instance
+    """
+    event.listen(engine, "handle_error", _on_error)
+    if engine.driver != "pysqlite":
+        return
+    event.listen(engine, "connect", _on_sqlite_connect)
+    event.listen(engine, "checkin", _on_sqlite_checkin)
+    event.listen(engine, "before_cursor_execute", _on_sqlite_execute)
+
+
+def listen_statement_timeouts(factory: Any, default: float | None) -> None:
+    """Apply a statement timeout to every transaction of the sessions of a
+    session factory. The timeout of a unit of work, which is stored in the
+    info of the session under `STATEMENT_TIMEOUT_KEY`, overrides the default.
+
+    Parameters
+    ----------
+    factory
+        The sessionmaker or Session class of which the sessions are timed
+    default
+        The statement timeout of the database in seconds, or None for no
+        timeout
+    """
+
+    def apply(
+        session: Session,
+        transaction: SessionTransaction,
+        connection: Connection,
+    ) -> None:
+        apply_statement_timeout(
+            connection, session.info.get(STATEMENT_TIMEOUT_KEY, default)
+        )
+
+    event.listen(factory, "after_begin", apply)
+
+
+def apply_statement_timeout(
+    connection: Connection, timeout: float | None
+) -> None:
+    """Apply a statement timeout to the transaction of a connection, by
+    using `SET LOCAL statement_timeout` on PostgreSQL, the
+    `max_execution_time` session variable on MySQL, which only applies to
+    SELECT statements, `max_statement_time` on MariaDB and the deadline of
+    the progress handler on SQLite. The MySQL and SQLite timeouts are kept
+    with the connection, so they are only changed when another timeout
+    applies.
+
+    Parameters
+    ----------
+    connection
+        The connection of which a transaction has begun
+    timeout
+        The statement timeout in seconds, None or 0 for no timeout
+    """
+    milliseconds = max(1, int(timeout * 1000)) if timeout else 0
+    name = connection.dialect.name
+    if name == "postgresql":
+        # SET LOCAL ends with the transaction, so only timeouts are set
+        if milliseconds:
+            connection.exec_driver_sql(
+                f"SET LOCAL statement_timeout = {milliseconds}"
+            )
+        return
+    if connection.info.get(_APPLIED_KEY, 0) == milliseconds:
+        return
+    if name in ("mysql", "mariadb"):
+        if getattr(connection.dialect, "is_mariadb", False):
+            # MariaDB has max_statement_time in seconds instead
+            connection.exec_driver_sql(
+                f"SET SESSION max_statement_time = {milliseconds / 1000}"
+            )
+        else:
+            connection.exec_driver_sql(
+                f"SET SESSION max_execution_time = {milliseconds}"
+            )
+    connection.info[_APPLIED_KEY] = milliseconds
+
+
+def _on_error(context: ExceptionContext) -> Exception | None:
+    """Convert the error of a statement which was cancelled by the statement
+    timeout into a `StatementTimeoutError`."""
+    error = context.original_exception
+    code = getattr(error, "pgcode", None) or getattr(error, "sqlstate", None)
+    args: tuple[Any, ...] = getattr(error, "args", ())
+    timed_out = (
+        (code == _PG_QUERY_CANCELED and _PG_TIMEOUT_MESSAGE in str(error))
+        or (bool(args) and args[0] == _MYSQL_QUERY_TIMEOUT)
+        or (
+            str(error) == "interrupted"
+            and context.connection is not None
+            and context.connection.info.get(_DEADLINE_KEY) is not None
+            and time.monotonic() >= context.connection.info[_DEADLINE_KEY]
+        )
+    )
+    if not timed_out:
+        return None
+    # SQL Alchemy raises the returned exception from the original exception
+    return exceptions.StatementTimeoutError(
+        "The statement was cancelled by the statement timeout: "
+        + str(error).strip()
+    )
+
+
+def _on_sqlite_connect(dbapi_connection: Any, record: Any) -> None:
+    info = record.info
+
+    def interrupt() -> bool:
+        deadline = info.get(_DEADLINE_KEY)
+        return deadline is not None and time.monotonic() >= deadline
+
+    dbapi_connection.set_progress_handler(interrupt, _SQLITE_PROGRESS_STEPS)
+
+
+def _on_sqlite_checkin(dbapi_connection: Any, record: Any) -> None:
+    # The timeout of SQLite is not kept by the database, so the next
+    # transaction on the connection starts without a timeout
+    record.info.pop(_APPLIED_KEY, None)
+    record.info.pop(_DEADLINE_KEY, None)
+
+
+def _on_sqlite_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    # The deadline also covers fetching the rows of the statement
+    milliseconds = conn.info.get(_APPLIED_KEY)
+    conn.info[_DEADLINE_KEY] = (
+        time.monotonic() + milliseconds / 1000 if milliseconds else None
+    )
@@ -1,6 +1,16 @@
 from alpha.infra.models.filter_operators import And, Or
+from alpha.infra.models.cached_response import CachedResponse
 from alpha.infra.models.json_patch import JsonPatch
 from alpha.infra.models.order_by import OrderBy, Order
+from alpha.infra.models.load_option import LoadOption, LoadStrategy
+from alpha.infra.models.pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    PagePagination,
+    Pagination,
+)
+from alpha.infra.models.retry_policy import RetryPolicy
 from alpha.infra.models.search_filter import SearchFilter, Operator
 
 __all__ = [
@@ -9,6 +19,15 @@ __all__ = [
     "JsonPatch",
     "OrderBy",
     "Order",
+    "LoadOption",
+    "LoadStrategy",
+    "Pagination",
+    "PagePagination",
+    "OffsetPagination",
+    "CursorPagination",
+    "LinkHeaderPagination",
+    "RetryPolicy",
+    "CachedResponse",
     "SearchFilter",
     "Operator",
 ]
@@ -0,0 +1,132 @@
+"""Contains the CachedResponse class, a response of a REST API in the response
+cache of the REST API repositories."""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from alpha.interfaces.http_client import HTTPResponse
+
+
+@dataclass
+class CachedResponse:
+    """The data of a cached response of a REST API, together with the
+    validators to revalidate it and the time until which it is fresh.
+
+    Instances of this class are stored in the response cache of the REST API
+    repositories. A fresh response is returned without sending a request.
+    A stale response is revalidated by a conditional request with the
+    `If-None-Match` and `If-Modified-Since` headers, and returned again when
+    the API responds with `304 Not Modified`.
+
+    Attributes
+    ----------
+    data
+        The data of the response, as returned by the repository. The data is
+        decoded once and shared by all lookups, so it should not be modified.
+    etag
+        The value of the `ETag` header of the response, by default None
+    last_modified
+        The value of the `Last-Modified` header of the response, by default
+        None
+    expires
+        The time since the epoch in seconds until which the response is
+        fresh, by default 0.0
+    """
+
+    data: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    expires: float = 0.0
+
+    @classmethod
+    def from_response(
+        cls,
+        response: HTTPResponse,
+        data: Any,
+        cached: "CachedResponse | None" = None,
+    ) -> "CachedResponse | None":
+        """Create a cached response from a response, by reading its
+        `Cache-Control`, `ETag`, `Last-Modified` and `Vary` headers.
+
+        Responses with the `no-store` or `private` directive are not stored,
+        because the response caches of the repositories can be shared by
+        users and processes, and neither are responses which vary on all
+        request headers with `Vary: *`. Other `Vary` headers are honoured by
+        the repositories, which cache a response per set of request headers.
+
+        Parameters
+        ----------
+        response
+            The response of a GET request, or the `304 Not Modified` response
+            of a conditional GET request.
+        data
+            The data of the response, as returned by the repository.
+        cached
+            The cached response which was revalidated, by default None. Its
+            validators are kept when the response does not contain new
+            validators.
+
+        Returns
+        -------
+        CachedResponse | None
+            The cached response, or None when the response may not be stored
+            or can neither be fresh nor revalidated.
+        """
+        directives = _cache_control(_header(response, "Cache-Control"))
+        if "no-store" in directives or "private" in directives:
+            return None
+        vary = _header(response, "Vary") or ""
+        if "*" in (name.strip() for name in vary.split(",")):
+            return None
+
+        max_age = 0
+        if "no-cache" not in directives:
+            try:
+                max_age = max(0, int(directives.get("max-age") or 0))
+            except ValueError:
+                max_age = 0
+        etag = _header(response, "ETag") or (cached.etag if cached else None)
+        last_modified = _header(response, "Last-Modified") or (
+            cached.last_modified if cached else None
+        )
+        if not max_age and not etag and not last_modified:
+            return None
+
+        return cls(
+            data=data,
+            etag=etag,
+            last_modified=last_modified,
+            expires=time.time() + max_age,
+        )
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the response can be used without revalidation."""
+        return time.time() < self.expires
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """The headers of a conditional request which revalidates the
+        response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _header(response: HTTPResponse, name: str) -> str | None:
+    """Get a header of a response, also from a case-sensitive mapping."""
+    return response.headers.get(name) or response.headers.get(name.lower())
+
+
+def _cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse the directives of a `Cache-Control` header."""
+    directives: dict[str, str | None] = {}
+    for directive in (value or "").split(","):
+        name, _, argument = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from enum import Enum, auto
+from typing import Any, Literal
+
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.query import Query
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+from alpha.domain.models.base_model import BaseDomainModel
+from alpha.infra.models.query_clause import QueryClause
+
+WILDCARD: Literal["*"] = "*"
+"""The field of a `LoadOption` which applies to all relationships of the
+domain model that have no other load option."""
+
+
+class LoadStrategy(Enum):
+    """An enumeration of the strategies to load a relationship. This object
+    can be used for the `strategy` attribute of the `LoadOption` class.
+
+    Attributes
+    ----------
+    SELECTIN
+        Load the related objects of all selected objects with one additional
+        SELECT ... WHERE ... IN statement per relationship. Suited for
+        collections.
+    JOINED
+        Load the related objects in the same statement by using a LEFT OUTER
+        JOIN. Suited for many-to-one relationships.
+    RAISE
+        Raise an exception when the relationship is accessed before it is
+        loaded, instead of lazy loading it.
+    """
+
+    SELECTIN = auto()
+    JOINED = auto()
+    RAISE = auto()
+
+
+@dataclass
+class LoadOption(QueryClause):
+    """A class representing the loading strategy of a relationship for
+    SQLAlchemy queries. This class extends the `QueryClause` class and adds
+    a `strategy` attribute to specify how the relationship is loaded, and
+    `children` to specify how the relationships of the related objects are
+    loaded. The `field` attribute can be either a string representing the
+    name of the relationship, an `InstrumentedAttribute` from SQLAlchemy, or
+    "*" for all relationships which have no other load option.
+
+    Instances of this class are passed in a list to the `load` parameter of
+    the methods of a `SqlRepository` subclass, so the relationships of the
+    retrieved domain models are loaded eagerly instead of one lazy load per
+    object and relationship.
+
+    Example:
+    ```python
+    users = uow.users.select(
+        load=[
+            LoadOption(
+                field=User.groups,
+                children=[LoadOption(field="permissions")],
+            ),
+            LoadOption(field="*", strategy=LoadStrategy.RAISE),
+        ]
+    )
+    ```
+
+    Attributes
+    ----------
+    field
+        Can be a string representing the name of the relationship, "*" or an
+        `InstrumentedAttribute` from SQLAlchemy.
+    strategy
+        An instance of the `LoadStrategy` enumeration specifying how the
+        relationship is loaded, by default `LoadStrategy.SELECTIN`.
+    children
+        Load options for the relationships of the related domain model, by
+        default an empty list.
+    """
+
+    field: str | InstrumentedAttribute[Any] = ""
+    strategy: LoadStrategy = LoadStrategy.SELECTIN
+    children: list["LoadOption"] = dataclass_field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Post-initialization method to set up the load option. This method
+        calls the parent class's post-initialization method and then
+        determines the appropriate subclass based on the strategy attribute.
+        """
+        super().__post_init__()
+        self.__class__ = self._get_load_class()  # type: ignore
+
+    def set_domain_model(self, model: BaseDomainModel | None = None) -> None:
+        """Set the domain model for the load option. The wildcard field is
+        not resolved to an instrumented attribute.
+
+        Parameters
+        ----------
+        model
+            The domain model to use for resolving the field name, by default
+            None
+        """
+        if self.field == WILDCARD:
+            self._domain_model = model
+            return
+        super().set_domain_model(model)
+
+    @property
+    def loader_option(self) -> _AbstractLoad:
+        """Returns the SQLAlchemy loader option of the relationship,
+        including the loader options of the children.
+
+        Returns
+        -------
+        _AbstractLoad
+            The loader option
+        """
+        if self.field == WILDCARD:
+            return self._loader(WILDCARD)
+        if not self._instrumented_attr:
+            self._raise_instrumented_attr_exception()
+
+        option = self._loader(self._instrumented_attr)
+        if self.children:
+            related_model = self._instrumented_attr.property.mapper.class_
+            for child in self.children:
+                if not child._domain_model:
+                    child.set_domain_model(related_model)
+            option = option.options(
+                *[child.loader_option for child in self.children]
+            )
+        return option
+
+    def query_clause(self, query: Query[Any]) -> Query[Any]:
+        """Apply the load option to the given SQLAlchemy query.
+
+        Parameters
+        ----------
+        query
+            The SQLAlchemy query to apply the load option to.
+
+        Returns
+        -------
+        Query
+            The modified SQLAlchemy query with the load option applied.
+        """
+        return query.options(self.loader_option)
+
+    def _loader(self, attr: Any) -> _AbstractLoad:
+        """Create the loader option of the strategy for an attribute."""
+        raise NotImplementedError
+
+    def _get_load_class(self) -> type["LoadOption"]:
+        """Determine the appropriate subclass based on the strategy
+        attribute."""
+        match self.strategy:
+            case LoadStrategy.SELECTIN:
+                return SelectInLoad
+            case LoadStrategy.JOINED:
+                return JoinedLoad
+            case LoadStrategy.RAISE:
+                return RaiseLoad
+            case _:
+                return LoadOption
+
+
+class SelectInLoad(LoadOption):
+    """A class representing a relationship which is loaded with an
+    additional SELECT ... IN statement."""
+
+    def _loader(self, attr: Any) -> _AbstractLoad:
+        return selectinload(attr)
+
+
+class JoinedLoad(LoadOption):
+    """A class representing a relationship which is loaded with a LEFT OUTER
+    JOIN in the same statement."""
+
+    def _loader(self, attr: Any) -> _AbstractLoad:
+        return joinedload(attr)
+
+
+class RaiseLoad(LoadOption):
+    """A class representing a relationship which raises an exception when
+    it is accessed before it is loaded. Related objects which are already
+    in the session are still returned."""
+
+    def _loader(self, attr: Any) -> _AbstractLoad:
+        return raiseload(attr, sql_only=True)
@@ -0,0 +1,272 @@
+"""Contains the Pagination classes, the strategies by which the REST API
+repositories request the pages of a collection."""
+
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from requests.utils import parse_header_links
+
+from alpha.interfaces.http_client import HTTPResponse
+
+
+class Pagination:
+    """Base class of the pagination strategies of the `iter_all` method of
+    the REST API repositories.
+
+    A pagination strategy determines the URL of the first page and derives
+    the URL of the next page from the URL, the response and the items of
+    the current page. The strategies keep no state between pages, so one
+    instance can be shared by many iterations and repositories.
+    """
+
+    def first_url(self, url: str) -> str:
+        """Return the URL of the first page.
+
+        Parameters
+        ----------
+        url
+            The URL of the collection, including the query parameters of the
+            request.
+
+        Returns
+        -------
+            The URL of the first page.
+        """
+        return url
+
+    def next_url(
+        self,
+        url: str,
+        response: HTTPResponse,
+        body: Any,
+        items: list[Any],
+    ) -> str | None:
+        """Return the URL of the next page.
+
+        Parameters
+        ----------
+        url
+            The URL of the current page.
+        response
+            The response of the current page.
+        body
+            The decoded JSON body of the response of the current page.
+        items
+            The items of the current page.
+
+        Returns
+        -------
+            The URL of the next page, or None when the current page is the
+            last page.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _with_params(url: str, **params: Any) -> str:
+        """Set query parameters of an URL, replacing existing values."""
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        query.update({key: str(value) for key, value in params.items()})
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    @staticmethod
+    def _param(url: str, name: str) -> str | None:
+        """Get the value of a query parameter of an URL."""
+        return dict(parse_qsl(urlsplit(url).query)).get(name)
+
+
+class PagePagination(Pagination):
+    """Pagination by page number and page size query parameters, for
+    example `?page=2&size=100`. The iteration stops at the first page with
+    fewer items than the page size.
+
+    Example:
+    ```python
+    for user in uow.users.iter_all(pagination=PagePagination(size=500)):
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        page_param: str = "page",
+        size_param: str = "size",
+        size: int = 100,
+        first_page: int = 1,
+    ) -> None:
+        """Initialize the page pagination.
+
+        Parameters
+        ----------
+        page_param
+            The name of the query parameter of the page number, by default
+            "page"
+        size_param
+            The name of the query parameter of the page size, by default
+            "size"
+        size
+            The number of items per page, by default 100
+        first_page
+            The number of the first page, by default 1
+        """
+        self.page_param = page_param
+        self.size_param = size_param
+        self.size = size
+        self.first_page = first_page
+
+    def first_url(self, url: str) -> str:
+        return self._with_params(
+            url,
+            **{self.page_param: self.first_page, self.size_param: self.size},
+        )
+
+    def next_url(
+        self,
+        url: str,
+        response: HTTPResponse,
+        body: Any,
+        items: list[Any],
+    ) -> str | None:
+        if len(items) < self.size:
+            return None
+        page = int(self._param(url, self.page_param) or self.first_page)
+        return self._with_params(url, **{self.page_param: page + 1})
+
+
+class OffsetPagination(Pagination):
+    """Pagination by offset and limit query parameters, for example
+    `?offset=200&limit=100`. The iteration stops at the first page with
+    fewer items than the limit.
+    """
+
+    def __init__(
+        self,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        limit: int = 100,
+    ) -> None:
+        """Initialize the offset pagination.
+
+        Parameters
+        ----------
+        offset_param
+            The name of the query parameter of the offset, by default
+            "offset"
+        limit_param
+            The name of the query parameter of the limit, by default "limit"
+        limit
+            The number of items per page, by default 100
+        """
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.limit = limit
+
+    def first_url(self, url: str) -> str:
+        return self._with_params(
+            url, **{self.offset_param: 0, self.limit_param: self.limit}
+        )
+
+    def next_url(
+        self,
+        url: str,
+        response: HTTPResponse,
+        body: Any,
+        items: list[Any],
+    ) -> str | None:
+        if len(items) < self.limit:
+            return None
+        offset = int(self._param(url, self.offset_param) or 0)
+        return self._with_params(
+            url, **{self.offset_param: offset + len(items)}
+        )
+
+
+class CursorPagination(Pagination):
+    """Pagination by a cursor token which is returned in the response body
+    next to the items, for example `{"data": [...], "next_cursor": "abc"}`.
+    The token is sent in a query parameter to request the next page. The
+    iteration stops when the response contains no token.
+    """
+
+    def __init__(
+        self,
+        cursor_attribute: str = "next_cursor",
+        cursor_param: str = "cursor",
+        size_param: str | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Initialize the cursor pagination.
+
+        Parameters
+        ----------
+        cursor_attribute
+            The attribute of the response body which contains the token of
+            the next page. Nested attributes are separated by dots, for
+            example "meta.next", by default "next_cursor"
+        cursor_param
+            The name of the query parameter of the token, by default "cursor"
+        size_param
+            The name of the query parameter of the page size, by default
+            None which does not send a page size
+        size
+            The number of items per page, by default None
+        """
+        self.cursor_attribute = cursor_attribute
+        self.cursor_param = cursor_param
+        self.size_param = size_param
+        self.size = size
+
+    def first_url(self, url: str) -> str:
+        if self.size_param and self.size:
+            return self._with_params(url, **{self.size_param: self.size})
+        return url
+
+    def next_url(
+        self,
+        url: str,
+        response: HTTPResponse,
+        body: Any,
+        items: list[Any],
+    ) -> str | None:
+        cursor = body
+        for attribute in self.cursor_attribute.split("."):
+            if not isinstance(cursor, dict):
+                return None
+            cursor = cursor.get(attribute)
+        if not cursor or not items:
+            return None
+        return self._with_params(url, **{self.cursor_param: cursor})
+
+
+class LinkHeaderPagination(Pagination):
+    """Pagination by the `Link` header of RFC 5988, for example
+    `Link: <https://api.example.com/users?page=2>; rel="next"`. Relative
+    links are resolved against the URL of the current page. The iteration
+    stops when the response has no link of the relation.
+    """
+
+    def __init__(self, rel: str = "next") -> None:
+        """Initialize the Link header pagination.
+
+        Parameters
+        ----------
+        rel
+            The relation type of the link to the next page, by default
+            "next"
+        """
+        self.rel = rel
+
+    def next_url(
+        self,
+        url: str,
+        response: HTTPResponse,
+        body: Any,
+        items: list[Any],
+    ) -> str | None:
+        header = response.headers.get("link") or response.headers.get("Link")
+        if not header:
+            return None
+        for link in parse_header_links(header):
+            if self.rel in link.get("rel", "").split():
+                return urljoin(url, link["url"])
+        return None
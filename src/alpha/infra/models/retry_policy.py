@@ -0,0 +1,207 @@
+"""Contains the RetryPolicy class, which determines whether and when a failed
+request of a REST API repository is retried."""
+
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+import requests
+
+from alpha.interfaces.http_client import HTTPResponse
+
+IDEMPOTENT_METHODS: frozenset[str] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}
+)
+"""The HTTP methods which can be repeated without changing the result."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """A policy which determines whether a failed request of a REST API
+    repository is retried, and how long to wait before the retry.
+
+    A request is retried when the response has one of the `retry_statuses`,
+    or when sending the request raised one of the `retry_exceptions`, like a
+    connection error or a timeout. Only requests with an idempotent method
+    are retried, unless the request has an `idempotency_header`, so a
+    request which may already have been processed by the API is not
+    repeated.
+
+    The delay before a retry is drawn from the full jittered exponential
+    backoff, `uniform(0, min(max_backoff, backoff_factor * 2 ** attempt))`,
+    so the retries of many clients are spread out instead of arriving at the
+    API at the same time. A `Retry-After` header of the response takes
+    precedence over the backoff. A request is not retried when the API asks
+    to wait longer than `max_retry_after`.
+
+    Example:
+    ```python
+    users = RestApiRepository[User](
+        host="users.example.com",
+        retry_policy=RetryPolicy(max_retries=5, backoff_factor=0.2),
+    )
+    ```
+
+    Attributes
+    ----------
+    max_retries
+        The maximum number of retries of a request, by default 3
+    backoff_factor
+        The base of the exponential backoff in seconds, by default 0.1
+    max_backoff
+        The maximum delay in seconds of the exponential backoff, by default
+        10.0
+    max_retry_after
+        The maximum delay in seconds requested by a `Retry-After` header
+        which is honoured, by default 60.0
+    retry_statuses
+        The status codes of the responses which are retried, by default 429,
+        502, 503 and 504
+    retry_exceptions
+        The exceptions of the HTTP client which are retried, by default the
+        connection errors and timeouts of `requests` and the transport errors
+        of `httpx`
+    idempotency_header
+        The name of the request header which makes a request with a
+        non-idempotent method, like POST or PATCH, safe to retry, by default
+        "Idempotency-Key"
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.1
+    max_backoff: float = 10.0
+    max_retry_after: float = 60.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    retry_exceptions: tuple[type[BaseException], ...] = (
+        requests.ConnectionError,
+        requests.Timeout,
+        httpx.TransportError,
+    )
+    idempotency_header: str = "Idempotency-Key"
+
+    def is_retryable(
+        self, method: str, headers: Mapping[str, Any] | None = None
+    ) -> bool:
+        """Check whether a request can be retried without the risk of
+        processing it twice.
+
+        Parameters
+        ----------
+        method
+            The HTTP method of the request
+        headers
+            The headers of the request, by default None
+
+        Returns
+        -------
+        bool
+            True if the method is idempotent or the request has an
+            idempotency header
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        header = self.idempotency_header.lower()
+        return any(key.lower() == header for key in headers or {})
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        headers: Mapping[str, Any] | None = None,
+        response: HTTPResponse | None = None,
+        exception: BaseException | None = None,
+    ) -> float | None:
+        """Get the delay before the retry of a failed request.
+
+        Parameters
+        ----------
+        method
+            The HTTP method of the request
+        attempt
+            The number of retries of the request so far
+        headers
+            The headers of the request, by default None
+        response
+            The response of the request, by default None
+        exception
+            The exception which was raised by sending the request, by default
+            None
+
+        Returns
+        -------
+        float | None
+            The delay in seconds, or None when the request is not retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        if exception is not None:
+            if not isinstance(exception, self.retry_exceptions):
+                return None
+        elif response is None or (
+            response.status_code not in self.retry_statuses
+        ):
+            return None
+        if not self.is_retryable(method, headers):
+            return None
+
+        # The truth value of a `requests` response is False for errors
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                return retry_after
+        return self.backoff(attempt)
+
+    def backoff(self, attempt: int) -> float:
+        """Draw the jittered exponential backoff of a retry.
+
+        Parameters
+        ----------
+        attempt
+            The number of retries of the request so far
+
+        Returns
+        -------
+        float
+            The delay in seconds
+        """
+        ceiling = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(response: HTTPResponse) -> float | None:
+        """Read the `Retry-After` header of a response, which is either a
+        number of seconds or an HTTP date.
+
+        Parameters
+        ----------
+        response
+            The response of the request
+
+        Returns
+        -------
+        float | None
+            The requested delay in seconds, or None when the response has no
+            valid `Retry-After` header
+        """
+        value = response.headers.get("Retry-After") or response.headers.get(
+            "retry-after"
+        )
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=UTC)
+        return max(0.0, (date - datetime.now(UTC)).total_seconds())
@@ -4,7 +4,11 @@ from typing import Any
 
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.query import Query
-from sqlalchemy.sql.expression import BinaryExpression, ColumnOperators
+from sqlalchemy.sql.expression import (
+    BinaryExpression,
+    BindParameter,
+    ColumnOperators,
+)
 
 from alpha.infra.models.query_clause import QueryClause
 
@@ -211,7 +215,7 @@ class SearchFilter(QueryClause):
                 return InsensitiveNotContainsFilter
 
     def _parse_list(self, obj: str | list[str] | Any) -> list[str]:
-        if isinstance(obj, list):
+        if isinstance(obj, list | BindParameter):
             return obj  # type: ignore
         if isinstance(obj, str):
             return obj.split(",")
@@ -7,16 +7,24 @@ from alpha.interfaces.updatable import Updatable
 from alpha.interfaces.patchable import Patchable
 
 # import all http client related interfaces
-from alpha.interfaces.http_client import HTTPClient, HTTPResponse
+from alpha.interfaces.http_client import (
+    AsyncHTTPClient,
+    HTTPClient,
+    HTTPResponse,
+)
 
 # import all repository related interfaces
 from alpha.interfaces.api_repository import ApiRepository
 from alpha.interfaces.sql_repository import SqlRepository
 from alpha.interfaces.refresh_repository import RefreshRepository
 
+# import all cache related interfaces
+from alpha.interfaces.cache import CacheBackend
+
 # import all database related interfaces
 from alpha.interfaces.sql_mapper import SqlMapper
 from alpha.interfaces.sql_database import SqlDatabase
+from alpha.interfaces.async_sql_database import AsyncSqlDatabase
 from alpha.interfaces.unit_of_work import UnitOfWork
 
 # import all authentication and authorization related interfaces
@@ -39,11 +47,14 @@ __all__ = [
     "Patchable",
     "HTTPClient",
     "HTTPResponse",
+    "AsyncHTTPClient",
     "ApiRepository",
     "SqlRepository",
     "RefreshRepository",
+    "CacheBackend",
     "SqlMapper",
     "SqlDatabase",
+    "AsyncSqlDatabase",
     "UnitOfWork",
     "IdentityProvider",
     "PasswordAuthenticator",
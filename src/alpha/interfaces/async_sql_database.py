@@ -0,0 +1,32 @@
+from typing import ClassVar, Protocol, runtime_checkable
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from alpha.interfaces.sql_mapper import SqlMapper
+
+
+@runtime_checkable
+class AsyncSqlDatabase(Protocol):
+    _host: ClassVar[str]
+    _port: ClassVar[int]
+    _username: ClassVar[str]
+    _password: ClassVar[str]
+    _db_name: ClassVar[str]
+    _db_type: ClassVar[str]
+    _schema_name: ClassVar[str]
+    _mapper: ClassVar[SqlMapper | None]
+    _connection_string: ClassVar[str]
+    _engine: ClassVar[AsyncEngine]
+
+    def get_session(self) -> AsyncSession: ...
+
+    def engine(self) -> AsyncEngine: ...
+
+    async def create_tables(
+        self, metadata: sa.MetaData, tables: list[sa.Table] | None = None
+    ) -> None: ...
+
+    async def drop_tables(
+        self, metadata: sa.MetaData, tables: list[sa.Table] | None = None
+    ) -> None: ...
@@ -0,0 +1,54 @@
+"""Contains the CacheBackend protocol, which defines the interface for the
+key-value stores used by caches."""
+
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Interface for key-value stores which can be used as a cache."""
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+
+        Returns
+        -------
+        Any | None
+            The cached value, or None when the key is not cached or the value
+            has expired
+        """
+        ...
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value in the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the value
+        value
+            The value to store
+        ttl
+            The number of seconds after which the value expires, by default
+            None which results in using the default of the backend
+        """
+        ...
+
+    def delete(self, *keys: str) -> None:
+        """Remove values from the cache.
+
+        Parameters
+        ----------
+        keys
+            The keys of the values to remove
+        """
+        ...
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        ...
@@ -59,3 +59,36 @@ class HTTPClient(Protocol):
     def patch(
         self, url: str, json: Any = None, **kwargs: Any
     ) -> HTTPResponse: ...
+
+
+@runtime_checkable
+class AsyncHTTPClient(Protocol):
+    """Interface for asyncio HTTP clients like `httpx.AsyncClient` or a
+    custom implementation.
+
+    This interface is the asyncio counterpart of `HTTPClient`. It defines
+    the same methods, which are coroutines that return an `HTTPResponse`,
+    and `aclose` instead of `close`. It is used by the asyncio REST API
+    repository, so many requests can be sent concurrently from one event
+    loop.
+    """
+
+    cookies: MutableMapping[str, str]
+    headers: MutableMapping[str, str]
+
+    async def request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> HTTPResponse: ...
+    async def aclose(self) -> None: ...
+
+    async def post(
+        self, url: str, json: Any = None, **kwargs: Any
+    ) -> HTTPResponse: ...
+    async def get(self, url: str, **kwargs: Any) -> HTTPResponse: ...
+    async def delete(self, url: str, **kwargs: Any) -> HTTPResponse: ...
+    async def put(
+        self, url: str, json: Any = None, **kwargs: Any
+    ) -> HTTPResponse: ...
+    async def patch(
+        self, url: str, json: Any = None, **kwargs: Any
+    ) -> HTTPResponse: ...
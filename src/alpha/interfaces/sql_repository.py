@@ -2,6 +2,7 @@
 SQLAlchemy ORM repository operations.
 """
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
@@ -18,6 +19,7 @@ from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 from alpha.domain.models.base_model import BaseDomainModel, DomainModel
 from alpha.infra.models.json_patch import JsonPatch
+from alpha.infra.models.load_option import LoadOption
 from alpha.interfaces.patchable import Patchable
 
 if TYPE_CHECKING:
@@ -78,6 +80,7 @@ class SqlRepository(Protocol[DomainModel]):
         objs: list[DomainModel],
         return_obj: bool = False,
         raise_if_exists: bool = False,
+        chunk_size: int | None = None,
     ) -> list[DomainModel] | None:
         """Add multiple domain model instances to the database.
 
@@ -85,14 +88,20 @@ class SqlRepository(Protocol[DomainModel]):
         ----------
         objs
             The list of domain model instances to add to the database.
+        return_obj
+            Whether to return the added objects, by default False
         raise_if_exists
             Whether to raise an exception if any of the instances already exist, by default False
+        chunk_size
+            The number of instances to send to the database per batch, by
+            default None
         """
         ...
 
     def count(
         self,
         model: DomainModel | None = None,
+        estimate: bool = False,
         **kwargs: Any,
     ) -> int:
         """Count the number of domain model instances in the database.
@@ -101,6 +110,9 @@ class SqlRepository(Protocol[DomainModel]):
         ----------
         model
             The domain model class to count instances of, by default None
+        estimate
+            Whether to return an estimate from the statistics of the
+            database, by default False
 
         Returns
         -------
@@ -109,6 +121,25 @@ class SqlRepository(Protocol[DomainModel]):
         """
         ...
 
+    def exists(
+        self,
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> bool:
+        """Check whether any domain model instance exists in the database.
+
+        Parameters
+        ----------
+        model
+            The domain model class to check instances of, by default None
+
+        Returns
+        -------
+        bool
+            True when at least one instance matches the filters.
+        """
+        ...
+
     def get(
         self,
         attr: str | InstrumentedAttribute[Any],
@@ -258,6 +289,81 @@ class SqlRepository(Protocol[DomainModel]):
         """
         ...
 
+    def get_many(
+        self,
+        values: Iterable[Any],
+        attr: str | InstrumentedAttribute[Any] = "id",
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+        read_only: bool = False,
+        load: list[LoadOption] | None = None,
+    ) -> list[DomainModel | None]:
+        """Retrieve multiple domain model instances from the database based on
+        a list of values of a specified attribute.
+
+        Parameters
+        ----------
+        values
+            The values to filter by.
+        attr
+            The attribute to filter by, by default "id"
+        model
+            The domain model class to query, by default None
+        chunk_size
+            The maximum number of values per query, by default None
+        read_only
+            Whether the queries can be executed on a read replica, by default
+            False
+        load
+            The load options of the relationships of the instances, by
+            default None
+
+        Returns
+        -------
+        list[DomainModel | None]
+            The retrieved domain model instances in the order of the values,
+            with None for values which are not found.
+        """
+        ...
+
+    def ingest(
+        self,
+        data: Iterable[Any],
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+        on_conflict: Literal["ignore", "update"] | None = None,
+        conflict_keys: list[str] | None = None,
+        update_columns: list[str] | None = None,
+    ) -> int:
+        """Insert rows into the table of a domain model without creating
+        domain model instances.
+
+        Parameters
+        ----------
+        data
+            A pandas DataFrame, or an iterable of mappings or domain model
+            instances.
+        model
+            The domain model class of the table, by default None
+        chunk_size
+            The number of rows to send per batch, by default None
+        on_conflict
+            What to do with rows which conflict with existing rows, "ignore"
+            or "update", by default None
+        conflict_keys
+            The attributes of the unique constraint used to detect conflicts,
+            by default None
+        update_columns
+            The attributes to update when `on_conflict` is "update", by
+            default None
+
+        Returns
+        -------
+        int
+            The number of ingested rows.
+        """
+        ...
+
     def patch(self, obj: Patchable[Any], patches: JsonPatch) -> DomainModel:
         """Patch a domain model instance in the database using a JSON patch
         object.
@@ -289,15 +395,23 @@ class SqlRepository(Protocol[DomainModel]):
 
     def remove_all(
         self,
-        objs: list[DomainModel] | None,
+        objs: list[DomainModel] | None = None,
+        model: DomainModel | None = None,
         **kwargs: Any,
-    ) -> None:
+    ) -> int:
         """Remove multiple domain model instances from the database.
 
         Parameters
         ----------
         objs
             The list of domain model instances to remove, by default None
+        model
+            The domain model class to remove instances of, by default None
+
+        Returns
+        -------
+        int
+            The number of removed rows.
         """
         ...
 
@@ -305,6 +419,9 @@ class SqlRepository(Protocol[DomainModel]):
         self,
         model: DomainModel | None = None,
         cursor_result: str = "all",
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None = None,
+        defer: list[str | InstrumentedAttribute[Any]] | None = None,
         **kwargs: Any,
     ) -> list[DomainModel]:
         """Select domain model instances from the database based on optional
@@ -316,11 +433,71 @@ class SqlRepository(Protocol[DomainModel]):
             The domain model class to query, by default None
         cursor_result
             The type of result to return, by default "all"
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting domain model instances
+        load_only
+            The names or instrumented attributes of the only columns which
+            are loaded, by default None
+        defer
+            The names or instrumented attributes of the columns which are not
+            loaded, by default None
 
         Returns
         -------
         list[DomainModel]
-            The list of domain model instances that match the query.
+            The list of domain model instances that match the query, or
+            the rows of the selected columns.
+        """
+        ...
+
+    def select_frame(
+        self,
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        model: DomainModel | None = None,
+        as_arrow: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Select columns of a domain model as a pandas DataFrame or a
+        pyarrow Table, without creating domain model instances.
+
+        Parameters
+        ----------
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None
+        model
+            The domain model class to query, by default None
+        as_arrow
+            Whether to return a pyarrow Table, by default False
+
+        Returns
+        -------
+        pandas.DataFrame | pyarrow.Table
+            The selected columns.
+        """
+        ...
+
+    def select_iter(
+        self,
+        model: DomainModel | None = None,
+        batch_size: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[DomainModel]:
+        """Iterate over domain model instances from the database in batches
+        by using keyset (seek) pagination.
+
+        Parameters
+        ----------
+        model
+            The domain model class to query, by default None
+        batch_size
+            The number of rows to fetch per page, by default 1000
+
+        Yields
+        ------
+        DomainModel
+            The retrieved domain model instances.
         """
         ...
 
@@ -342,10 +519,68 @@ class SqlRepository(Protocol[DomainModel]):
         """
         ...
 
+    def update_where(
+        self,
+        values: dict[str | InstrumentedAttribute[Any], Any],
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Update all rows which match the filters with the same values.
+
+        Parameters
+        ----------
+        values
+            The attributes and their new values
+        model
+            The domain model class to update instances of, by default None
+
+        Returns
+        -------
+        int
+            The number of updated rows.
+        """
+        ...
+
+    def upsert(
+        self,
+        obj_or_objs: Any,
+        conflict_keys: list[str] | None = None,
+        update_columns: list[str] | None = None,
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Insert domain model instances, or update the existing rows when
+        they conflict with rows in the database.
+
+        Parameters
+        ----------
+        obj_or_objs
+            A domain model instance or mapping of attribute values, or an
+            iterable of them
+        conflict_keys
+            The attributes of the unique constraint used to detect conflicts,
+            by default None
+        update_columns
+            The attributes to update when a row conflicts, by default None
+        model
+            The domain model class of the table, by default None
+        chunk_size
+            The number of rows to send per statement, by default None
+
+        Returns
+        -------
+        int
+            The number of inserted or updated rows.
+        """
+        ...
+
     def view(
         self,
         model: DomainModel,
         cursor_result: str = "all",
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None = None,
+        defer: list[str | InstrumentedAttribute[Any]] | None = None,
         **kwargs: Any,
     ) -> list[DomainModel]:
         """View domain model instances from the database based on optional
@@ -358,10 +593,20 @@ class SqlRepository(Protocol[DomainModel]):
             The domain model class to query.
         cursor_result
             The type of result to return, by default "all"
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting domain model instances
+        load_only
+            The names or instrumented attributes of the only columns which
+            are loaded, by default None
+        defer
+            The names or instrumented attributes of the columns which are not
+            loaded, by default None
 
         Returns
         -------
         list[DomainModel]
-            The list of domain model instances that match the query.
+            The list of domain model instances that match the query, or
+            the rows of the selected columns.
         """
         ...
@@ -1,3 +1,9 @@
+from alpha.repositories.async_rest_api_repository import (
+    AsyncRestApiRepository,
+)
+from alpha.repositories.async_sql_alchemy_repository import (
+    AsyncSqlAlchemyRepository,
+)
 from alpha.repositories.models.repository_model import RepositoryModel
 from alpha.repositories.refresh.cache_repository import (
     CacheRefreshRepository,
@@ -18,6 +24,8 @@ __all__ = [
     "RepositoryModel",
     "RestApiRepository",
     "SqlAlchemyRepository",
+    "AsyncSqlAlchemyRepository",
+    "AsyncRestApiRepository",
     "CacheRefreshRepository",
     "DatabaseRefreshRepository",
     "FileRefreshRepository",
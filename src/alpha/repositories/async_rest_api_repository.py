@@ -0,0 +1,1094 @@
+"""This module contains the `AsyncRestApiRepository` class."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, Generic, cast
+from urllib.parse import urlsplit
+from uuid import UUID
+
+import httpx
+
+from alpha.domain.models.base_model import DomainModel
+from alpha.infra.connectors.circuit_breaker import CircuitBreaker
+from alpha.infra.models.json_patch import JsonPatch
+from alpha.infra.models.pagination import Pagination
+from alpha.infra.models.retry_policy import RetryPolicy
+from alpha.interfaces.cache import CacheBackend
+from alpha.interfaces.http_client import AsyncHTTPClient, HTTPResponse
+from alpha.repositories.rest_api_repository import REQUEST_EXCEPTIONS
+from alpha.repositories.rest_api_repository_mixin import (
+    RestApiRepositoryMixin,
+)
+
+
+class AsyncRestApiRepository(RestApiRepositoryMixin, Generic[DomainModel]):
+    """Asyncio implementation of a repository that interacts with a RESTful
+    API using the `httpx.AsyncClient`.
+
+    This repository provides the same methods as the `RestApiRepository` as
+    coroutines, so a service can send many requests to other APIs
+    concurrently from one event loop, for example by using
+    `asyncio.gather`. The URLs are built, the objects are serialized and the
+    responses are handled and mapped to domain models like by the
+    `RestApiRepository`, with which it shares the `RestApiRepositoryMixin`.
+    The response cache is read and written in a worker thread, so a
+    `FileCache` does not block the event loop.
+
+    Example:
+    ```python
+    async with httpx.AsyncClient() as client:
+        users = AsyncRestApiRepository[User](
+            host="users.example.com",
+            endpoint="users",
+            default_model=User,
+            client=client,
+        )
+        found = await asyncio.gather(
+            *[users.get(param=user_id) for user_id in user_ids]
+        )
+    ```
+
+    Generic
+    -------
+        The type of the domain model that this repository will manage.
+    """
+
+    client: AsyncHTTPClient
+
+    def __init__(
+        self,
+        host: str,
+        scheme: str | None = None,
+        base_path: str = "",
+        endpoint: str = "",
+        default_model: DomainModel | None = None,
+        use_factory: bool = True,
+        serialize: bool = True,
+        model_factory_method_name: str = "from_dict",
+        model_serialization_method_name: str = "to_dict",
+        client: AsyncHTTPClient | None = None,
+        session: AsyncHTTPClient | None = None,
+        request_headers: dict[str, str] | None = None,
+        request_cookies: dict[str, str] | None = None,
+        response_data_attribute: str | None = None,
+        pagination: Pagination | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: CacheBackend | None = None,
+    ) -> None:
+        """Initialize the asyncio REST API repository.
+
+        Parameters
+        ----------
+        host
+            The base URL of the API.
+        scheme
+            The URL scheme to use (e.g., "http" or "https"). This is only used
+            if the host does not already include a scheme, by default "https"
+        base_path
+            The base path of the API, by default ""
+        endpoint
+            The default endpoint for the API. This value is used when no
+            specific endpoint is provided in the method calls, by default ""
+        default_model
+            The default model to use for serialization/deserialization,
+            by default None
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data, by default True
+        serialize
+            Whether to serialize objects before sending them in requests,
+            by default True
+        model_factory_method_name
+            The name of the class method to use for creating models from
+            dictionaries, by default "from_dict"
+        model_serialization_method_name
+            The name of the method to use for serializing models to
+            dictionaries, by default "to_dict"
+        client
+            An asyncio HTTP client to use for the requests, by default None.
+            If None, a new `httpx.AsyncClient` will be created and used.
+        session
+            An asyncio HTTP client which is used when no `client` is given,
+            by default None. The `AsyncRestApiUnitOfWork` passes its client
+            through this parameter.
+        request_headers
+            Default headers to include in every request, by default None
+        request_cookies
+            Default cookies to include in every request, by default None
+        response_data_attribute
+            The attribute in the response data to extract the relevant data
+            from, by default None
+        pagination
+            The default pagination strategy of `iter_all`, by default None
+            which follows the `Link` headers of the responses
+        retry_policy
+            The policy of retrying failed requests, by default None which
+            does not retry requests
+        circuit_breaker
+            The circuit breaker which stops sending requests to a host while
+            it is unhealthy, by default None. A circuit breaker can be shared
+            by many synchronous and asyncio repositories.
+        response_cache
+            The cache of the responses of GET requests, for example a
+            `MemoryCache` or a `FileCache`, by default None which does not
+            cache responses. Responses are cached according to their
+            `Cache-Control`, `ETag` and `Last-Modified` headers.
+        """
+        client_obj = cast(
+            AsyncHTTPClient, client or session or httpx.AsyncClient()
+        )
+        super().__init__(
+            host=host,
+            client=client_obj,
+            scheme=scheme,
+            base_path=base_path,
+            endpoint=endpoint,
+            default_model=default_model,
+            use_factory=use_factory,
+            serialize=serialize,
+            model_factory_method_name=model_factory_method_name,
+            model_serialization_method_name=model_serialization_method_name,
+            request_headers=request_headers,
+            request_cookies=request_cookies,
+            response_data_attribute=response_data_attribute,
+            pagination=pagination,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> Any | None:
+        """Make a custom API request.
+
+        Parameters
+        ----------
+        method
+            The HTTP method to use for the request (e.g., "GET", "POST", "PUT",
+            "DELETE", etc.).
+        url
+            The URL to which the request should be sent. This has to be a fully
+            constructed URL.
+        **kwargs
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+
+        Returns
+        -------
+            The data retrieved from the API response.
+        """
+        response = await self._send(
+            method.upper(),
+            url,
+            lambda **params: self.client.request(
+                method=method.upper(), **params
+            ),
+            **kwargs,
+        )
+
+        return self._handle_response(response)
+
+    async def add(
+        self,
+        obj: DomainModel,
+        return_obj: bool = True,
+        serialize: bool | None = None,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> DomainModel | dict[str, Any] | None:
+        """Add a new resource.
+
+        Parameters
+        ----------
+        obj
+            The object to add.
+        return_obj
+            Whether to return the added object or not.
+        serialize
+            Whether to serialize the object before sending it in the API
+            request.
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint to which the object should be added.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API request.
+
+        Returns
+        -------
+            The added object if `return_obj` is `True`, otherwise `None`.
+        """
+        if self._determine_serialization(serialize):
+            obj = self._serialize_object(obj)
+
+        url = self._build_url(
+            endpoint,
+            parent_endpoint=parent_endpoint,
+            parent_param=parent_param,
+            **params,
+        )
+
+        response_data = await self._post(
+            url=url,
+            data=obj,
+            additional_request_params=additional_request_params,
+        )
+
+        if return_obj is False:
+            return None
+
+        if not self._determine_use_factory(use_factory):
+            return response_data
+
+        return self._map_response_object(response_data, model)
+
+    async def add_all(
+        self,
+        objs: list[DomainModel],
+        return_objs: bool = True,
+        serialize: bool | None = None,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        one_by_one: bool = False,
+        **params: Any,
+    ) -> list[DomainModel] | list[dict[str, Any]] | None:
+        """Add multiple new resources.
+
+        Parameters
+        ----------
+        objs
+            The objects to add.
+        return_objs
+            Whether to return the added objects or not.
+        serialize
+            Whether to serialize the objects before sending it in the API
+            request.
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint to which the objects should be added.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+        one_by_one
+            Whether to add the objects one by one. The requests of the
+            objects are sent concurrently and the results are returned in
+            the order of the objects.
+        **params
+            Additional query parameters to include in the API request.
+
+        Returns
+        -------
+            A list of added objects if `return_objs` is `True`, otherwise
+            `None`.
+        """
+        if one_by_one:
+            results = await asyncio.gather(
+                *[
+                    self.add(
+                        obj=obj,
+                        return_obj=return_objs,
+                        serialize=serialize,
+                        use_factory=use_factory,
+                        endpoint=endpoint,
+                        parent_endpoint=parent_endpoint,
+                        parent_param=parent_param,
+                        model=model,
+                        additional_request_params=additional_request_params,
+                        **params,
+                    )
+                    for obj in objs
+                ]
+            )
+            return list(results) if return_objs else None  # type: ignore
+
+        if self._determine_serialization(serialize):
+            objs = [self._serialize_object(obj) for obj in objs]
+
+        url = self._build_url(
+            endpoint,
+            parent_endpoint=parent_endpoint,
+            parent_param=parent_param,
+            **params,
+        )
+
+        response_data = await self._post(
+            url=url,
+            data=objs,
+            additional_request_params=additional_request_params,
+        )
+
+        if return_objs is False:
+            return None
+
+        if not self._determine_use_factory(use_factory):
+            return response_data
+
+        return self._map_response_array(response_data, model)
+
+    async def get(
+        self,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> DomainModel | dict[str, Any]:
+        """Retrieve a single resource.
+
+        Parameters
+        ----------
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint from which the object should be retrieved.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        param
+            The parameter to identify the specific resource. The parameter
+            will be appended to the endpoint to form the full URL for the GET
+            request.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API request.
+
+        Returns
+        -------
+            The retrieved object.
+        """
+        url = self._build_url(
+            endpoint,
+            parent_endpoint=parent_endpoint,
+            parent_param=parent_param,
+            param=param,
+            **params,
+        )
+
+        response_data: dict[str, Any] = await self._get(
+            url=url,
+            additional_request_params=additional_request_params,
+        )
+
+        if not self._determine_use_factory(use_factory):
+            return response_data
+
+        return self._map_response_object(response_data, model)
+
+    async def get_all(
+        self,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> list[DomainModel] | list[dict[str, Any]]:
+        """Retrieve multiple resources.
+
+        Parameters
+        ----------
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint from which the objects should be retrieved.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        param
+            The parameter which is appended to the endpoint to form the full
+            URL for the GET request.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API request.
+
+        Returns
+        -------
+            The retrieved objects.
+        """
+        url = self._build_url(
+            endpoint,
+            parent_endpoint=parent_endpoint,
+            parent_param=parent_param,
+            param=param,
+            **params,
+        )
+
+        response_data: list[dict[str, Any]] = await self._get(
+            url=url,
+            additional_request_params=additional_request_params,
+        )
+
+        if not self._determine_use_factory(use_factory):
+            return response_data
+
+        return self._map_response_array(response_data, model)
+
+    async def get_many(
+        self,
+        params: Iterable[str | int | UUID],
+        max_concurrency: int = 10,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **query_params: Any,
+    ) -> list[DomainModel | dict[str, Any] | Exception]:
+        """Retrieve multiple resources by sending a GET request per resource.
+
+        The requests are sent concurrently from the event loop, at most
+        `max_concurrency` at the same time. A request which fails with an
+        error response or a connection error does not fail the other
+        requests. Its exception is returned in place of the resource
+        instead. Other exceptions, like errors in the model factory method,
+        are raised.
+
+        Parameters
+        ----------
+        params
+            The parameters which identify the resources. Each parameter is
+            appended to the endpoint to form the URL of a GET request.
+        max_concurrency
+            The maximum number of requests which are sent at the same time,
+            by default 10
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint from which the objects should be retrieved.
+        parent_endpoint
+            The parent API endpoint, if the resources are nested under a
+            parent resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API requests, like headers or timeouts.
+        **query_params
+            Additional query parameters to include in the API requests.
+
+        Returns
+        -------
+            The retrieved objects, or the exceptions of the requests which
+            failed, in the order of the parameters. The exceptions are one of
+            the `REQUEST_EXCEPTIONS` of the `rest_api_repository` module.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is lower than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                "The max_concurrency has to be a positive integer"
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get(param: str | int | UUID) -> Any:
+            async with semaphore:
+                try:
+                    return await self.get(
+                        use_factory=use_factory,
+                        endpoint=endpoint,
+                        parent_endpoint=parent_endpoint,
+                        parent_param=parent_param,
+                        param=param,
+                        model=model,
+                        additional_request_params=additional_request_params,
+                        **query_params,
+                    )
+                except REQUEST_EXCEPTIONS as exc:
+                    return exc
+
+        return list(await asyncio.gather(*[get(param) for param in params]))
+
+    async def iter_all(
+        self,
+        pagination: Pagination | None = None,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> AsyncIterator[DomainModel | dict[str, Any]]:
+        """Iterate over all resources of a paginated collection.
+
+        The pages are requested one after another by following the
+        pagination strategy, and the items are yielded one at a time. The
+        next page is requested in a task while the items of the current page
+        are consumed, so at most two pages are held in memory.
+
+        Example:
+        ```python
+        async for user in users.iter_all(pagination=PagePagination()):
+            ...
+        ```
+
+        Parameters
+        ----------
+        pagination
+            The pagination strategy, by default None which uses the
+            pagination strategy of the repository.
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint from which the objects should be retrieved.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        param
+            The parameter to append to the endpoint, if applicable.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API requests, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API requests.
+
+        Yields
+        ------
+            The retrieved objects.
+        """
+        pagination = pagination or self._pagination
+        factory = self._determine_use_factory(use_factory)
+        url: str | None = pagination.first_url(
+            self._build_url(
+                endpoint,
+                parent_endpoint=parent_endpoint,
+                parent_param=parent_param,
+                param=param,
+                **params,
+            )
+        )
+
+        page: asyncio.Task[Any] | None = asyncio.create_task(
+            self._get_page(cast(str, url), additional_request_params)
+        )
+        try:
+            while page is not None:
+                response, body, items = await page
+                url = pagination.next_url(
+                    cast(str, url), response, body, items
+                )
+                page = None
+                if url:
+                    page = asyncio.create_task(
+                        self._get_page(url, additional_request_params)
+                    )
+                for item in items:
+                    if factory:
+                        item = self._map_response_object(item, model)
+                    yield item
+        finally:
+            if page is not None:
+                page.cancel()
+
+    async def patch(
+        self,
+        patch: JsonPatch,
+        return_obj: bool = True,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> DomainModel | dict[str, Any] | None:
+        """Update a resource with a JSON Patch.
+
+        Parameters
+        ----------
+        patch
+            The JSON Patch object containing the changes to be applied to the
+            resource.
+        return_obj
+            Whether to return the updated object or not.
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint to which the patch should be applied.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        param
+            The parameter to identify the specific resource. The parameter
+            will be appended to the endpoint to form the full URL for the
+            PATCH request.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API request.
+
+        Returns
+        -------
+            The updated object if `return_obj` is `True`, otherwise `None`.
+        """
+        url = self._build_url(
+            endpoint,
+            parent_endpoint=parent_endpoint,
+            parent_param=parent_param,
+            param=param,
+            **params,
+        )
+
+        response_data: dict[str, Any] = await self._patch(
+            url=url,
+            data=patch.patch,
+            additional_request_params=additional_request_params,
+        )
+
+        if return_obj is False:
+            return None
+
+        if not self._determine_use_factory(use_factory):
+            return response_data
+
+        return self._map_response_object(response_data, model)
+
+    async def remove(
+        self,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        param: str | int | UUID | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> None:
+        """Remove a resource.
+
+        Parameters
+        ----------
+        endpoint
+            The API endpoint from which the object should be removed.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        param
+            The parameter to identify the specific resource. The parameter
+            will be appended to the endpoint to form the full URL for the
+            DELETE request.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API request.
+        """
+        url = self._build_url(
+            endpoint,
+            parent_endpoint=parent_endpoint,
+            parent_param=parent_param,
+            param=param,
+            **params,
+        )
+
+        await self._delete(
+            url=url,
+            additional_request_params=additional_request_params,
+        )
+
+    async def update(
+        self,
+        obj: DomainModel,
+        return_obj: bool = True,
+        serialize: bool | None = None,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> DomainModel | dict[str, Any] | None:
+        """Update a resource.
+
+        Parameters
+        ----------
+        obj
+            The object to update.
+        return_obj
+            Whether to return the updated object or not.
+        serialize
+            Whether to serialize the object before sending it in the API
+            request.
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint to which the object should be updated.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        param
+            The parameter to identify the specific resource. The parameter
+            will be appended to the endpoint to form the full URL for the PUT
+            request.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API request.
+
+        Returns
+        -------
+            The updated object if `return_obj` is `True`, otherwise `None`.
+        """
+        if self._determine_serialization(serialize):
+            obj = self._serialize_object(obj)
+
+        url = self._build_url(
+            endpoint,
+            parent_endpoint=parent_endpoint,
+            parent_param=parent_param,
+            param=param,
+            **params,
+        )
+
+        response_data: dict[str, Any] = await self._put(
+            url=url,
+            data=obj,
+            additional_request_params=additional_request_params,
+        )
+
+        if return_obj is False:
+            return None
+
+        if not self._determine_use_factory(use_factory):
+            return response_data
+
+        return self._map_response_object(response_data, model)
+
+    async def _get(
+        self,
+        url: str,
+        additional_request_params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Call the GET method of the API.
+
+        Parameters
+        ----------
+        url
+            A fully constructed URL to which the GET request should be sent.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request.
+
+        When the repository has a response cache, a fresh cached response
+        is returned without sending a request, and a stale cached response
+        is revalidated with a conditional request.
+
+        Returns
+        -------
+            The data retrieved from the API response.
+        """
+        key, cached = None, None
+        if self._response_cache is not None:
+            key = await asyncio.to_thread(
+                self._response_cache_key, url, additional_request_params
+            )
+            cached = await asyncio.to_thread(self._cached_response, key)
+        if cached is not None and cached.fresh:
+            return cached.data
+
+        response = await self._send(
+            "GET",
+            url,
+            self.client.get,
+            **self._conditional_request_params(
+                cached, additional_request_params
+            ),
+        )
+
+        data = self._handle_response(response, cached)
+        if key is not None:
+            await asyncio.to_thread(
+                self._cache_response, key, response, data, cached
+            )
+        return data
+
+    async def _get_page(
+        self,
+        url: str,
+        additional_request_params: dict[str, Any] | None = None,
+    ) -> tuple[Any, Any, list[Any]]:
+        """Call the GET method of the API for a page of a collection.
+
+        Parameters
+        ----------
+        url
+            A fully constructed URL of the page.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request.
+
+        Returns
+        -------
+            The response, the decoded JSON body of the response, and the items
+            of the page.
+        """
+        response = await self._send(
+            "GET",
+            url,
+            self.client.get,
+            **(additional_request_params or {}),
+        )
+        return self._read_page(response)
+
+    async def _post(
+        self,
+        url: str,
+        data: Any,
+        additional_request_params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Call the POST method of the API.
+
+        Parameters
+        ----------
+        url
+            A fully constructed URL to which the POST request should be sent.
+        data
+            The data to be sent as JSON in the body of the POST request.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request.
+
+        Returns
+        -------
+            The data retrieved from the API response.
+        """
+        response = await self._send(
+            "POST",
+            url,
+            self.client.post,
+            json=data,
+            **(additional_request_params or {}),
+        )
+
+        return self._handle_response(response)
+
+    async def _patch(
+        self,
+        url: str,
+        data: Any,
+        additional_request_params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Call the PATCH method of the API.
+
+        Parameters
+        ----------
+        url
+            A fully constructed URL to which the PATCH request should be sent.
+        data
+            The data to be sent as JSON in the body of the PATCH request.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request.
+
+        Returns
+        -------
+            The data retrieved from the API response.
+        """
+        response = await self._send(
+            "PATCH",
+            url,
+            self.client.patch,
+            json=data,
+            **(additional_request_params or {}),
+        )
+
+        return self._handle_response(response)
+
+    async def _put(
+        self,
+        url: str,
+        data: Any,
+        additional_request_params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Call the PUT method of the API.
+
+        Parameters
+        ----------
+        url
+            A fully constructed URL to which the PUT request should be sent.
+        data
+            The data to be sent as JSON in the body of the PUT request.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request.
+
+        Returns
+        -------
+            The data retrieved from the API response.
+        """
+        response = await self._send(
+            "PUT",
+            url,
+            self.client.put,
+            json=data,
+            **(additional_request_params or {}),
+        )
+
+        return self._handle_response(response)
+
+    async def _delete(
+        self, url: str, additional_request_params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Call the DELETE method of the API.
+
+        Parameters
+        ----------
+        url
+            A fully constructed URL to which the DELETE request should be sent.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request.
+        """
+        response = await self._send(
+            "DELETE",
+            url,
+            self.client.delete,
+            **(additional_request_params or {}),
+        )
+
+        return self._handle_response(response)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        send: Callable[..., Awaitable[HTTPResponse]],
+        **kwargs: Any,
+    ) -> HTTPResponse:
+        """Send a request through the circuit breaker and retry it when it
+        fails, according to the retry policy of the repository. The delays
+        before the retries do not block the event loop.
+
+        Parameters
+        ----------
+        method
+            The HTTP method of the request.
+        url
+            A fully constructed URL to which the request should be sent.
+        send
+            The coroutine function of the asyncio HTTP client which sends the
+            request.
+        **kwargs
+            The parameters of the request, which are passed to `send`.
+
+        Returns
+        -------
+            The response of the last attempt.
+
+        Raises
+        ------
+        exceptions.CircuitOpenException
+            If the circuit breaker of the host is open.
+        """
+        if self._response_cache is not None and method not in ("GET", "HEAD"):
+            await asyncio.to_thread(
+                self._invalidate_cached_responses, method, url
+            )
+        breaker = self._circuit_breaker
+        if not self._retry_policy and not breaker:
+            return await send(url=url, **kwargs)
+
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            if breaker:
+                breaker.before_request(host)
+            try:
+                response = await send(url=url, **kwargs)
+            except Exception as exc:
+                if breaker:
+                    breaker.record_failure(host)
+                delay = self._retry_delay(method, attempt, kwargs, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                if breaker:
+                    breaker.record_response(host, response.status_code)
+                delay = self._retry_delay(
+                    method, attempt, kwargs, response=response
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
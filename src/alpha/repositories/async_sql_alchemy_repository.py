@@ -0,0 +1,926 @@
+"""Contains the AsyncSqlAlchemyRepository implementation which provides
+basic CRUD operations for domain models using a SqlAlchemy asyncio
+session."""
+
+import itertools
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Mapping,
+)
+from enum import Enum
+from typing import (
+    Any,
+    Generic,
+    Literal,
+    TypeVar,
+    cast,
+)
+from uuid import UUID
+
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.elements import UnaryExpression
+
+from alpha.domain.models.base_model import (
+    BaseDomainModel,
+    DomainModel,
+)
+from alpha.infra.caches.statement_cache import StatementCache
+from alpha.infra.models.filter_operators import FilterOperator
+from alpha.infra.models.json_patch import JsonPatch
+from alpha.infra.models.load_option import LoadOption
+from alpha.infra.models.order_by import OrderBy
+from alpha.infra.models.search_filter import SearchFilter
+from alpha.interfaces.cache import CacheBackend
+from alpha.interfaces.patchable import Patchable
+from alpha.interfaces.updatable import Updatable
+from alpha.repositories.sql_alchemy_repository import SqlAlchemyRepository
+
+T = TypeVar("T")
+
+
+class AsyncSqlAlchemyRepository(Generic[DomainModel]):
+    """SqlAlchemy repository implementation for asyncio sessions. Provides
+    the same operations as the `SqlAlchemyRepository`, as coroutines:
+        - add
+        - add_all
+        - count
+        - exists
+        - get
+        - get_all
+        - get_one
+        - get_one_or_none
+        - get_by_id
+        - get_many
+        - ingest
+        - patch
+        - remove
+        - remove_all
+        - select
+        - select_frame
+        - select_iter
+        - update
+        - update_where
+        - upsert
+        - view
+
+    The statements are built by a `SqlAlchemyRepository` which uses the
+    synchronous facade of the asyncio session, so filters, ordering,
+    `QueryClause` objects, the statement cache and the model cache behave
+    exactly the same. Every operation is executed by
+    `AsyncSession.run_sync`, which runs the operation in a greenlet in
+    which the database driver is awaited.
+
+    Relationships of the returned domain model instances can not be lazy
+    loaded outside of the repository methods. Load them eagerly by using
+    the `load` parameter with `LoadOption` objects, or access them in a
+    function which is passed to `run_sync`. With `strict_loading=True` an
+    access to a relationship which is not loaded raises an exception
+    instead of failing in the database driver.
+
+    You can also extend this repository to add custom methods by inheriting
+    from it and running your own query logic with `run_sync`.
+
+    Example:
+    ```python
+    class CustomRepository(AsyncSqlAlchemyRepository[MyDomainModel]):
+        async def custom_method(self, param: str) -> list[MyDomainModel]:
+            return await self.run_sync(
+                lambda repository: repository.select(
+                    filters=[SearchFilter(MyDomainModel.name, value=param)]
+                )
+            )
+    ```
+
+    Generic
+    -------
+        A generic type variable used to specify the domain model type for the
+        repository.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        default_model: DomainModel,
+        chunk_size: int = 1000,
+        statement_cache: StatementCache | None = None,
+        cache: CacheBackend | None = None,
+        cache_keys: Iterable[str] = ("id",),
+        strict_loading: bool = False,
+    ) -> None:
+        """Initialize the AsyncSqlAlchemyRepository with an asyncio database
+        session and a default domain model type.
+
+        Parameters
+        ----------
+        session
+            The SQLAlchemy asyncio session used for database interactions.
+        default_model
+            The default domain model type for the repository.
+        chunk_size
+            The default number of objects which are sent to the database in
+            a single batch by bulk operations, by default 1000
+        statement_cache
+            The cache in which the statements for query shapes are stored, by
+            default None which results in using the cache that is shared by
+            all repository instances
+        cache
+            The key-value store which is used as read-through cache for the
+            `get` methods, by default None which disables the cache
+        cache_keys
+            The attributes by which domain model instances are cached, by
+            default ("id",)
+        strict_loading
+            Whether relationships which are not loaded eagerly by a
+            `LoadOption` raise an exception when they are accessed, by
+            default False
+        """
+        self.session = session
+        self._default_model = default_model
+        self._repository: SqlAlchemyRepository[DomainModel] = (
+            SqlAlchemyRepository(
+                session=session.sync_session,
+                default_model=default_model,
+                chunk_size=chunk_size,
+                statement_cache=statement_cache,
+                cache=cache,
+                cache_keys=cache_keys,
+                strict_loading=strict_loading,
+            )
+        )
+
+    async def run_sync(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a function with the synchronous `SqlAlchemyRepository` of
+        this repository, in which the database driver can be awaited.
+
+        Parameters
+        ----------
+        fn
+            The function to run. The synchronous repository is passed as
+            first argument, followed by the arguments and keyword arguments.
+
+        Returns
+        -------
+        T
+            The return value of the function.
+        """
+        return await self.session.run_sync(
+            lambda _: fn(self._repository, *args, **kwargs)
+        )
+
+    async def add(
+        self,
+        obj: DomainModel,
+        return_obj: bool = True,
+        raise_if_exists: bool = False,
+    ) -> DomainModel | None:
+        """Add a domain model instance to the database session.
+
+        Parameters
+        ----------
+        obj
+            The domain model instance to add.
+        return_obj
+            Whether to return the added object, by default True
+        raise_if_exists
+            Whether to raise an exception if the object already exists, by
+            default False
+
+        Returns
+        -------
+        DomainModel | None
+            The added domain model instance if return_obj is True, otherwise
+            None.
+
+        Raises
+        ------
+        exceptions.AlreadyExistsException
+            If raise_if_exists is True and the object already exists in the
+            database.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.add,
+            obj,
+            return_obj=return_obj,
+            raise_if_exists=raise_if_exists,
+        )
+
+    async def add_all(
+        self,
+        objs: list[DomainModel],
+        return_obj: bool = False,
+        raise_if_exists: bool = False,
+        chunk_size: int | None = None,
+    ) -> list[DomainModel] | None:
+        """Add multiple domain model instances to the database session.
+
+        Parameters
+        ----------
+        objs
+            The list of domain model instances to add.
+        return_obj
+            Whether to return the added objects, by default False
+        raise_if_exists
+            Whether to raise an exception if any object already exists, by
+            default False
+        chunk_size
+            The number of objects to flush per batch, by default None which
+            results in using the chunk size of the repository
+
+        Returns
+        -------
+        list[DomainModel] | None
+            The list of added domain model instances if return_obj is True,
+            otherwise None.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.add_all,
+            objs,
+            return_obj=return_obj,
+            raise_if_exists=raise_if_exists,
+            chunk_size=chunk_size,
+        )
+
+    async def count(
+        self,
+        model: DomainModel | None = None,
+        estimate: bool = False,
+        **kwargs: Any,
+    ) -> int:
+        """Count the number of records in the database for a given model and
+        optional filters.
+
+        Parameters
+        ----------
+        model
+            The domain model class to count, by default None
+        estimate
+            Whether to return the estimate of the query planner instead of
+            an exact count, by default False
+
+        Returns
+        -------
+        int
+            The number of records.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.count,
+            model=model,
+            estimate=estimate,
+            **kwargs,
+        )
+
+    async def exists(
+        self,
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> bool:
+        """Check whether any record exists in the database for a given model
+        and optional filters.
+
+        Parameters
+        ----------
+        model
+            The domain model class to query, by default None
+
+        Returns
+        -------
+        bool
+            True when at least one record matches.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.exists, model=model, **kwargs
+        )
+
+    async def get(
+        self,
+        attr: str | InstrumentedAttribute[Any],
+        value: str | float | Enum | UUID,
+        cursor_result: str = "first",
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> DomainModel:
+        """Retrieve a single domain model instance from the database based on
+        a specified attribute and value.
+
+        Parameters
+        ----------
+        attr
+            The attribute to filter by.
+        value
+            The value of the attribute to filter by.
+        cursor_result
+            The type of result to return, by default "first"
+        model
+            The domain model class to query, by default None
+
+        Returns
+        -------
+        DomainModel
+            The retrieved domain model instance.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.get,
+            attr,
+            value,
+            cursor_result=cursor_result,
+            model=model,
+            **kwargs,
+        )
+
+    async def get_all(
+        self,
+        attr: str | InstrumentedAttribute[Any],
+        value: str | float | Enum | UUID,
+        cursor_result: str = "all",
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> list[DomainModel]:
+        """Retrieve multiple domain model instances from the database based on
+        a specified attribute and value.
+
+        Parameters
+        ----------
+        attr
+            The attribute to filter by.
+        value
+            The value of the attribute to filter by.
+        cursor_result
+            The type of result to return, by default "all"
+        model
+            The domain model class to query, by default None
+
+        Returns
+        -------
+        list[DomainModel]
+            The list of retrieved domain model instances.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.get_all,
+            attr,
+            value,
+            cursor_result=cursor_result,
+            model=model,
+            **kwargs,
+        )
+
+    async def get_one(
+        self,
+        attr: str | InstrumentedAttribute[Any],
+        value: str | float | Enum | UUID,
+        cursor_result: str = "one",
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> DomainModel:
+        """Retrieve a single domain model instance from the database based on
+        a specified attribute and value, expecting exactly one result.
+
+        Parameters
+        ----------
+        attr
+            The attribute to filter by.
+        value
+            The value of the attribute to filter by.
+        cursor_result
+            The type of result to return, by default "one"
+        model
+            The domain model class to query, by default None
+
+        Returns
+        -------
+        DomainModel
+            The retrieved domain model instance.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.get_one,
+            attr,
+            value,
+            cursor_result=cursor_result,
+            model=model,
+            **kwargs,
+        )
+
+    async def get_one_or_none(
+        self,
+        attr: str | InstrumentedAttribute[Any],
+        value: str | float | Enum | UUID,
+        cursor_result: str = "one_or_none",
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> DomainModel | None:
+        """Retrieve a single domain model instance from the database based on
+        a specified attribute and value, expecting zero or one result.
+
+        Parameters
+        ----------
+        attr
+            The attribute to filter by.
+        value
+            The value of the attribute to filter by.
+        cursor_result
+            The type of result to return, by default "one_or_none"
+        model
+            The domain model class to query, by default None
+
+        Returns
+        -------
+        DomainModel | None
+            The retrieved domain model instance or None.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.get_one_or_none,
+            attr,
+            value,
+            cursor_result=cursor_result,
+            model=model,
+            **kwargs,
+        )
+
+    async def get_by_id(
+        self,
+        value: str | int | UUID,
+        attr: str | InstrumentedAttribute[Any] = "id",
+        cursor_result: str = "one_or_none",
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> DomainModel | None:
+        """Retrieve a single domain model instance from the database based on
+        its ID.
+
+        Parameters
+        ----------
+        value
+            The ID value to filter by.
+        attr
+            The attribute to filter by, by default "id"
+        cursor_result
+            The type of result to return, by default "one_or_none"
+        model
+            The domain model class to query, by default None
+
+        Returns
+        -------
+        DomainModel | None
+            The retrieved domain model instance or None.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.get_by_id,
+            value,
+            attr=attr,
+            cursor_result=cursor_result,
+            model=model,
+            **kwargs,
+        )
+
+    async def get_many(
+        self,
+        values: Iterable[Any],
+        attr: str | InstrumentedAttribute[Any] = "id",
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+        read_only: bool = False,
+        load: list[LoadOption] | None = None,
+    ) -> list[DomainModel | None]:
+        """Retrieve multiple domain model instances from the database based on
+        a list of values of a specified attribute, by using as few queries as
+        possible.
+
+        Parameters
+        ----------
+        values
+            The values of the attribute to retrieve the instances for.
+        attr
+            The attribute to filter by, by default "id"
+        model
+            The domain model class to query, by default None
+        chunk_size
+            The maximum number of values per query, by default None
+        read_only
+            Whether the queries can be executed on a read replica of the
+            database, by default False
+        load
+            The load options of the relationships of the instances, by
+            default None
+
+        Returns
+        -------
+        list[DomainModel | None]
+            The instances in the order of the values, with None for the
+            values which are not found.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.get_many,
+            values,
+            attr=attr,
+            model=model,
+            chunk_size=chunk_size,
+            read_only=read_only,
+            load=load,
+        )
+
+    async def ingest(
+        self,
+        data: pd.DataFrame | Iterable[Mapping[str, Any] | DomainModel],
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+        on_conflict: Literal["ignore", "update"] | None = None,
+        conflict_keys: list[str] | None = None,
+        update_columns: list[str] | None = None,
+    ) -> int:
+        """Insert rows into the table of a domain model without creating
+        domain model instances.
+
+        Parameters
+        ----------
+        data
+            A DataFrame, mappings or domain model instances to insert.
+        model
+            The domain model class of the table, by default None
+        chunk_size
+            The number of rows per statement, by default None
+        on_conflict
+            What to do with rows which conflict with existing rows, by
+            default None which raises an exception
+        conflict_keys
+            The columns which identify a conflicting row, by default None
+        update_columns
+            The columns which are updated on a conflict, by default None
+
+        Returns
+        -------
+        int
+            The number of ingested rows.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.ingest,
+            data,
+            model=model,
+            chunk_size=chunk_size,
+            on_conflict=on_conflict,
+            conflict_keys=conflict_keys,
+            update_columns=update_columns,
+        )
+
+    async def patch(
+        self, obj: Patchable[Any], patches: JsonPatch
+    ) -> BaseDomainModel:
+        """Patch a domain model object using a JSON patch object.
+
+        Parameters
+        ----------
+        obj
+            The domain model object to patch.
+        patches
+            The JSON patch object containing the patches.
+
+        Returns
+        -------
+        BaseDomainModel
+            The patched domain model object.
+        """
+        return await self.run_sync(SqlAlchemyRepository.patch, obj, patches)
+
+    async def remove(self, obj: DomainModel) -> None:
+        """Remove a domain model instance from the database.
+
+        Parameters
+        ----------
+        obj
+            The domain model instance to remove.
+        """
+        await self.run_sync(SqlAlchemyRepository.remove, obj)
+
+    async def remove_all(
+        self,
+        objs: list[DomainModel] | None = None,
+        model: DomainModel | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Remove multiple domain model instances from the database.
+
+        Parameters
+        ----------
+        objs
+            The domain model instances to remove, by default None
+        model
+            The domain model class to remove from, by default None
+        filters
+            The filters which select the rows to remove, by default None
+
+        Returns
+        -------
+        int
+            The number of removed rows.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.remove_all,
+            objs=objs,
+            model=model,
+            filters=filters,
+            **kwargs,
+        )
+
+    async def select(
+        self,
+        model: DomainModel | None = None,
+        cursor_result: str = "all",
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None = None,
+        defer: list[str | InstrumentedAttribute[Any]] | None = None,
+        **kwargs: Any,
+    ) -> list[DomainModel]:
+        """Select domain model instances from the database based on optional
+        filters.
+
+        Parameters
+        ----------
+        model
+            The domain model class to query, by default None
+        cursor_result
+            The type of result to return, by default "all"
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting domain model instances
+        load_only
+            The names or instrumented attributes of the only columns which
+            are loaded, by default None
+        defer
+            The names or instrumented attributes of the columns which are not
+            loaded, by default None
+
+        Returns
+        -------
+        list[DomainModel]
+            The list of retrieved domain model instances, or the rows of the
+            selected columns.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.select,
+            model=model,
+            cursor_result=cursor_result,
+            columns=columns,
+            load_only=load_only,
+            defer=defer,
+            **kwargs,
+        )
+
+    async def select_frame(
+        self,
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        order_by: (
+            list[InstrumentedAttribute[Any] | UnaryExpression[Any] | OrderBy]
+            | None
+        ) = None,
+        model: DomainModel | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        as_arrow: bool = False,
+        batch_size: int = 10000,
+        read_only: bool = False,
+    ) -> Any:
+        """Select columns of a domain model as a pandas DataFrame or a
+        pyarrow Table.
+
+        Parameters
+        ----------
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting all columns
+        filters
+            The list of filters to apply, by default None
+        order_by
+            The list of order by clauses, by default None
+        model
+            The domain model class to query, by default None
+        limit
+            The maximum number of rows, by default None
+        offset
+            The number of rows to skip, by default None
+        as_arrow
+            Whether to return a pyarrow Table instead of a pandas DataFrame,
+            by default False
+        batch_size
+            The number of rows to fetch per batch, by default 10000
+        read_only
+            Whether the statement can be executed on a read replica of the
+            database, by default False
+
+        Returns
+        -------
+        pandas.DataFrame | pyarrow.Table
+            The selected columns.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.select_frame,
+            columns=columns,
+            filters=filters,
+            order_by=order_by,
+            model=model,
+            limit=limit,
+            offset=offset,
+            as_arrow=as_arrow,
+            batch_size=batch_size,
+            read_only=read_only,
+        )
+
+    async def select_iter(
+        self,
+        model: DomainModel | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        order_by: (
+            list[InstrumentedAttribute[Any] | UnaryExpression[Any] | OrderBy]
+            | None
+        ) = None,
+        batch_size: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncIterator[DomainModel]:
+        """Iterate over domain model instances from the database in batches
+        by using keyset (seek) pagination.
+
+        Every batch is fetched in a single call to the database, after which
+        the instances of the batch are yielded.
+
+        Parameters
+        ----------
+        model
+            The domain model class to query, by default None
+        filters
+            The list of filters to apply, by default None
+        order_by
+            The columns to order and paginate by, by default None which
+            results in ordering by the primary key columns
+        batch_size
+            The number of rows to fetch per page, by default 1000
+
+        Yields
+        ------
+        DomainModel
+            The retrieved domain model instances.
+        """
+        iterator = cast(
+            Generator[DomainModel, None, None],
+            self._repository.select_iter(
+                model=model,
+                filters=filters,
+                order_by=order_by,
+                batch_size=batch_size,
+                **kwargs,
+            ),
+        )
+        try:
+            while True:
+                batch = await self.session.run_sync(
+                    lambda _: list(itertools.islice(iterator, batch_size))
+                )
+                for obj in batch:
+                    yield obj
+                if len(batch) < batch_size:
+                    return
+        finally:
+            await self.session.run_sync(lambda _: iterator.close())
+
+    async def update(self, obj: Updatable, new: DomainModel) -> DomainModel:
+        """Update a domain model instance with new data.
+
+        Parameters
+        ----------
+        obj
+            The domain model instance to update.
+        new
+            The new data to update the instance with.
+
+        Returns
+        -------
+        DomainModel
+            The updated domain model instance.
+        """
+        return await self.run_sync(SqlAlchemyRepository.update, obj, new)
+
+    async def update_where(
+        self,
+        values: dict[str | InstrumentedAttribute[Any], Any],
+        model: DomainModel | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Update all rows which match the filters with the same values by
+        using a single `UPDATE ... WHERE` statement.
+
+        Parameters
+        ----------
+        values
+            The new values by attribute.
+        model
+            The domain model class to update, by default None
+        filters
+            The filters which select the rows to update, by default None
+
+        Returns
+        -------
+        int
+            The number of updated rows.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.update_where,
+            values,
+            model=model,
+            filters=filters,
+            **kwargs,
+        )
+
+    async def upsert(
+        self,
+        obj_or_objs: (
+            DomainModel
+            | Mapping[str, Any]
+            | Iterable[DomainModel | Mapping[str, Any]]
+        ),
+        conflict_keys: list[str] | None = None,
+        update_columns: list[str] | None = None,
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Insert domain model instances, or update the existing rows when
+        they conflict with rows in the database.
+
+        Parameters
+        ----------
+        obj_or_objs
+            A domain model instance or mapping, or an iterable of them.
+        conflict_keys
+            The columns which identify a conflicting row, by default None
+        update_columns
+            The columns which are updated on a conflict, by default None
+        model
+            The domain model class of the table, by default None
+        chunk_size
+            The number of rows per statement, by default None
+
+        Returns
+        -------
+        int
+            The number of inserted or updated rows.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.upsert,
+            obj_or_objs,
+            conflict_keys=conflict_keys,
+            update_columns=update_columns,
+            model=model,
+            chunk_size=chunk_size,
+        )
+
+    async def view(
+        self,
+        model: DomainModel,
+        cursor_result: str = "all",
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None = None,
+        defer: list[str | InstrumentedAttribute[Any]] | None = None,
+        **kwargs: Any,
+    ) -> list[DomainModel]:
+        """View domain model instances from the database based on optional
+        filters.
+
+        Parameters
+        ----------
+        model
+            The domain model class to query.
+        cursor_result
+            The type of result to return, by default "all"
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting domain model instances
+        load_only
+            The names or instrumented attributes of the only columns which
+            are loaded, by default None
+        defer
+            The names or instrumented attributes of the columns which are not
+            loaded, by default None
+
+        Returns
+        -------
+        list[DomainModel]
+            The list of retrieved domain model instances, or the rows of the
+            selected columns.
+        """
+        return await self.run_sync(
+            SqlAlchemyRepository.view,
+            model,
+            cursor_result=cursor_result,
+            columns=columns,
+            load_only=load_only,
+            defer=defer,
+            **kwargs,
+        )
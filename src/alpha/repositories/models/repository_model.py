@@ -1,7 +1,8 @@
 """RepositoryModel dataclass definition"""
 
+import functools
 from dataclasses import dataclass
-from typing import Callable, Generic
+from typing import Callable, Generic, Protocol, get_origin
 
 from alpha.domain.models.base_model import DomainModel
 
@@ -32,3 +33,51 @@ class RepositoryModel(Generic[DomainModel]):
     default_model: type[DomainModel]
     interface: object | None = None
     additional_config: dict[str, object] | None = None
+
+    def implements_interface(self) -> bool | None:
+        """Check whether the repository class implements the methods of the
+        interface, without creating an instance of the repository. The
+        result is cached per repository class and interface.
+
+        Returns
+        -------
+        bool | None
+            True when there is no interface or the repository class has all
+            methods of the interface, False when a method is missing, and
+            None when the repository is created by a factory function, in
+            which case only an instance of the repository can be checked.
+        """
+        if self.interface is None:
+            return True
+        repository_class = get_origin(self.repository) or self.repository
+        if not isinstance(repository_class, type) or not isinstance(
+            self.interface, type
+        ):
+            return None
+        return _implements(repository_class, self.interface)
+
+
+@functools.cache
+def _implements(repository_class: type, interface: type) -> bool:
+    """Check whether a class has all methods of an interface. The attributes
+    which are only annotated on the interface are set on the instances, so
+    they are not checked.
+
+    Parameters
+    ----------
+    repository_class
+        The repository class
+    interface
+        The interface, a runtime checkable protocol
+
+    Returns
+    -------
+    bool
+        True when the class has all methods of the interface
+    """
+    methods = {
+        name
+        for name in set(dir(interface)) - set(dir(Protocol))
+        if not (name.startswith("__") and name.endswith("__"))
+    }
+    return all(hasattr(repository_class, name) for name in methods)
@@ -1,21 +1,38 @@
 """This module contains the `RestApiRepository` class."""
 
-from urllib.parse import urlencode, urljoin
+import copy
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, cast
+from urllib.parse import urlsplit
 from uuid import UUID
 
+import httpx
 import requests
-from requests.cookies import cookiejar_from_dict, RequestsCookieJar  # type: ignore
-from typing import Any, Generic, TypeVar, cast
 
 from alpha import exceptions
-from alpha.domain.models.base_model import BaseDomainModel, DomainModel
+from alpha.domain.models.base_model import DomainModel
+from alpha.infra.connectors.circuit_breaker import CircuitBreaker
 from alpha.infra.models.json_patch import JsonPatch
+from alpha.infra.models.pagination import Pagination
+from alpha.infra.models.retry_policy import RetryPolicy
+from alpha.interfaces.cache import CacheBackend
 from alpha.interfaces.http_client import HTTPClient, HTTPResponse
-
-T = TypeVar("T", bound=BaseDomainModel)
-
-
-class RestApiRepository(Generic[DomainModel]):
+from alpha.repositories.rest_api_repository_mixin import (
+    RestApiRepositoryMixin,
+)
+
+REQUEST_EXCEPTIONS: tuple[type[Exception], ...] = (
+    exceptions.ClientErrorException,
+    exceptions.ServerErrorException,
+    requests.RequestException,
+    httpx.HTTPError,
+)
+"""The exceptions of failed requests, which `get_many` returns in place of
+the resources."""
+
+class RestApiRepository(RestApiRepositoryMixin, Generic[DomainModel]):
     """Implementation of `ApiRepository` that interacts with a RESTful API
     using the `requests` library.
 
@@ -33,6 +50,8 @@ class RestApiRepository(Generic[DomainModel]):
         application.
     """
 
+    client: HTTPClient
+
     def __init__(
         self,
         host: str,
@@ -49,6 +68,10 @@ class RestApiRepository(Generic[DomainModel]):
         request_headers: dict[str, str] | None = None,
         request_cookies: dict[str, str] | None = None,
         response_data_attribute: str | None = None,
+        pagination: Pagination | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: CacheBackend | None = None,
     ) -> None:
         """Initialize the REST API repository.
 
@@ -96,51 +119,50 @@ class RestApiRepository(Generic[DomainModel]):
         response_data_attribute
             The attribute in the response data to extract the relevant data
             from, by default None
+        pagination
+            The default pagination strategy of `iter_all`, by default None
+            which follows the `Link` headers of the responses
+        retry_policy
+            The policy of retrying failed requests, by default None which
+            does not retry requests
+        circuit_breaker
+            The circuit breaker which stops sending requests to a host while
+            it is unhealthy, by default None. A circuit breaker can be shared
+            by many repositories.
+        response_cache
+            The cache of the responses of GET requests, for example a
+            `MemoryCache` or a `FileCache`, by default None which does not
+            cache responses. Responses are cached according to their
+            `Cache-Control`, `ETag`, `Last-Modified` and `Vary` headers,
+            per URL and per set of request headers and cookies, so a
+            response to a request with credentials is only returned for the
+            same credentials. Responses with `Cache-Control: private` and
+            requests with an `auth` handler are not cached.
         """
-        self._host = host
-        self._scheme = scheme or "https"
-        self._base_path = base_path
-        self._endpoint = endpoint
-        self._default_model = default_model
-        self._use_factory = use_factory
-        self._serialize = serialize
-        self._model_factory_method_name = model_factory_method_name
-        self._model_serialization_method_name = model_serialization_method_name
-
         client_obj = cast(
             HTTPClient, client or session or requests.sessions.Session()
         )
-        # Expose the underlying client publicly for consistency with other
-        # repositories
-        self.client = client_obj
-        # Preserve the deprecated public session alias for backward
-        # compatibility
-        self.session = client_obj
         # Preserve the existing private attribute for backward compatibility
         self._session = client_obj
-
-        self._request_headers = request_headers or {}
-        self._request_cookies = request_cookies or {}
-        self._response_data_attribute = response_data_attribute
-        # Update client with default headers and cookies
-        self.client.headers.update(request_headers or {})
-        if request_cookies:
-            cookies = self.client.cookies
-            # If the client's cookies object supports the `update` method and
-            # is not a `RequestsCookieJar`, use `update`. Otherwise, if it's a
-            # `RequestsCookieJar`, use `cookiejar_from_dict` to update it.
-            # This ensures compatibility with different types of cookie
-            # implementations that may be used by various HTTP clients.
-            if hasattr(cookies, "update") and not isinstance(
-                cookies, RequestsCookieJar
-            ):
-                cookies.update(request_cookies)
-            elif isinstance(cookies, RequestsCookieJar):
-                cookiejar_from_dict(
-                    request_cookies,
-                    cookiejar=cookies,
-                    overwrite=True,
-                )
+        super().__init__(
+            host=host,
+            client=client_obj,
+            scheme=scheme,
+            base_path=base_path,
+            endpoint=endpoint,
+            default_model=default_model,
+            use_factory=use_factory,
+            serialize=serialize,
+            model_factory_method_name=model_factory_method_name,
+            model_serialization_method_name=model_serialization_method_name,
+            request_headers=request_headers,
+            request_cookies=request_cookies,
+            response_data_attribute=response_data_attribute,
+            pagination=pagination,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+        )
 
     def request(
         self,
@@ -175,9 +197,12 @@ class RestApiRepository(Generic[DomainModel]):
         -------
             The data retrieved from the API response.
         """
-        response = self.client.request(
-            method=method.upper(),
-            url=url,
+        response = self._send(
+            method.upper(),
+            url,
+            lambda **params: self.client.request(
+                method=method.upper(), **params
+            ),
             **kwargs,
         )
 
@@ -489,6 +514,210 @@ class RestApiRepository(Generic[DomainModel]):
 
         return self._map_response_array(response_data, model)
 
+    def get_many(
+        self,
+        params: Iterable[str | int | UUID],
+        max_concurrency: int = 10,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **query_params: Any,
+    ) -> list[DomainModel | dict[str, Any] | Exception]:
+        """Retrieve multiple resources by sending a GET request per resource.
+
+        The requests are sent concurrently by a pool of at most
+        `max_concurrency` threads, so the duration is close to the duration
+        of the slowest request instead of the sum of all requests. A request
+        which fails with an error response or a connection error does not
+        fail the other requests. Its exception is returned in place of the
+        resource instead. Other exceptions, like errors in the model factory
+        method, are raised.
+
+        The HTTP client of the repository is shared by the threads. A
+        `requests.Session` is not documented to be thread-safe. Concurrent
+        GET requests are safe as long as no other thread changes the
+        headers, cookies or adapters of the session at the same time, but a
+        session which stores the cookies of the responses can mix them up
+        between the threads. Use a thread-safe client, like `httpx.Client`,
+        when the API sets cookies. The `requests` session also keeps at most
+        10 connections per host by default, so a higher `max_concurrency`
+        requires a larger connection pool of the session.
+
+        Parameters
+        ----------
+        params
+            The parameters which identify the resources. Each parameter is
+            appended to the endpoint to form the URL of a GET request.
+        max_concurrency
+            The maximum number of requests which are sent at the same time,
+            by default 10
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint from which the objects should be retrieved.
+        parent_endpoint
+            The parent API endpoint, if the resources are nested under a
+            parent resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API requests, like headers or timeouts.
+        **query_params
+            Additional query parameters to include in the API requests.
+
+        Returns
+        -------
+            The retrieved objects, or the exceptions of the requests which
+            failed, in the order of the parameters. The exceptions are one of
+            the `REQUEST_EXCEPTIONS`.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is lower than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                "The max_concurrency has to be a positive integer"
+            )
+        params = list(params)
+        if not params:
+            return []
+
+        def get(param: str | int | UUID) -> Any:
+            try:
+                return self.get(
+                    use_factory=use_factory,
+                    endpoint=endpoint,
+                    parent_endpoint=parent_endpoint,
+                    parent_param=parent_param,
+                    param=param,
+                    model=model,
+                    additional_request_params=additional_request_params,
+                    **query_params,
+                )
+            except REQUEST_EXCEPTIONS as exc:
+                return exc
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(params))
+        ) as executor:
+            return list(executor.map(get, params))
+
+    def iter_all(
+        self,
+        pagination: Pagination | None = None,
+        use_factory: bool | None = None,
+        endpoint: str | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        param: str | int | UUID | None = None,
+        model: DomainModel | None = None,
+        additional_request_params: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> Iterator[DomainModel | dict[str, Any]]:
+        """Iterate over all resources of a paginated collection.
+
+        The pages are requested one after another by following the
+        pagination strategy, and the items are yielded one at a time. The
+        next page is requested in a background thread while the items of the
+        current page are consumed, so the network wait overlaps with the
+        processing of the items. At most two pages are held in memory,
+        regardless of the size of the collection.
+
+        A `requests.Session` is not documented to be thread-safe, so the
+        pages are requested with a copy of the session, which has the same
+        headers, cookies, authentication and connection adapters. Cookies
+        which the API sets on the responses of the pages are not stored in
+        the session of the repository. Other clients, like `httpx.Client`,
+        are shared with the background thread. Closing the iterator, or
+        leaving a loop over it early, waits for a page which is being
+        requested.
+
+        Example:
+        ```python
+        for user in uow.users.iter_all(
+            pagination=CursorPagination(cursor_attribute="meta.next")
+        ):
+            ...
+        ```
+
+        Parameters
+        ----------
+        pagination
+            The pagination strategy, by default None which uses the
+            pagination strategy of the repository.
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+        endpoint
+            The API endpoint from which the objects should be retrieved.
+        parent_endpoint
+            The parent API endpoint, if the resource is nested under a parent
+            resource.
+        parent_param
+            The parameter to identify the parent resource, if applicable.
+        param
+            The parameter to append to the endpoint, if applicable.
+        model
+            The model to use for serialization/deserialization.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API requests, like headers or timeouts.
+        **params
+            Additional query parameters to include in the API requests.
+
+        Yields
+        ------
+            The retrieved objects.
+        """
+        pagination = pagination or self._pagination
+        factory = self._determine_use_factory(use_factory)
+        url: str | None = pagination.first_url(
+            self._build_url(
+                endpoint,
+                parent_endpoint=parent_endpoint,
+                parent_param=parent_param,
+                param=param,
+                **params,
+            )
+        )
+
+        client = self._prefetch_client()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page: Future[tuple[HTTPResponse, Any, list[Any]]] | None = (
+                executor.submit(
+                    self._get_page,
+                    cast(str, url),
+                    additional_request_params,
+                    client,
+                )
+            )
+            while page is not None:
+                response, body, items = page.result()
+                url = pagination.next_url(
+                    cast(str, url), response, body, items
+                )
+                page = None
+                if url:
+                    page = executor.submit(
+                        self._get_page, url, additional_request_params, client
+                    )
+                for item in items:
+                    if factory:
+                        item = self._map_response_object(item, model)
+                    yield item
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def patch(
         self,
         patch: JsonPatch,
@@ -714,16 +943,95 @@ class RestApiRepository(Generic[DomainModel]):
             parameters such as headers, authentication tokens, or other request
             options that may be needed for the API call.
 
+        When the repository has a response cache, a fresh cached response
+        is returned without sending a request, and a stale cached response
+        is revalidated with a conditional request.
+
         Returns
         -------
             The data retrieved from the API response.
         """
-        response = self.client.get(
-            url=url,
+        key = self._response_cache_key(url, additional_request_params)
+        cached = self._cached_response(key)
+        if cached is not None and cached.fresh:
+            return cached.data
+
+        response = self._send(
+            "GET",
+            url,
+            self.client.get,
+            **self._conditional_request_params(
+                cached, additional_request_params
+            ),
+        )
+
+        data = self._handle_response(response, cached)
+        self._cache_response(key, response, data, cached)
+        return data
+
+    def _get_page(
+        self,
+        url: str,
+        additional_request_params: dict[str, Any] | None = None,
+        client: HTTPClient | None = None,
+    ) -> tuple[HTTPResponse, Any, list[Any]]:
+        """Call the GET method of the API for a page of a collection.
+
+        Parameters
+        ----------
+        url
+            A fully constructed URL of the page.
+        additional_request_params
+            Additional parameters to include in the function call which handles
+            the API request.
+        client
+            The HTTP client which sends the request, by default None which
+            results in using the client of the repository.
+
+        Returns
+        -------
+            The response, the decoded JSON body of the response, and the items
+            of the page.
+        """
+        response = self._send(
+            "GET",
+            url,
+            (client or self.client).get,
             **(additional_request_params or {}),
         )
+        return self._read_page(response)
 
-        return self._handle_response(response)
+    def _prefetch_client(self) -> HTTPClient:
+        """Get the HTTP client with which `iter_all` requests the pages in
+        a background thread. A `requests.Session` is copied, because it is
+        not thread-safe. The copy shares the connection adapters, and thus
+        the connection pools, of the session.
+
+        Returns
+        -------
+            The copy of a `requests.Session`, or the client of the
+            repository.
+        """
+        if not isinstance(self.client, requests.Session):
+            return self.client
+        client: Any = self.client
+        prefetch = requests.Session()
+        prefetch.headers = client.headers.copy()
+        prefetch.cookies = client.cookies.copy()
+        prefetch.auth = client.auth
+        prefetch.proxies = dict(client.proxies)
+        prefetch.hooks = {
+            event: list(hooks) for event, hooks in client.hooks.items()
+        }
+        prefetch.params = copy.copy(client.params)
+        prefetch.stream = client.stream
+        prefetch.verify = client.verify
+        prefetch.cert = client.cert
+        prefetch.max_redirects = client.max_redirects
+        prefetch.trust_env = client.trust_env
+        for prefix, adapter in client.adapters.items():
+            prefetch.mount(prefix, adapter)
+        return cast(HTTPClient, prefetch)
 
     def _post(
         self,
@@ -754,8 +1062,10 @@ class RestApiRepository(Generic[DomainModel]):
         -------
             The data retrieved from the API response.
         """
-        response = self.client.post(
-            url=url,
+        response = self._send(
+            "POST",
+            url,
+            self.client.post,
             json=data,
             **(additional_request_params or {}),
         )
@@ -791,8 +1101,10 @@ class RestApiRepository(Generic[DomainModel]):
         -------
             The data retrieved from the API response.
         """
-        response = self.client.patch(
-            url=url,
+        response = self._send(
+            "PATCH",
+            url,
+            self.client.patch,
             json=data,
             **(additional_request_params or {}),
         )
@@ -828,8 +1140,10 @@ class RestApiRepository(Generic[DomainModel]):
         -------
             The data retrieved from the API response.
         """
-        response = self.client.put(
-            url=url,
+        response = self._send(
+            "PUT",
+            url,
+            self.client.put,
             json=data,
             **(additional_request_params or {}),
         )
@@ -854,413 +1168,71 @@ class RestApiRepository(Generic[DomainModel]):
             parameters such as headers, authentication tokens, or other request
             options that may be needed for the API call.
         """
-        response = self.client.delete(
-            url=url,
+        response = self._send(
+            "DELETE",
+            url,
+            self.client.delete,
             **(additional_request_params or {}),
         )
 
         return self._handle_response(response)
 
-    def _map_response_object(self, response: Any, model: T | None) -> T:
-        """Map a single object from the API response to a model instance.
-
-        Parameters
-        ----------
-        response
-            The API response containing the data to be mapped.
-        model
-            The model class to which the data should be mapped. If None, the
-            default model for the repository will be used.
-
-        Returns
-        -------
-            An instance of the model populated with the data from the API
-            response.
-        """
-        model_to_use = self._determine_model(model)
-
-        return getattr(model_to_use, self._model_factory_method_name)(response)
-
-    def _map_response_array(
-        self, response: list[Any], model: T | None
-    ) -> list[T]:
-        """Map an array of objects from the API response to model instances.
-
-        Parameters
-        ----------
-        response
-            The API response containing the data to be mapped.
-        model
-            The model class to which the data should be mapped. If None, the
-            default model for the repository will be used.
-
-        Returns
-        -------
-            A list of model instances populated with the data from the API
-            response.
-        """
-        model_to_use = self._determine_model(model)
-
-        return [
-            getattr(model_to_use, self._model_factory_method_name)(item)
-            for item in response
-        ]
-
-    def _build_url(
-        self,
-        endpoint: str | None = None,
-        param: str | int | UUID | None = None,
-        parent_endpoint: str | None = None,
-        parent_param: str | int | UUID | None = None,
-        **params: Any,
-    ) -> str:
-        """Build an URL to use for HTTP requests.
-
-        The method constructs the URL based on the provided endpoint and
-        parameter, as well as the base host, scheme, and base path configured
-        for the repository. The endpoint and parameter are optional, allowing
-        for flexible URL construction. The method ensures that the URL is
-        properly formatted and can be used for making API requests.
-
-        The method detects if the scheme is provided and constructs the URL
-        accordingly. If a scheme is provided, it will be included in the URL.
-        If not, the URL will be constructed without a scheme, allowing for
-        relative URLs or URLs with a different scheme. If the scheme is already
-        included in the host, it will not be replaced.
-
-        An optional parent endpoint and parameter can be included in the URL,
-        which is useful for nested resources. The parent parameter will be
-        appended after the parent endpoint, and the main parameter will be
-        appended after the main endpoint.
-
-        Parameters
-        ----------
-        endpoint
-            The endpoint to use for the URL, by default None
-        param
-            The parameter to append to the URL, by default None
-        parent_endpoint
-            An optional parent endpoint to include in the URL, by default None
-        parent_param
-            An optional parameter to append after the parent endpoint,
-            by default None
-        **params
-            Additional parameters that can be used for query parameters.
-
-        Returns
-        -------
-            The constructed URL as a string
-        """
-        if self._scheme and not self._host.__contains__("://"):
-            url = f"{self._scheme}://{self._host}"
-        else:
-            url = self._host
-
-        endpoint = endpoint or self._endpoint
-
-        if self._base_path:
-            url = urljoin(url, self._base_path.strip("/") + "/")
-
-        if parent_endpoint:
-            url = urljoin(url, parent_endpoint.lstrip("/"))
-
-        if parent_param is not None:
-            url = urljoin(url + "/", str(parent_param))
-
-        if endpoint:
-            url = urljoin(url + "/", endpoint.lstrip("/"))
-
-        if param is not None:
-            url = urljoin(url + "/", str(param))
-
-        if params:
-            url = url + "?" + urlencode(params, doseq=True)
-
-        return url
-
-    def _serialize_object(self, obj: Any) -> Any:
-        """Serialize an object using the specified serialization method if it
-        exists.
-
-        Parameters
-        ----------
-        obj
-            The object to be serialized.
-
-        Returns
-        -------
-            The serialized object if the serialization method exists, otherwise
-            the original object.
-        """
-        if hasattr(obj, self._model_serialization_method_name):
-            return getattr(obj, self._model_serialization_method_name)()
-        return obj
-
-    def _get_data_from_response(
-        self, response: HTTPResponse
-    ) -> dict[str, Any] | None:
-        """Extract data from the API response. If the response_data_attribute
-        is configured, it will return the value of that attribute. Otherwise,
-        it will return the entire response data.
-
-        Parameters
-        ----------
-        response
-            The API response object.
-
-        Returns
-        -------
-            The extracted data from the API response.
-        """
-        data: dict[str, Any] = response.json()
-        if self._response_data_attribute:
-            return data.get(self._response_data_attribute)
-        return data
-
-    def _determine_serialization(
+    def _send(
         self,
-        serialize: bool | None,
-    ) -> bool:
-        """Determine to use the serialize variable or self._serialize for
-        deciding whether to serialize the object before sending it in the API
-        request.
-
-        Parameters
-        ----------
-        serialize
-            Whether to serialize the object before sending it in the API
-            request.
-
-        Returns
-        -------
-            The value to use for deciding whether to serialize the object before
-            sending it in the API request.
-        """
-        return serialize if serialize is not None else self._serialize
-
-    def _determine_use_factory(
-        self,
-        use_factory: bool | None,
-    ) -> bool:
-        """Determine to use the use_factory variable or self._use_factory for
-        deciding whether to use the model factory method for creating models.
-
-        Parameters
-        ----------
-        use_factory
-            Whether to use the model factory method for creating models from
-            response data.
-
-        Returns
-        -------
-            The value to use for deciding whether to use the model factory
-            method for creating models from response data.
-        """
-        return use_factory if use_factory is not None else self._use_factory
-
-    def _determine_model(self, model: T | None) -> T:
-        """Determine the model to use for mapping response data.
-
-        Parameters
-        ----------
-        model
-            The model class to which the data should be mapped. If None, the
-            default model for the repository will be used.
-
-        Returns
-        -------
-             The model class to use for mapping response data.
-
-        Raises
-        ------
-        ValueError
-            If no model is provided and no default model is set for the
-            repository.
-        AttributeError
-            If the determined model does not have the required factory method
-            defined.
-        """
-        if not model and not self._default_model:
-            raise ValueError(
-                "No model provided for mapping response and no default model "
-                "set for the repository."
-            )
-
-        model_to_use = cast(T, model or self._default_model)
-
-        if not hasattr(model_to_use, self._model_factory_method_name):
-            raise AttributeError(
-                f"The model {model_to_use} does not have the factory method "
-                f"'{self._model_factory_method_name}' defined. Please ensure "
-                f"that the model has this method or set the correct "
-                f"model_factory_method_name for the repository."
-            )
-
-        return model_to_use
-
-    def _handle_response(self, response: HTTPResponse) -> Any | None:
-        """Handle the API response and extract the relevant data.
-
-        In addition to extracting data from successful responses, this method
-        also handles various HTTP error responses by raising appropriate
-        exceptions based on the status code of the response. This ensures that
-        the caller can handle different error scenarios in a structured way.
+        method: str,
+        url: str,
+        send: Callable[..., HTTPResponse],
+        **kwargs: Any,
+    ) -> HTTPResponse:
+        """Send a request through the circuit breaker and retry it when it
+        fails, according to the retry policy of the repository.
 
         Parameters
         ----------
-        response
-            The API response object to be processed.
+        method
+            The HTTP method of the request.
+        url
+            A fully constructed URL to which the request should be sent.
+        send
+            The method of the HTTP client which sends the request.
+        **kwargs
+            The parameters of the request, which are passed to `send`.
 
         Returns
         -------
-            The processed data extracted from the API response.
+            The response of the last attempt.
 
         Raises
         ------
-        exceptions.BadRequestException
-            If the API response indicates a bad request (HTTP status code 400).
-        exceptions.UnauthorizedException
-            If the API response indicates an unauthorized request (HTTP status
-            code 401).
-        exceptions.ForbiddenException
-            If the API response indicates a forbidden request (HTTP status code
-            403).
-        exceptions.NotFoundException
-            If the API response indicates that the requested resource was not
-            found (HTTP status code 404).
-        exceptions.MethodNotAllowedException
-            If the API response indicates that the HTTP method is not allowed
-            (HTTP status code 405).
-        exceptions.NotAcceptableException
-            If the API response indicates that the requested resource is not
-            acceptable (HTTP status code 406).
-        exceptions.ConflictException
-            If the API response indicates a conflict with the current state of
-            the resource (HTTP status code 409).
-        exceptions.PayloadTooLargeException
-            If the API response indicates that the request payload is too large
-            (HTTP status code 413).
-        exceptions.UnprocessableContentException
-            If the API response indicates that the server cannot process the
-            contained instructions (HTTP status code 422).
-        exceptions.InternalServerErrorException
-            If the API response indicates an internal server error (HTTP status
-            code 500).
-        exceptions.NotImplementedException
-            If the API response indicates that the server does not support the
-            functionality required to fulfill the request (HTTP status code
-            501).
-        exceptions.BadGatewayException
-            If the API response indicates a bad gateway error (HTTP status code
-            502).
-        exceptions.ServiceUnavailableException
-            If the API response indicates that the service is unavailable (HTTP
-            status code 503).
-        exceptions.GatewayTimeoutException
-            If the API response indicates a gateway timeout error (HTTP status
-            code 504).
-        exceptions.ClientErrorException
-            If the API response indicates a client error that is not
-            specifically handled by the above exceptions.
-        exceptions.ServerErrorException
-            If the API response indicates a server error that is not
-            specifically handled by the above exceptions.
+        exceptions.CircuitOpenException
+            If the circuit breaker of the host is open.
         """
-        match response.status_code:
-            case 200 | 201 | 202:
-                return self._get_data_from_response(response)
-            case 204:
-                return None
-            case 400:
-                raise exceptions.BadRequestException(
-                    "Bad request: The server could not understand the request due "
-                    "to invalid syntax."
-                )
-            case 401:
-                raise exceptions.UnauthorizedException(
-                    "Unauthorized: The client must authenticate itself to get the "
-                    "requested response."
-                )
-            case 403:
-                raise exceptions.ForbiddenException(
-                    "Forbidden: The client does not have access rights to the "
-                    "content."
-                )
-            case 404:
-                raise exceptions.NotFoundException(
-                    "Not Found: The server can not find the requested resource."
-                )
-            case 405:
-                raise exceptions.MethodNotAllowedException(
-                    "Method Not Allowed: The request method is known by the server "
-                    "but is not supported by the target resource."
-                )
-            case 406:
-                raise exceptions.NotAcceptableException(
-                    "Not Acceptable: The server cannot produce a response matching "
-                    "the list of acceptable values defined in the request's "
-                    "proactive content negotiation headers."
-                )
-            case 409:
-                raise exceptions.ConflictException(
-                    "Conflict: The request could not be completed due to a conflict "
-                    "with the current state of the target resource."
-                )
-            case 413:
-                raise exceptions.PayloadTooLargeException(
-                    "Payload Too Large: The request entity is larger than limits "
-                    "defined by the server."
-                )
-            case 422:
-                raise exceptions.UnprocessableContentException(
-                    "Unprocessable Content: The server understands the content type "
-                    "of the request entity, and the syntax of the request entity is "
-                    "correct, but it was unable to process the contained instructions."
-                )
-            case 500:
-                raise exceptions.InternalServerErrorException(
-                    "Internal Server Error: The server has encountered a situation "
-                    "it doesn't know how to handle."
-                )
-            case 501:
-                raise exceptions.NotImplementedException(
-                    "Not Implemented: The server does not support the functionality "
-                    "required to fulfill the request."
-                )
-            case 502:
-                raise exceptions.BadGatewayException(
-                    "Bad Gateway: The server was acting as a gateway or proxy and "
-                    "received an invalid response from the upstream server."
-                )
-            case 503:
-                raise exceptions.ServiceUnavailableException(
-                    "Service Unavailable: The server is not ready to handle the "
-                    "request. Common causes are a server that is down for "
-                    "maintenance or that is overloaded."
-                )
-            case 504:
-                raise exceptions.GatewayTimeoutException(
-                    "Gateway Timeout: The server was acting as a gateway or proxy and "
-                    "did not receive a timely response from the upstream server."
-                )
-            case _:
-                status_code = response.status_code
-                if 300 <= status_code < 400:
-                    # Unexpected redirect or other 3xx status not explicitly handled above.
-                    raise exceptions.ClientErrorException(
-                        f"Unexpected redirect or 3xx HTTP status code: {status_code}"
-                    )
-                if 400 <= status_code < 500:
-                    # Generic client error for 4xx statuses not explicitly handled above.
-                    raise exceptions.ClientErrorException(
-                        f"An HTTP client error occurred (status code {status_code})."
-                    )
-                if 500 <= status_code < 600:
-                    # Generic server error for 5xx statuses not explicitly handled above.
-                    raise exceptions.ServerErrorException(
-                        f"An HTTP server error occurred (status code {status_code})."
-                    )
-                # Any other unexpected status code (e.g., 1xx or outside normal ranges).
-                raise exceptions.ClientErrorException(
-                    f"Unexpected HTTP status code: {status_code}"
+        self._invalidate_cached_responses(method, url)
+        policy = self._retry_policy
+        breaker = self._circuit_breaker
+        if not policy and not breaker:
+            return send(url=url, **kwargs)
+
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            if breaker:
+                breaker.before_request(host)
+            try:
+                response = send(url=url, **kwargs)
+            except Exception as exc:
+                if breaker:
+                    breaker.record_failure(host)
+                delay = self._retry_delay(method, attempt, kwargs, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                if breaker:
+                    breaker.record_response(host, response.status_code)
+                delay = self._retry_delay(
+                    method, attempt, kwargs, response=response
                 )
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,665 @@
+"""Contains the `RestApiRepositoryMixin` class, which implements the
+parts of the REST API repositories which do not send requests."""
+
+import hashlib
+import json
+from typing import Any, TypeVar, cast
+from urllib.parse import urlencode, urljoin
+from uuid import UUID, uuid4
+
+from requests.cookies import RequestsCookieJar, cookiejar_from_dict  # type: ignore
+
+from alpha import exceptions
+from alpha.domain.models.base_model import BaseDomainModel, DomainModel
+from alpha.infra.connectors.circuit_breaker import CircuitBreaker
+from alpha.infra.models.cached_response import CachedResponse
+from alpha.infra.models.pagination import LinkHeaderPagination, Pagination
+from alpha.infra.models.retry_policy import RetryPolicy
+from alpha.interfaces.cache import CacheBackend
+from alpha.interfaces.http_client import HTTPResponse
+
+T = TypeVar("T", bound=BaseDomainModel)
+
+RESPONSE_CACHE_PREFIX = "rest:GET:"
+"""The prefix of the keys of the response cache of the REST API
+repositories."""
+
+
+class RestApiRepositoryMixin:
+    """The configuration of a REST API repository, and the methods which
+    build the URLs, serialize the objects, handle the responses, map them to
+    domain models and use the response cache.
+
+    The methods do not send requests, so they are shared by the
+    `RestApiRepository` and the `AsyncRestApiRepository`, which send the
+    requests with a synchronous and an asyncio HTTP client. The methods
+    which use the response cache block, so the asyncio repository calls
+    them in a worker thread.
+    """
+
+    client: Any
+
+    def __init__(
+        self,
+        host: str,
+        client: Any,
+        scheme: str | None = None,
+        base_path: str = "",
+        endpoint: str = "",
+        default_model: DomainModel | None = None,
+        use_factory: bool = True,
+        serialize: bool = True,
+        model_factory_method_name: str = "from_dict",
+        model_serialization_method_name: str = "to_dict",
+        request_headers: dict[str, str] | None = None,
+        request_cookies: dict[str, str] | None = None,
+        response_data_attribute: str | None = None,
+        pagination: Pagination | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: CacheBackend | None = None,
+    ) -> None:
+        """Configure the repository, and add the default headers and cookies
+        to the HTTP client. The parameters are described by
+        `RestApiRepository`."""
+        self._host = host
+        self._scheme = scheme or "https"
+        self._base_path = base_path
+        self._endpoint = endpoint
+        self._default_model = default_model
+        self._use_factory = use_factory
+        self._serialize = serialize
+        self._model_factory_method_name = model_factory_method_name
+        self._model_serialization_method_name = model_serialization_method_name
+
+        # Expose the underlying client publicly for consistency with other
+        # repositories
+        self.client = client
+        # Preserve the deprecated public session alias for backward
+        # compatibility
+        self.session = client
+
+        self._request_headers = request_headers or {}
+        self._request_cookies = request_cookies or {}
+        self._response_data_attribute = response_data_attribute
+        self._pagination = pagination or LinkHeaderPagination()
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._response_cache = response_cache
+        # Update client with default headers and cookies
+        self.client.headers.update(request_headers or {})
+        if request_cookies:
+            cookies = self.client.cookies
+            # If the client's cookies object supports the `update` method and
+            # is not a `RequestsCookieJar`, use `update`. Otherwise, if it's a
+            # `RequestsCookieJar`, use `cookiejar_from_dict` to update it.
+            # This ensures compatibility with different types of cookie
+            # implementations that may be used by various HTTP clients.
+            if hasattr(cookies, "update") and not isinstance(
+                cookies, RequestsCookieJar
+            ):
+                cookies.update(request_cookies)
+            elif isinstance(cookies, RequestsCookieJar):
+                cookiejar_from_dict(
+                    request_cookies,
+                    cookiejar=cookies,
+                    overwrite=True,
+                )
+
+    def _read_page(
+        self, response: HTTPResponse
+    ) -> tuple[HTTPResponse, Any, list[Any]]:
+        """Read the body and the items of a page of a collection. The
+        body is decoded once, and the items are read from the
+        `response_data_attribute` of the body, if configured.
+
+        Parameters
+        ----------
+        response
+            The response of the page.
+
+        Returns
+        -------
+            The response, the decoded JSON body of the response, and the items
+            of the page.
+        """
+        if response.status_code not in (200, 201, 202):
+            self._handle_response(response)
+            return response, None, []
+
+        body = response.json()
+        items = body
+        if self._response_data_attribute and isinstance(body, dict):
+            items = body.get(self._response_data_attribute)
+        return response, body, list(items or [])
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        kwargs: dict[str, Any],
+        response: HTTPResponse | None = None,
+        exc: BaseException | None = None,
+    ) -> float | None:
+        """Get the delay before retrying a failed request, or None when the
+        request is not retried."""
+        if not self._retry_policy:
+            return None
+        return self._retry_policy.retry_delay(
+            method,
+            attempt,
+            headers=kwargs.get("headers"),
+            response=response,
+            exception=exc,
+        )
+
+    def _response_cache_key(
+        self,
+        url: str,
+        additional_request_params: dict[str, Any] | None = None,
+    ) -> str | None:
+        """Get the key under which the cached response of a GET request is
+        stored, or None when the response is not cached.
+
+        Every variant of a resource has its own key, which is a hash of the
+        URL and of the headers and cookies of the request, like the
+        `Authorization` header, so a response is only returned for the same
+        credentials. The keys contain the generation of the resource, which
+        is replaced by `_invalidate_cached_responses`, so a change of the
+        resource invalidates all its variants at once. The variants of
+        earlier generations expire in the backend. Requests with an `auth`
+        handler are not cached, because its credentials are not known.
+        """
+        if self._response_cache is None:
+            return None
+        params = additional_request_params or {}
+        if params.get("auth") or getattr(self.client, "auth", None):
+            return None
+
+        headers = {
+            str(name).lower(): str(value)
+            for headers in (self.client.headers, params.get("headers") or {})
+            for name, value in headers.items()
+        }
+        cookies = dict((getattr(self.client, "cookies", None) or {}).items())
+        cookies.update(params.get("cookies") or {})
+        variant = json.dumps(
+            [url, sorted(headers.items()), sorted(cookies.items())],
+            default=str,
+        )
+
+        resource = RESPONSE_CACHE_PREFIX + url.split("?", 1)[0].rstrip("/")
+        generation = self._response_cache.get(resource)
+        if not isinstance(generation, str):
+            generation = uuid4().hex
+            self._response_cache.set(resource, generation)
+        digest = hashlib.sha256(variant.encode()).hexdigest()
+        return f"{resource}#{generation}:{digest}"
+
+    def _cached_response(self, key: str | None) -> CachedResponse | None:
+        """Get a cached response from the response cache."""
+        if key is None or self._response_cache is None:
+            return None
+        cached = self._response_cache.get(key)
+        return cached if isinstance(cached, CachedResponse) else None
+
+    def _conditional_request_params(
+        self,
+        cached: CachedResponse | None,
+        additional_request_params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Add the validators of a stale cached response to the headers of
+        a request, so the API can respond with `304 Not Modified`."""
+        params = dict(additional_request_params or {})
+        if cached is not None and cached.validators:
+            params["headers"] = {
+                **(params.get("headers") or {}),
+                **cached.validators,
+            }
+        return params
+
+    def _cache_response(
+        self,
+        key: str | None,
+        response: HTTPResponse,
+        data: Any,
+        cached: CachedResponse | None = None,
+    ) -> None:
+        """Store the response of a GET request in the response cache, or
+        remove the cached response when the response may not be stored."""
+        if key is None or self._response_cache is None:
+            return
+        if response.status_code not in (200, 304):
+            return
+        entry = CachedResponse.from_response(response, data, cached)
+        if entry is not None:
+            self._response_cache.set(key, entry)
+        elif cached is not None:
+            self._response_cache.delete(key)
+
+    def _invalidate_cached_responses(self, method: str, url: str) -> None:
+        """Invalidate the cached responses of a resource and its collection,
+        with all query parameters, before a request which may change the
+        resource, by removing the generations of their keys."""
+        if self._response_cache is None or method in ("GET", "HEAD"):
+            return
+        resource = url.split("?", 1)[0].rstrip("/")
+        collection = resource.rsplit("/", 1)[0]
+        self._response_cache.delete(
+            RESPONSE_CACHE_PREFIX + resource,
+            RESPONSE_CACHE_PREFIX + collection,
+        )
+
+    def _map_response_object(self, response: Any, model: T | None) -> T:
+        """Map a single object from the API response to a model instance.
+
+        Parameters
+        ----------
+        response
+            The API response containing the data to be mapped.
+        model
+            The model class to which the data should be mapped. If None, the
+            default model for the repository will be used.
+
+        Returns
+        -------
+            An instance of the model populated with the data from the API
+            response.
+        """
+        model_to_use = self._determine_model(model)
+
+        return getattr(model_to_use, self._model_factory_method_name)(response)
+
+    def _map_response_array(
+        self, response: list[Any], model: T | None
+    ) -> list[T]:
+        """Map an array of objects from the API response to model instances.
+
+        Parameters
+        ----------
+        response
+            The API response containing the data to be mapped.
+        model
+            The model class to which the data should be mapped. If None, the
+            default model for the repository will be used.
+
+        Returns
+        -------
+            A list of model instances populated with the data from the API
+            response.
+        """
+        model_to_use = self._determine_model(model)
+
+        return [
+            getattr(model_to_use, self._model_factory_method_name)(item)
+            for item in response
+        ]
+
+    def _build_url(
+        self,
+        endpoint: str | None = None,
+        param: str | int | UUID | None = None,
+        parent_endpoint: str | None = None,
+        parent_param: str | int | UUID | None = None,
+        **params: Any,
+    ) -> str:
+        """Build an URL to use for HTTP requests.
+
+        The method constructs the URL based on the provided endpoint and
+        parameter, as well as the base host, scheme, and base path configured
+        for the repository. The endpoint and parameter are optional, allowing
+        for flexible URL construction. The method ensures that the URL is
+        properly formatted and can be used for making API requests.
+
+        The method detects if the scheme is provided and constructs the URL
+        accordingly. If a scheme is provided, it will be included in the URL.
+        If not, the URL will be constructed without a scheme, allowing for
+        relative URLs or URLs with a different scheme. If the scheme is already
+        included in the host, it will not be replaced.
+
+        An optional parent endpoint and parameter can be included in the URL,
+        which is useful for nested resources. The parent parameter will be
+        appended after the parent endpoint, and the main parameter will be
+        appended after the main endpoint.
+
+        Parameters
+        ----------
+        endpoint
+            The endpoint to use for the URL, by default None
+        param
+            The parameter to append to the URL, by default None
+        parent_endpoint
+            An optional parent endpoint to include in the URL, by default None
+        parent_param
+            An optional parameter to append after the parent endpoint,
+            by default None
+        **params
+            Additional parameters that can be used for query parameters.
+
+        Returns
+        -------
+            The constructed URL as a string
+        """
+        if self._scheme and not self._host.__contains__("://"):
+            url = f"{self._scheme}://{self._host}"
+        else:
+            url = self._host
+
+        endpoint = endpoint or self._endpoint
+
+        if self._base_path:
+            url = urljoin(url, self._base_path.strip("/") + "/")
+
+        if parent_endpoint:
+            url = urljoin(url, parent_endpoint.lstrip("/"))
+
+        if parent_param is not None:
+            url = urljoin(url + "/", str(parent_param))
+
+        if endpoint:
+            url = urljoin(url + "/", endpoint.lstrip("/"))
+
+        if param is not None:
+            url = urljoin(url + "/", str(param))
+
+        if params:
+            url = url + "?" + urlencode(params, doseq=True)
+
+        return url
+
+    def _serialize_object(self, obj: Any) -> Any:
+        """Serialize an object using the specified serialization method if it
+        exists.
+
+        Parameters
+        ----------
+        obj
+            The object to be serialized.
+
+        Returns
+        -------
+            The serialized object if the serialization method exists, otherwise
+            the original object.
+        """
+        if hasattr(obj, self._model_serialization_method_name):
+            return getattr(obj, self._model_serialization_method_name)()
+        return obj
+
+    def _get_data_from_response(
+        self, response: HTTPResponse
+    ) -> dict[str, Any] | None:
+        """Extract data from the API response. If the response_data_attribute
+        is configured, it will return the value of that attribute. Otherwise,
+        it will return the entire response data.
+
+        Parameters
+        ----------
+        response
+            The API response object.
+
+        Returns
+        -------
+            The extracted data from the API response.
+        """
+        data: dict[str, Any] = response.json()
+        if self._response_data_attribute:
+            return data.get(self._response_data_attribute)
+        return data
+
+    def _determine_serialization(
+        self,
+        serialize: bool | None,
+    ) -> bool:
+        """Determine to use the serialize variable or self._serialize for
+        deciding whether to serialize the object before sending it in the API
+        request.
+
+        Parameters
+        ----------
+        serialize
+            Whether to serialize the object before sending it in the API
+            request.
+
+        Returns
+        -------
+            The value to use for deciding whether to serialize the object before
+            sending it in the API request.
+        """
+        return serialize if serialize is not None else self._serialize
+
+    def _determine_use_factory(
+        self,
+        use_factory: bool | None,
+    ) -> bool:
+        """Determine to use the use_factory variable or self._use_factory for
+        deciding whether to use the model factory method for creating models.
+
+        Parameters
+        ----------
+        use_factory
+            Whether to use the model factory method for creating models from
+            response data.
+
+        Returns
+        -------
+            The value to use for deciding whether to use the model factory
+            method for creating models from response data.
+        """
+        return use_factory if use_factory is not None else self._use_factory
+
+    def _determine_model(self, model: T | None) -> T:
+        """Determine the model to use for mapping response data.
+
+        Parameters
+        ----------
+        model
+            The model class to which the data should be mapped. If None, the
+            default model for the repository will be used.
+
+        Returns
+        -------
+             The model class to use for mapping response data.
+
+        Raises
+        ------
+        ValueError
+            If no model is provided and no default model is set for the
+            repository.
+        AttributeError
+            If the determined model does not have the required factory method
+            defined.
+        """
+        if not model and not self._default_model:
+            raise ValueError(
+                "No model provided for mapping response and no default model "
+                "set for the repository."
+            )
+
+        model_to_use = cast(T, model or self._default_model)
+
+        if not hasattr(model_to_use, self._model_factory_method_name):
+            raise AttributeError(
+                f"The model {model_to_use} does not have the factory method "
+                f"'{self._model_factory_method_name}' defined. Please ensure "
+                f"that the model has this method or set the correct "
+                f"model_factory_method_name for the repository."
+            )
+
+        return model_to_use
+
+    def _handle_response(
+        self,
+        response: HTTPResponse,
+        cached: CachedResponse | None = None,
+    ) -> Any | None:
+        """Handle the API response and extract the relevant data.
+
+        In addition to extracting data from successful responses, this method
+        also handles various HTTP error responses by raising appropriate
+        exceptions based on the status code of the response. This ensures that
+        the caller can handle different error scenarios in a structured way.
+
+        Parameters
+        ----------
+        response
+            The API response object to be processed.
+        cached
+            The cached response which was revalidated by the request, by
+            default None. Its data is returned when the API responds with
+            `304 Not Modified`.
+
+        Returns
+        -------
+            The processed data extracted from the API response.
+
+        Raises
+        ------
+        exceptions.BadRequestException
+            If the API response indicates a bad request (HTTP status code 400).
+        exceptions.UnauthorizedException
+            If the API response indicates an unauthorized request (HTTP status
+            code 401).
+        exceptions.ForbiddenException
+            If the API response indicates a forbidden request (HTTP status code
+            403).
+        exceptions.NotFoundException
+            If the API response indicates that the requested resource was not
+            found (HTTP status code 404).
+        exceptions.MethodNotAllowedException
+            If the API response indicates that the HTTP method is not allowed
+            (HTTP status code 405).
+        exceptions.NotAcceptableException
+            If the API response indicates that the requested resource is not
+            acceptable (HTTP status code 406).
+        exceptions.ConflictException
+            If the API response indicates a conflict with the current state of
+            the resource (HTTP status code 409).
+        exceptions.PayloadTooLargeException
+            If the API response indicates that the request payload is too large
+            (HTTP status code 413).
+        exceptions.UnprocessableContentException
+            If the API response indicates that the server cannot process the
+            contained instructions (HTTP status code 422).
+        exceptions.InternalServerErrorException
+            If the API response indicates an internal server error (HTTP status
+            code 500).
+        exceptions.NotImplementedException
+            If the API response indicates that the server does not support the
+            functionality required to fulfill the request (HTTP status code
+            501).
+        exceptions.BadGatewayException
+            If the API response indicates a bad gateway error (HTTP status code
+            502).
+        exceptions.ServiceUnavailableException
+            If the API response indicates that the service is unavailable (HTTP
+            status code 503).
+        exceptions.GatewayTimeoutException
+            If the API response indicates a gateway timeout error (HTTP status
+            code 504).
+        exceptions.ClientErrorException
+            If the API response indicates a client error that is not
+            specifically handled by the above exceptions.
+        exceptions.ServerErrorException
+            If the API response indicates a server error that is not
+            specifically handled by the above exceptions.
+        """
+        match response.status_code:
+            case 200 | 201 | 202:
+                return self._get_data_from_response(response)
+            case 204:
+                return None
+            case 304 if cached is not None:
+                return cached.data
+            case 400:
+                raise exceptions.BadRequestException(
+                    "Bad request: The server could not understand the request due "
+                    "to invalid syntax."
+                )
+            case 401:
+                raise exceptions.UnauthorizedException(
+                    "Unauthorized: The client must authenticate itself to get the "
+                    "requested response."
+                )
+            case 403:
+                raise exceptions.ForbiddenException(
+                    "Forbidden: The client does not have access rights to the "
+                    "content."
+                )
+            case 404:
+                raise exceptions.NotFoundException(
+                    "Not Found: The server can not find the requested resource."
+                )
+            case 405:
+                raise exceptions.MethodNotAllowedException(
+                    "Method Not Allowed: The request method is known by the server "
+                    "but is not supported by the target resource."
+                )
+            case 406:
+                raise exceptions.NotAcceptableException(
+                    "Not Acceptable: The server cannot produce a response matching "
+                    "the list of acceptable values defined in the request's "
+                    "proactive content negotiation headers."
+                )
+            case 409:
+                raise exceptions.ConflictException(
+                    "Conflict: The request could not be completed due to a conflict "
+                    "with the current state of the target resource."
+                )
+            case 413:
+                raise exceptions.PayloadTooLargeException(
+                    "Payload Too Large: The request entity is larger than limits "
+                    "defined by the server."
+                )
+            case 422:
+                raise exceptions.UnprocessableContentException(
+                    "Unprocessable Content: The server understands the content type "
+                    "of the request entity, and the syntax of the request entity is "
+                    "correct, but it was unable to process the contained instructions."
+                )
+            case 500:
+                raise exceptions.InternalServerErrorException(
+                    "Internal Server Error: The server has encountered a situation "
+                    "it doesn't know how to handle."
+                )
+            case 501:
+                raise exceptions.NotImplementedException(
+                    "Not Implemented: The server does not support the functionality "
+                    "required to fulfill the request."
+                )
+            case 502:
+                raise exceptions.BadGatewayException(
+                    "Bad Gateway: The server was acting as a gateway or proxy and "
+                    "received an invalid response from the upstream server."
+                )
+            case 503:
+                raise exceptions.ServiceUnavailableException(
+                    "Service Unavailable: The server is not ready to handle the "
+                    "request. Common causes are a server that is down for "
+                    "maintenance or that is overloaded."
+                )
+            case 504:
+                raise exceptions.GatewayTimeoutException(
+                    "Gateway Timeout: The server was acting as a gateway or proxy and "
+                    "did not receive a timely response from the upstream server."
+                )
+            case _:
+                status_code = response.status_code
+                if 300 <= status_code < 400:
+                    # Unexpected redirect or other 3xx status not explicitly handled above.
+                    raise exceptions.ClientErrorException(
+                        f"Unexpected redirect or 3xx HTTP status code: {status_code}"
+                    )
+                if 400 <= status_code < 500:
+                    # Generic client error for 4xx statuses not explicitly handled above.
+                    raise exceptions.ClientErrorException(
+                        f"An HTTP client error occurred (status code {status_code})."
+                    )
+                if 500 <= status_code < 600:
+                    # Generic server error for 5xx statuses not explicitly handled above.
+                    raise exceptions.ServerErrorException(
+                        f"An HTTP server error occurred (status code {status_code})."
+                    )
+                # Any other unexpected status code (e.g., 1xx or outside normal ranges).
+                raise exceptions.ClientErrorException(
+                    f"Unexpected HTTP status code: {status_code}"
+                )
@@ -1,20 +1,59 @@
 """Contains the SqlAlchemyRepository implementation which provides
 basic CRUD operations for domain models using SqlAlchemy."""
 
+import copy
+import datetime
+import io
+import itertools
 import json
 import logging
 from enum import Enum
-from typing import Any, Generic, Iterable, cast
+from typing import (
+    Any,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    cast,
+)
 from uuid import UUID
 
-from sqlalchemy import BinaryExpression, ColumnElement, ColumnOperators
-from sqlalchemy.exc import IntegrityError
+import pandas as pd
+from sqlalchemy import (
+    BinaryExpression,
+    ColumnElement,
+    ColumnOperators,
+    and_,
+    bindparam,
+    inspect,
+    literal,
+    or_,
+    select,
+    text,
+    type_coerce,
+)
+from sqlalchemy import JSON, ARRAY, Enum as EnumType
+from sqlalchemy import Insert, LargeBinary, String, Table, insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import (
+    MANYTOONE,
     Query,
     Session,
+    SessionTransaction,
+    class_mapper,
+    defer as defer_option,
+    load_only as load_only_option,
+    raiseload,
 )
 from sqlalchemy.orm.attributes import InstrumentedAttribute
-from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.base import Generative
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement, UnaryExpression
+from sqlalchemy.sql.expression import Executable
 
 from alpha import exceptions
 from alpha.domain.models.base_model import (
@@ -22,15 +61,58 @@ from alpha.domain.models.base_model import (
     DomainModel,
 )
 from alpha.encoder import JSONEncoder
-from alpha.infra.models.order_by import OrderBy
-from alpha.infra.models.search_filter import SearchFilter
+from alpha.infra.models.order_by import DescendingOrder, OrderBy
+from alpha.infra.caches.model_cache import ModelCache
+from alpha.infra.caches.statement_cache import StatementCache
+from alpha.infra.connectors.routing_session import READ_ONLY_OPTION
+from alpha.infra.models.search_filter import (
+    InFilter,
+    NotInFilter,
+    Operator,
+    SearchFilter,
+)
+from alpha.infra.models.load_option import WILDCARD, LoadOption
 from alpha.infra.models.query_clause import QueryClause
 from alpha.infra.models.filter_operators import FilterOperator
+from alpha.interfaces.cache import CacheBackend
 from alpha.infra.models.json_patch import JsonPatch
 from alpha.interfaces.patchable import Patchable
 from alpha.interfaces.updatable import Updatable
 from alpha.utils.logging_level_checker import logging_level_checker as llc
 
+logger = logging.getLogger(__name__)
+
+BIND_PARAMETER_LIMITS: dict[str, int] = {
+    "sqlite": 999,
+    "oracle": 1000,
+    "mssql": 2100,
+    "postgresql": 32767,
+    "mysql": 65535,
+    "mariadb": 65535,
+}
+"""The maximum number of bound parameters in a statement per dialect. Older
+SQLite versions are limited to 999 parameters and Oracle only allows 1000
+expressions in an IN list."""
+
+
+class _Explain(Generative, Executable, ClauseElement):
+    """A PostgreSQL `EXPLAIN (FORMAT JSON)` statement of a select
+    statement, which is used to read the row estimate of the planner."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(
+    element: _Explain, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(
+        element.statement, **kwargs
+    )
+
 
 class SqlAlchemyRepository(Generic[DomainModel]):
     """SqlAlchemy repository implementation. Provides basic CRUD operations for
@@ -43,18 +125,37 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         - add
         - add_all
         - count
+        - exists
         - get
         - get_all
         - get_one
         - get_one_or_none
         - get_by_id
+        - get_many
+        - ingest
         - patch
         - remove
         - remove_all
         - select
+        - select_frame
+        - select_iter
         - update
+        - update_where
+        - upsert
         - view
 
+    The methods which read domain model instances accept `read_only=True`,
+    which allows the statements to be executed on a read replica when the
+    session of the repository is a `RoutingSession`.
+
+    The methods which read domain model instances also accept a `load` list
+    of `LoadOption` objects, which load relationships of the domain models
+    eagerly with `selectinload` or `joinedload`, or make them raise with
+    `raiseload` instead of lazy loading them. With `strict_loading=True`
+    all relationships which are not loaded by a `LoadOption` raise an
+    exception when they are accessed, so a query which would trigger a lazy
+    load per object is detected instead of executed.
+
     You can also extend this repository to add custom methods by inheriting
     from it and adding your own methods.
 
@@ -72,7 +173,18 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         repository.
     """
 
-    def __init__(self, session: Session, default_model: DomainModel) -> None:
+    statement_cache: StatementCache = StatementCache()
+
+    def __init__(
+        self,
+        session: Session,
+        default_model: DomainModel,
+        chunk_size: int = 1000,
+        statement_cache: StatementCache | None = None,
+        cache: CacheBackend | None = None,
+        cache_keys: Iterable[str] = ("id",),
+        strict_loading: bool = False,
+    ) -> None:
         """Initialize the SqlAlchemyRepository with a database session and a
         default domain model type. The session is used for all database
         interactions, and the default model is used for operations where no
@@ -85,9 +197,39 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             The SQLAlchemy session used for database interactions.
         default_model
             The default domain model type for the repository.
+        chunk_size
+            The default number of objects which are sent to the database in
+            a single batch by bulk operations, by default 1000
+        statement_cache
+            The cache in which the statements for query shapes are stored, by
+            default None which results in using the cache that is shared by
+            all repository instances
+        cache
+            The key-value store which is used as read-through cache for the
+            `get` methods, by default None which disables the cache
+        cache_keys
+            The attributes by which domain model instances are cached, by
+            default ("id",). The values of these attributes have to be
+            unique. Only lookups by these attributes use the cache.
+        strict_loading
+            Whether relationships which are not loaded eagerly by a
+            `LoadOption` raise an `InvalidRequestError` of SQLAlchemy when
+            they are accessed, instead of being lazy loaded, by default
+            False. Related objects which are already in the session are
+            still returned.
         """
+        if chunk_size < 1:
+            raise ValueError("The chunk_size has to be a positive integer")
         self.session = session
         self._default_model = default_model
+        self._chunk_size = chunk_size
+        self._strict_loading = strict_loading
+        if statement_cache is not None:
+            self.statement_cache = statement_cache
+        self._cache: ModelCache | None = None
+        if cache is not None:
+            self._cache = ModelCache(backend=cache, keys=cache_keys)
+            self._cache.register(session, default_model)
 
     def add(
         self,
@@ -97,6 +239,11 @@ class SqlAlchemyRepository(Generic[DomainModel]):
     ) -> DomainModel | None:
         """Add a domain model instance to the database session.
 
+        When the object already exists the transaction is rolled back. In a
+        nested unit of work the object is flushed in a savepoint instead,
+        so only the object is discarded and the changes of the outer units
+        of work are kept.
+
         Parameters
         ----------
         obj
@@ -120,28 +267,29 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             add operation, indicating that the object already exists in the
             database.
         """
+        savepoint = self._begin_savepoint()
         try:
             self.session.add(obj)
             self.session.flush()
+            if savepoint is not None:
+                savepoint.commit()
             if return_obj:
                 self.session.refresh(obj)
             if llc("debug"):
-                logging.debug(
+                logger.debug(
                     "added object to database session: %s",
                     json.dumps(obj, cls=JSONEncoder),
                 )
-                logging.debug("flushed pending transaction to session")
+                logger.debug("flushed pending transaction to session")
             if return_obj:
                 if llc("debug"):
-                    logging.debug(
+                    logger.debug(
                         "refreshed object: %s",
                         json.dumps(obj, cls=JSONEncoder),
                     )
                 return obj
         except IntegrityError as exc:
-            self.session.rollback()
-            if llc("debug"):
-                logging.debug("rolled back pending transaction from session")
+            self._rollback_savepoint(savepoint)
             if raise_if_exists:
                 raise exceptions.AlreadyExistsException(exc)
         return None
@@ -151,9 +299,25 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         objs: list[DomainModel],
         return_obj: bool = False,
         raise_if_exists: bool = False,
+        chunk_size: int | None = None,
     ) -> list[DomainModel] | None:
         """Add multiple domain model instances to the database session.
 
+        The objects are flushed to the database in chunks. When `return_obj`
+        is True, every chunk is sent as a multi-row `INSERT ... RETURNING`
+        statement on databases which support it, or as a batched executemany
+        on databases which do not, and the generated values (like primary
+        keys) are populated on the objects without refreshing them one by
+        one.
+
+        Like `add`, a conflict rolls back the transaction, or only the
+        savepoint of the objects in a nested unit of work, and the objects
+        are removed from the session. Unless `raise_if_exists` is True, the
+        objects are then inserted with `INSERT ... ON CONFLICT DO NOTHING`
+        statements like `ingest`, which skip the rows that already exist.
+        These objects are not added to the session, their relationships are
+        not inserted and generated values are not populated on them.
+
         Parameters
         ----------
         objs
@@ -163,6 +327,9 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         raise_if_exists
             Whether to raise an exception if any object already exists, by
             default False
+        chunk_size
+            The number of objects to flush per batch, by default None which
+            results in using the chunk size of the repository
 
         Returns
         -------
@@ -177,48 +344,71 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             add operation, indicating that one or more objects already exist in
             the database.
         """
-        if return_obj:
-            objects: list[DomainModel] | None = []
-            for obj in objs:
-                object_ = self.add(
-                    obj=obj,
-                    return_obj=return_obj,
-                    raise_if_exists=raise_if_exists,
-                )
-                objects.append(object_)  # type: ignore
-            return objects
+        objs = list(objs)
+        savepoint = self._begin_savepoint()
         try:
-            self.session.bulk_save_objects(objs)
-            if llc("debug"):
-                logging.debug(
-                    "bulk added objects to database session: %s",
-                    json.dumps(objs, cls=JSONEncoder),
-                )
-            self.session.flush()
-            if llc("debug"):
-                logging.debug("flushed pending transactions to session")
+            for chunk in self._chunks(objs, chunk_size):
+                if return_obj:
+                    self.session.add_all(chunk)
+                else:
+                    self.session.bulk_save_objects(chunk)
+                if llc("debug"):
+                    logger.debug(
+                        "bulk added objects to database session: %s",
+                        json.dumps(chunk, cls=JSONEncoder),
+                    )
+                self.session.flush()
+                if llc("debug"):
+                    logger.debug("flushed pending transactions to session")
+            if savepoint is not None:
+                savepoint.commit()
         except IntegrityError as exc:
-            self.session.rollback()
-            if llc("debug"):
-                logging.debug("rolled back pending transaction from session")
+            self._rollback_savepoint(savepoint)
+            # Objects of the failed chunk which are still pending would be
+            # flushed again by the next flush of the session
+            for obj in objs:
+                state = inspect(obj, raiseerr=False)
+                if state is not None and state.pending:
+                    self.session.expunge(obj)
             if raise_if_exists:
                 raise exceptions.AlreadyExistsException(exc)
+            groups: dict[type, list[DomainModel]] = {}
             for obj in objs:
-                self.add(obj)
-        return None
+                groups.setdefault(type(obj), []).append(obj)
+            for model, group in groups.items():
+                self.ingest(
+                    group,
+                    model=model,  # type: ignore
+                    chunk_size=chunk_size,
+                    on_conflict="ignore",
+                )
+        return objs if return_obj else None
 
     def count(
         self,
         model: DomainModel | None = None,
+        estimate: bool = False,
         **kwargs: Any,
     ) -> int:
         """Count the number of records in the database for a given model and
         optional filters.
 
+        An exact count has to scan all matching rows. With `estimate=True`
+        the number is read from the statistics of the database instead,
+        which is much faster for large tables but can be outdated. On
+        PostgreSQL the estimate of an unfiltered count is read from
+        `pg_class.reltuples` and the estimate of a filtered count from the
+        row estimate of the query plan. On MySQL only unfiltered counts are
+        estimated, by using `information_schema.tables`. Otherwise an exact
+        count is returned.
+
         Parameters
         ----------
         model
             The domain model class to count records for, by default None
+        estimate
+            Whether to return an estimate from the statistics of the
+            database, by default False
 
         Returns
         -------
@@ -226,8 +416,47 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             The number of records in the database for the given model and
             filters.
         """
+        if estimate:
+            estimated = self._estimate_count(
+                model=model,
+                read_only=kwargs.pop("read_only", False),
+                **kwargs,
+            )
+            if estimated is not None:
+                return estimated
         return self._query(cursor_result="count", model=model, **kwargs)  # type: ignore
 
+    def exists(
+        self,
+        model: DomainModel | None = None,
+        **kwargs: Any,
+    ) -> bool:
+        """Check whether any record exists in the database for a given model
+        and optional filters.
+
+        The check uses a `SELECT EXISTS (... LIMIT 1)` statement, so the
+        database stops at the first matching row instead of counting all
+        of them.
+
+        Parameters
+        ----------
+        model
+            The domain model class to check records for, by default None
+
+        Returns
+        -------
+        bool
+            True when at least one record matches the filters.
+        """
+        read_only = kwargs.pop("read_only", False)
+        query = self._query(model=model, **kwargs)
+        statement = query.order_by(None).limit(1).exists()
+        return bool(
+            self.session.query(statement)
+            .execution_options(**{READ_ONLY_OPTION: read_only})
+            .scalar()
+        )
+
     def get(
         self,
         attr: str | InstrumentedAttribute[Any],
@@ -239,6 +468,9 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         """Retrieve a single domain model instance from the database based on a
         specified attribute and value.
 
+        When the repository has a cache and `attr` is one of its cache keys,
+        single results are read from and stored in the cache.
+
         Parameters
         ----------
         attr
@@ -257,10 +489,31 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         """
         if isinstance(attr, InstrumentedAttribute):
             attr = attr.key
+        read_only = kwargs.pop("read_only", False)
+        if (
+            self._cache
+            and attr in self._cache.keys
+            and cursor_result in ("first", "one", "one_or_none")
+            and not kwargs
+        ):
+            model = model or self._default_model
+            self._cache.register(self.session, model)
+            obj = self._cache.load(self.session, model, attr, value)
+            if obj is None:
+                obj = self._query(
+                    cursor_result=cursor_result,
+                    filter_by={attr: value},
+                    model=model,
+                    read_only=read_only,
+                )
+                if obj is not None:
+                    self._cache.store(self.session, obj)
+            return obj
         return self._query(
             cursor_result=cursor_result,
             filter_by={attr: value},
             model=model,
+            read_only=read_only,
             **kwargs,  # type: ignore
         )
 
@@ -405,6 +658,190 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             **kwargs,
         )
 
+    def get_many(
+        self,
+        values: Iterable[Any],
+        attr: str | InstrumentedAttribute[Any] = "id",
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+        read_only: bool = False,
+        load: list[LoadOption] | None = None,
+    ) -> list[DomainModel | None]:
+        """Retrieve multiple domain model instances from the database based on
+        a list of values of a specified attribute, by using as few queries as
+        possible.
+
+        Instances which are already loaded in the session (or stored in the
+        cache of the repository) are returned without querying the database.
+        The remaining values are retrieved with `IN` queries, which are
+        chunked by the maximum number of bound parameters of the database.
+
+        Parameters
+        ----------
+        values
+            The values to filter by. The values have to be of the same type as
+            the attribute of the domain model.
+        attr
+            The attribute to filter by, by default "id". The values of the
+            attribute have to be unique.
+        model
+            The domain model class to query, by default None
+        chunk_size
+            The maximum number of values per query, by default None which
+            results in using the maximum number of bound parameters of the
+            database
+        read_only
+            Whether the queries can be executed on a read replica of the
+            database, by default False
+        load
+            The load options of the relationships of the instances which
+            are retrieved from the database, by default None
+
+        Returns
+        -------
+        list[DomainModel | None]
+            The retrieved domain model instances in the order of the values,
+            with None for values which are not found.
+        """
+        if isinstance(attr, InstrumentedAttribute):
+            attr = attr.key
+        if not model:
+            model = self._default_model
+        values = list(values)
+
+        found = self._get_many_from_session(values, attr, model)
+        if self._cache and attr in self._cache.keys:
+            self._cache.register(self.session, model)
+            for value in values:
+                if value not in found:
+                    obj = self._cache.load(self.session, model, attr, value)
+                    if obj is not None:
+                        found[value] = obj
+
+        missing = list(dict.fromkeys(v for v in values if v not in found))
+        limit = BIND_PARAMETER_LIMITS.get(
+            self.session.get_bind().dialect.name, 999
+        )
+        size = min(chunk_size or limit, limit)
+        queried = 0
+        for ix in range(0, len(missing), size):
+            objs = self._query(
+                cursor_result="all",
+                model=model,
+                filters=[
+                    SearchFilter(
+                        op=Operator.IN,
+                        field=attr,
+                        value=missing[ix : ix + size],
+                    )
+                ],
+                read_only=read_only,
+                load=load,
+            )
+            queried += len(objs)
+            for obj in objs:
+                found[getattr(obj, attr)] = obj
+                if self._cache and attr in self._cache.keys:
+                    self._cache.store(self.session, obj)
+
+        if llc("debug"):
+            logger.debug(
+                "retrieved %s objects of which %s from the database",
+                len(found),
+                queried,
+            )
+        return [found.get(value) for value in values]
+
+    def ingest(
+        self,
+        data: pd.DataFrame | Iterable[Mapping[str, Any] | DomainModel],
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+        on_conflict: Literal["ignore", "update"] | None = None,
+        conflict_keys: list[str] | None = None,
+        update_columns: list[str] | None = None,
+    ) -> int:
+        """Insert rows into the table of a domain model without creating
+        domain model instances.
+
+        The rows are streamed to the database in chunks. On PostgreSQL with
+        the psycopg2 or psycopg driver the rows are sent with
+        `COPY ... FROM STDIN`, on other databases with a batched executemany
+        `INSERT` statement. Because the rows bypass the session, domain model
+        instances which are loaded in the session are not updated.
+
+        Parameters
+        ----------
+        data
+            A DataFrame, or an iterable of mappings or domain model
+            instances. The keys of the mappings and the columns of the
+            DataFrame are the attribute names of the domain model.
+        model
+            The domain model class of the table, by default None
+        chunk_size
+            The number of rows to send per batch, by default None which
+            results in using the chunk size of the repository
+        on_conflict
+            What to do with rows which conflict with existing rows, by
+            default None which results in raising an IntegrityError.
+            "ignore" skips conflicting rows and "update" updates the existing
+            rows. When set, `INSERT` statements are used instead of `COPY`.
+        conflict_keys
+            The attributes of the unique constraint used to detect conflicts,
+            by default None which results in using the primary key, or any
+            constraint when `on_conflict` is "ignore"
+        update_columns
+            The attributes to update when `on_conflict` is "update", by
+            default None which results in updating all inserted attributes
+            except the conflict keys
+
+        Returns
+        -------
+        int
+            The number of ingested rows.
+        """
+        if not model:
+            model = self._default_model
+        mapper = class_mapper(model)  # type: ignore
+        table = cast(Table, mapper.local_table)
+        dialect = self.session.get_bind().dialect
+
+        use_copy = (
+            on_conflict is None
+            and dialect.name == "postgresql"
+            and dialect.driver in ("psycopg2", "psycopg")
+            and not any(
+                isinstance(column.type, JSON | ARRAY | LargeBinary)
+                for column in table.columns
+            )
+        )
+
+        count = 0
+        for chunk in self._chunks_of_rows(data, mapper, chunk_size):
+            # Rows with different columns are sent by separate statements
+            for columns, group in itertools.groupby(chunk, key=tuple):
+                rows = list(group)
+                if use_copy:
+                    self._copy_rows(table, rows)
+                else:
+                    statement = self._insert_statement(
+                        table=table,
+                        columns=list(columns),
+                        on_conflict=on_conflict,
+                        conflict_keys=self._column_keys(mapper, conflict_keys),
+                        update_columns=self._column_keys(
+                            mapper, update_columns
+                        ),
+                    )
+                    self.session.execute(statement, rows)
+                count += len(rows)
+            if llc("debug"):
+                logger.debug("ingested %s rows into %s", count, table.name)
+
+        if self._cache and count:
+            self._cache.invalidate_all(self.session)
+        return count
+
     def patch(
         self, obj: Patchable[Any], patches: JsonPatch
     ) -> BaseDomainModel:
@@ -442,42 +879,294 @@ class SqlAlchemyRepository(Generic[DomainModel]):
     def remove_all(
         self,
         objs: list[DomainModel] | None = None,
+        model: DomainModel | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
         **kwargs: Any,
-    ) -> None:
+    ) -> int:
         """Remove multiple domain model instances from the database.
 
+        When no objects are supplied, the matching rows are removed by a
+        single `DELETE ... WHERE` statement which is compiled from the
+        filters, without loading the objects first. Objects in the session
+        which match the filters are removed from the session as well. When
+        query options other than `filter` and `filter_by` are used (like
+        `limit`), or when the session has to remove or update related rows
+        (like the rows of a many-to-many association table, or of a
+        relationship with a delete cascade), the matching objects are
+        selected and removed by the session instead.
+
         Parameters
         ----------
         objs
             The list of domain model instances to remove, by default None
+        model
+            The domain model class to remove instances of, by default None
+        filters
+            The list of filters to apply, by default None
+
+        Returns
+        -------
+        int
+            The number of removed rows.
         """
+        if (
+            not objs
+            and self._is_set_based(kwargs)
+            and not self._has_dependent_rows(model or self._default_model)
+        ):
+            query = self._query(model=model, filters=filters, **kwargs)
+            count: int = query.delete(synchronize_session="auto")
+            if self._cache:
+                self._cache.invalidate_all(self.session)
+            if llc("debug"):
+                logger.debug("removed %s rows from the database", count)
+            return count
+
         if not objs:
-            objs = self.select(**kwargs)  # type: ignore
+            objs = self.select(model=model, filters=filters, **kwargs)
         for obj in objs:
-            self.remove(obj)
+            self.session.delete(obj)
+        self.session.flush()
+        return len(objs)
 
     def select(
         self,
         model: DomainModel | None = None,
         cursor_result: str = "all",
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None = None,
+        defer: list[str | InstrumentedAttribute[Any]] | None = None,
         **kwargs: Any,
     ) -> list[DomainModel]:
         """Select domain model instances from the database based on optional
         filters.
 
+        Only the selected columns are loaded when `columns` is specified,
+        and the rows are returned as SQLAlchemy `Row` tuples, of which the
+        values can also be accessed by the column names, instead of domain
+        model instances. `load_only` and `defer` return domain model
+        instances of which only a part of the columns is loaded. The other
+        columns are loaded by an additional query when they are accessed.
+
         Parameters
         ----------
         model
             The domain model class to query, by default None
         cursor_result
             The type of result to return, by default "all"
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting domain model instances
+        load_only
+            The names or instrumented attributes of the only columns which
+            are loaded, by default None
+        defer
+            The names or instrumented attributes of the columns which are not
+            loaded, by default None
 
         Returns
         -------
         list[DomainModel]
-            The list of retrieved domain model instances.
+            The list of retrieved domain model instances, or the rows of the
+            selected columns.
+        """
+        return self._query(  # type: ignore
+            cursor_result=cursor_result,
+            model=model,
+            columns=columns,
+            load_only=load_only,
+            defer=defer,
+            **kwargs,
+        )
+
+    def select_frame(
+        self,
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        order_by: (
+            list[InstrumentedAttribute[Any] | UnaryExpression[Any] | OrderBy]
+            | None
+        ) = None,
+        model: DomainModel | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        as_arrow: bool = False,
+        batch_size: int = 10000,
+        read_only: bool = False,
+    ) -> Any:
+        """Select columns of a domain model as a pandas DataFrame or a
+        pyarrow Table.
+
+        The columns are selected by a column select statement, so no domain
+        model instances are created. The rows are fetched in batches and
+        the result is built column by column. Enum columns contain the names
+        of the enum members, as stored in the database.
+
+        Parameters
+        ----------
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting all columns of the model
+        filters
+            The list of filters to apply, by default None
+        order_by
+            The list of order by clauses, by default None
+        model
+            The domain model class to query, by default None
+        limit
+            The maximum number of rows to select, by default None
+        offset
+            The number of rows to skip, by default None
+        as_arrow
+            Whether to return a pyarrow Table instead of a pandas DataFrame,
+            by default False. Requires the pyarrow package.
+        batch_size
+            The number of rows to fetch per batch, by default 10000
+        read_only
+            Whether the statement can be executed on a read replica of the
+            database, by default False
+
+        Returns
+        -------
+        pandas.DataFrame | pyarrow.Table
+            The selected columns.
+
+        Raises
+        ------
+        exceptions.MissingDependencyException
+            When `as_arrow` is True and pyarrow is not installed
+        """
+        if as_arrow:
+            try:
+                import pyarrow as pa  # type: ignore
+            except ImportError:
+                raise exceptions.MissingDependencyException(
+                    "The pyarrow package is required to select an Arrow "
+                    "table. Install it by using the 'arrow' extra"
+                )
+        if not model:
+            model = self._default_model
+
+        mapper = class_mapper(model)  # type: ignore
+        keys = [
+            column.key if isinstance(column, InstrumentedAttribute) else column
+            for column in columns or [prop.key for prop in mapper.column_attrs]
+        ]
+        selected = []
+        for key in keys:
+            column = mapper.columns[key]
+            if isinstance(column.type, EnumType):
+                selected.append(type_coerce(column, String).label(key))
+            else:
+                selected.append(column.label(key))
+
+        statement = select(*selected)
+        if filters:
+            statement = statement.where(
+                *self._process_filters(filters=filters, model=model)  # type: ignore
+            )
+        if order_by:
+            statement = statement.order_by(
+                *[
+                    self._order_statement(order)
+                    for order in self._set_order_model(order_by, model)
+                ]
+            )
+        if limit is not None:
+            statement = statement.limit(limit)
+        if offset is not None:
+            statement = statement.offset(offset)
+
+        values: list[list[Any]] = [[] for _ in keys]
+        result = self.session.execute(
+            statement.execution_options(
+                stream_results=True,
+                max_row_buffer=batch_size,
+                **{READ_ONLY_OPTION: read_only},
+            )
+        )
+        for partition in result.partitions(batch_size):
+            for ix, column_values in enumerate(zip(*partition)):
+                values[ix].extend(column_values)
+
+        data = dict(zip(keys, values))
+        if as_arrow:
+            return pa.table(data)
+        return pd.DataFrame(data, columns=keys)
+
+    def select_iter(
+        self,
+        model: DomainModel | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        order_by: (
+            list[InstrumentedAttribute[Any] | UnaryExpression[Any] | OrderBy]
+            | None
+        ) = None,
+        batch_size: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[DomainModel]:
+        """Iterate over domain model instances from the database in batches
+        by using keyset (seek) pagination.
+
+        Instead of loading all matching rows at once, the rows are fetched in
+        pages of `batch_size` rows. Every page continues where the previous
+        page ended by filtering on the values of the ordering columns of the
+        last row, so the cost of fetching a page does not increase with the
+        position in the result set like it does with OFFSET. The primary key
+        columns of the model are appended to the ordering columns to make the
+        ordering unique. Each page is read through a server-side cursor when
+        the database driver supports it.
+
+        The ordering columns should not contain NULL values, because NULL
+        values can not be compared by the keyset filter.
+
+        Parameters
+        ----------
+        model
+            The domain model class to query, by default None
+        filters
+            The list of filters to apply, by default None
+        order_by
+            The columns to order and paginate by, by default None which
+            results in ordering by the primary key columns
+        batch_size
+            The number of rows to fetch per page, by default 1000
+
+        Yields
+        ------
+        DomainModel
+            The retrieved domain model instances.
         """
-        return self._query(cursor_result=cursor_result, model=model, **kwargs)  # type: ignore
+        if batch_size < 1:
+            raise ValueError("The batch_size has to be a positive integer")
+        if not model:
+            model = self._default_model
+
+        columns = self._keyset_columns(model=model, order_by=order_by or [])
+        query: Query[Any] = self._query(model=model, filters=filters, **kwargs)
+        query = query.order_by(
+            *[attr.desc() if desc else attr.asc() for attr, desc in columns]
+        )
+
+        last_values: list[Any] | None = None
+        while True:
+            page = query
+            if last_values is not None:
+                page = page.filter(
+                    self._keyset_filter(columns=columns, values=last_values)
+                )
+
+            count = 0
+            for obj in page.limit(batch_size).yield_per(batch_size):
+                count += 1
+                last_values = [getattr(obj, attr.key) for attr, _ in columns]
+                yield obj
+
+            if llc("debug"):
+                logger.debug("fetched a page of %s rows", count)
+
+            if count < batch_size:
+                return
 
     def update(self, obj: Updatable, new: DomainModel) -> DomainModel:
         """Update a domain model instance with new data.
@@ -499,14 +1188,152 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         self.session.refresh(obj)
         return obj
 
+    def update_where(
+        self,
+        values: dict[str | InstrumentedAttribute[Any], Any],
+        model: DomainModel | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Update all rows which match the filters with the same values by
+        using a single `UPDATE ... WHERE` statement.
+
+        The objects are not loaded from the database. Objects in the session
+        which match the filters are updated as well. Because the session does
+        not take part in the statement, relationship cascades and ORM events
+        of the objects are skipped.
+
+        Parameters
+        ----------
+        values
+            The attributes and their new values
+        model
+            The domain model class to update instances of, by default None
+        filters
+            The list of filters to apply, by default None
+
+        Returns
+        -------
+        int
+            The number of updated rows.
+
+        Raises
+        ------
+        ValueError
+            When query options other than `filter` and `filter_by` are used
+        """
+        if not self._is_set_based(kwargs):
+            raise ValueError(
+                "Only the 'filters', 'filter' and 'filter_by' arguments can "
+                "be used to select the rows to update"
+            )
+        query = self._query(model=model, filters=filters, **kwargs)
+        count: int = query.update(values, synchronize_session="auto")
+        if self._cache:
+            self._cache.invalidate_all(self.session)
+        if llc("debug"):
+            logger.debug("updated %s rows in the database", count)
+        return count
+
+    def upsert(
+        self,
+        obj_or_objs: (
+            DomainModel
+            | Mapping[str, Any]
+            | Iterable[DomainModel | Mapping[str, Any]]
+        ),
+        conflict_keys: list[str] | None = None,
+        update_columns: list[str] | None = None,
+        model: DomainModel | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Insert domain model instances, or update the existing rows when
+        they conflict with rows in the database.
+
+        The rows are sent in chunks by using a single
+        `INSERT ... ON CONFLICT DO UPDATE` statement per chunk on PostgreSQL
+        and SQLite, and `INSERT ... ON DUPLICATE KEY UPDATE` on MySQL. The
+        instances are not added to the session. Instances of the domain model
+        which are already loaded in the session are expired, so they are
+        refreshed when accessed.
+
+        Parameters
+        ----------
+        obj_or_objs
+            A domain model instance or mapping of attribute values, or an
+            iterable of them
+        conflict_keys
+            The attributes of the unique constraint used to detect conflicts,
+            by default None which results in using the primary key. On MySQL
+            any unique constraint is used.
+        update_columns
+            The attributes to update when a row conflicts, by default None
+            which results in updating all inserted attributes except the
+            conflict keys
+        model
+            The domain model class of the table, by default None
+        chunk_size
+            The number of rows to send per statement, by default None which
+            results in using the chunk size of the repository
+
+        Returns
+        -------
+        int
+            The number of inserted or updated rows.
+
+        Raises
+        ------
+        NotImplementedError
+            When the database does not support upserts
+        """
+        if isinstance(obj_or_objs, Mapping) or not isinstance(
+            obj_or_objs, Iterable
+        ):
+            obj_or_objs = [obj_or_objs]
+        if not model:
+            model = self._default_model
+        mapper = class_mapper(model)  # type: ignore
+        table = cast(Table, mapper.local_table)
+
+        # Pending changes are written first, so they are not overwritten
+        # when the instances in the session are expired
+        self.session.flush()
+        count = 0
+        for chunk in self._chunks_of_rows(obj_or_objs, mapper, chunk_size):
+            for columns, group in itertools.groupby(chunk, key=tuple):
+                rows = list(group)
+                statement = self._insert_statement(
+                    table=table,
+                    columns=list(columns),
+                    on_conflict="update",
+                    conflict_keys=self._column_keys(mapper, conflict_keys),
+                    update_columns=self._column_keys(mapper, update_columns),
+                )
+                self.session.execute(statement, rows)
+                count += len(rows)
+        if not count:
+            return 0
+
+        for obj in list(self.session.identity_map.values()):
+            if isinstance(obj, mapper.class_):
+                self.session.expire(obj)
+        if self._cache:
+            self._cache.invalidate_all(self.session)
+        if llc("debug"):
+            logger.debug("upserted %s rows into %s", count, table.name)
+        return count
+
     def view(
         self,
         model: DomainModel,
         cursor_result: str = "all",
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None = None,
+        defer: list[str | InstrumentedAttribute[Any]] | None = None,
         **kwargs: Any,
     ) -> list[DomainModel]:
         """View domain model instances from the database based on optional
-        filters.
+        filters. The columns are projected like by the `select` method.
 
         Parameters
         ----------
@@ -514,13 +1341,30 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             The domain model class to query.
         cursor_result
             The type of result to return, by default "all"
+        columns
+            The names or instrumented attributes of the columns to select, by
+            default None which results in selecting domain model instances
+        load_only
+            The names or instrumented attributes of the only columns which
+            are loaded, by default None
+        defer
+            The names or instrumented attributes of the columns which are not
+            loaded, by default None
 
         Returns
         -------
         list[DomainModel]
-            The list of retrieved domain model instances.
+            The list of retrieved domain model instances, or the rows of the
+            selected columns.
         """
-        return self._query(cursor_result=cursor_result, model=model, **kwargs)  # type: ignore
+        return self._query(  # type: ignore
+            cursor_result=cursor_result,
+            model=model,
+            columns=columns,
+            load_only=load_only,
+            defer=defer,
+            **kwargs,
+        )
 
     def _query(
         self,
@@ -534,6 +1378,10 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             | OrderBy
             | QueryClause
         ] = list(),
+        read_only: bool = False,
+        columns: list[str | InstrumentedAttribute[Any]] | None = None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None = None,
+        defer: list[str | InstrumentedAttribute[Any]] | None = None,
         **kwargs: Any,
     ) -> Any:
         """Select domain model instances from the database based on optional
@@ -565,6 +1413,17 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             The query object to use, by default None
         order_by
             The list of order by clauses, by default list()
+        read_only
+            Whether the query can be executed on a read replica of the
+            database, by default False
+        columns
+            The columns to select instead of the domain model, by default
+            None
+        load_only
+            The only columns of the domain model to load, by default None
+        defer
+            The columns of the domain model which are not loaded, by default
+            None
 
         Returns
         -------
@@ -574,6 +1433,23 @@ class SqlAlchemyRepository(Generic[DomainModel]):
         if not model:
             model = self._default_model
 
+        if cursor_result and query is None:
+            cached = self._cached_query(
+                model=model,
+                filters=filters,
+                order_by=order_by,
+                kwargs=kwargs,
+            )
+            if cached is not None:
+                if read_only:
+                    cached = cached.execution_options(
+                        **{READ_ONLY_OPTION: True}
+                    )
+                cached = self._project(
+                    cached, model, columns, load_only, defer
+                )
+                return getattr(cached, cursor_result)()
+
         subquery: Query[Any]
 
         if query:
@@ -623,38 +1499,450 @@ class SqlAlchemyRepository(Generic[DomainModel]):
             elif isinstance(order, InstrumentedAttribute | UnaryExpression):  # type: ignore
                 subquery = getattr(subquery, "order_by")(order)  # type: ignore
 
+        if read_only:
+            subquery = subquery.execution_options(**{READ_ONLY_OPTION: True})
+
+        subquery = self._project(subquery, model, columns, load_only, defer)
+
         # Process cursor_result parameter
         if cursor_result:
             return getattr(subquery, cursor_result)()  # type: ignore
 
         return subquery  # type: ignore
 
-    def _query_clause(
+    def _estimate_count(
         self,
-        clause: QueryClause,
-        query: Query[Any],
-        model: DomainModel,
-    ) -> Query[Any]:
-        """Apply a QueryClause to a query object.
+        model: DomainModel | None = None,
+        filters: Iterable[SearchFilter | FilterOperator] | None = None,
+        read_only: bool = False,
+        **kwargs: Any,
+    ) -> int | None:
+        """Estimate the number of records by using the statistics of the
+        database.
 
         Parameters
         ----------
-        clause
-            The QueryClause to apply.
-        query
-            The query object to apply the clause to.
         model
-            The domain model class to query, used to set the `_domain_model`
-            attribute of the QueryClause if it is not already set.
+            The domain model class to count records for, by default None
+        filters
+            The list of filters to apply, by default None
+        read_only
+            Whether the statistics can be read from a read replica of the
+            database, by default False
 
         Returns
         -------
-        Query[Any]
-            The query object with the QueryClause applied.
+        int | None
+            The estimated number of records, or None when the database can
+            not estimate the count
         """
-        if not clause._domain_model:  # type: ignore
-            clause.set_domain_model(model)
-        return clause.query_clause(query)
+        if not model:
+            model = self._default_model
+        table = cast(Table, class_mapper(model).local_table)  # type: ignore
+        dialect = self.session.get_bind().dialect
+        unfiltered = not filters and not any(kwargs.values())
+        options = {READ_ONLY_OPTION: read_only}
+
+        if dialect.name == "postgresql":
+            if unfiltered:
+                # reltuples is -1 when the table has never been analyzed
+                reltuples = self.session.execute(
+                    text(
+                        "SELECT reltuples FROM pg_class "
+                        "WHERE oid = to_regclass(:name)"
+                    ).execution_options(**options),
+                    {"name": dialect.identifier_preparer.format_table(table)},
+                ).scalar()
+                if reltuples is not None and reltuples >= 0:
+                    return int(reltuples)
+            query = self._query(model=model, filters=filters, **kwargs)
+            plan = self.session.execute(
+                _Explain(query.statement).execution_options(**options)
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])  # type: ignore
+
+        if dialect.name in ("mysql", "mariadb") and unfiltered:
+            table_rows = self.session.execute(
+                text(
+                    "SELECT table_rows FROM information_schema.tables "
+                    "WHERE table_schema = COALESCE(:schema, DATABASE()) "
+                    "AND table_name = :name"
+                ).execution_options(**options),
+                {"schema": table.schema, "name": table.name},
+            ).scalar()
+            if table_rows is not None:
+                return int(table_rows)
+
+        return None
+
+    def _cached_query(
+        self,
+        model: DomainModel,
+        filters: Iterable[SearchFilter | FilterOperator] | None,
+        order_by: list[Any],
+        kwargs: dict[str, Any],
+    ) -> Query[Any] | None:
+        """Get the query for the shape of the query arguments from the
+        statement cache, and bind the values of the arguments to it.
+
+        The shape of a query consists of the domain model, the type and
+        field of every filter and ordering clause, the keys of `filter_by`
+        and the use of `limit` and `offset`. The values are bound as
+        parameters, so queries which only differ in their values share the
+        same statement.
+
+        Parameters
+        ----------
+        model
+            Domain model type
+        filters
+            The filters as passed to the `_query` method
+        order_by
+            The ordering clauses as passed to the `_query` method
+        kwargs
+            The remaining query arguments as passed to the `_query` method
+
+        Returns
+        -------
+            The query bound to the session and the parameter values, or None
+            when the query arguments can not be parameterised
+        """
+        where: list[SearchFilter | FilterOperator] = list(filters or [])
+        orders: list[Any] = []
+        filter_by: dict[str, Any] = {}
+        limits: dict[str, int] = {}
+
+        for key, value in kwargs.items():
+            if not value:
+                break
+            items = value if isinstance(value, list) else [value]
+            if all(isinstance(item, SearchFilter) for item in items):
+                where.extend(items)
+            elif all(isinstance(item, OrderBy) for item in items):
+                orders.extend(items)
+            elif key == "filter_by" and isinstance(value, dict):
+                filter_by.update(value)  # type: ignore
+            elif key in ("limit", "offset") and type(value) is int:
+                limits[key] = value
+            else:
+                return None
+        orders.extend(order_by)
+
+        values: list[Any] = []
+        shape: list[Hashable] = [model]
+        for filter_ in where:
+            filter_shape = self._filter_shape(filter_, model, values)
+            if filter_shape is None:
+                return None
+            shape.append(filter_shape)
+        for order in orders:
+            order_shape = self._order_shape(order, model)
+            if order_shape is None:
+                return None
+            shape.append(order_shape)
+        for attr, value in filter_by.items():
+            if not self._is_bindable(value):
+                return None
+            shape.append(("filter_by", attr))
+            values.append(value)
+        for attr, value in limits.items():
+            shape.append(attr)
+            values.append(value)
+
+        query: Query[Any] | None = self.statement_cache.get(tuple(shape))
+        if query is None:
+            names = (f"p{ix}" for ix in itertools.count())
+            query = Query(model)  # type: ignore
+            query = query.filter(
+                *[self._bound_filter(f, model, names) for f in where]  # type: ignore
+            )
+            query = query.order_by(
+                *[self._order_statement(order) for order in orders]
+            )
+            if filter_by:
+                query = query.filter_by(
+                    **{attr: bindparam(next(names)) for attr in filter_by}
+                )
+            for attr in limits:
+                query = getattr(query, attr)(bindparam(next(names)))
+            self.statement_cache.set(tuple(shape), query)
+
+        return query.with_session(self.session).params(
+            {f"p{ix}": value for ix, value in enumerate(values)}
+        )
+
+    def _filter_shape(
+        self,
+        filter_: SearchFilter | FilterOperator,
+        model: DomainModel,
+        values: list[Any],
+    ) -> Hashable | None:
+        """Determine the shape of a filter and collect its values.
+
+        Parameters
+        ----------
+        filter_
+            A filter object
+        model
+            Domain model type
+        values
+            The list to which the values of the filter are appended
+
+        Returns
+        -------
+            The shape of the filter, or None when the filter can not be
+            parameterised
+        """
+        if isinstance(filter_, FilterOperator):
+            shapes: list[Hashable] = []
+            for filter_item in filter_.search_filters:
+                shape = self._filter_shape(filter_item, model, values)
+                if shape is None:
+                    return None
+                shapes.append(shape)
+            return (type(filter_), tuple(shapes))
+        if not isinstance(filter_, SearchFilter):  # type: ignore
+            return None
+        if not filter_._domain_model:  # type: ignore
+            filter_.set_domain_model(model)  # type: ignore
+        attr = filter_._instrumented_attr
+        if attr is None:
+            return None
+
+        value = filter_.value
+        if isinstance(filter_, InFilter | NotInFilter):
+            value = filter_._parse_list(value)
+        elif not self._is_bindable(value):
+            return None
+        values.append(value)
+        return (type(filter_), attr.class_, attr.key)
+
+    def _order_shape(self, order: Any, model: DomainModel) -> Hashable | None:
+        """Determine the shape of an ordering clause.
+
+        Parameters
+        ----------
+        order
+            An ordering clause
+        model
+            Domain model type
+
+        Returns
+        -------
+            The shape of the ordering clause, or None when the clause is not
+            supported
+        """
+        if isinstance(order, OrderBy):
+            if not order._domain_model:
+                order.set_domain_model(model)
+            attr = order._instrumented_attr
+            if attr is None:
+                return None
+            return (type(order), attr.class_, attr.key)
+        if isinstance(order, InstrumentedAttribute):
+            return (InstrumentedAttribute, order.class_, order.key)
+        if isinstance(order, UnaryExpression):  # type: ignore
+            return (UnaryExpression, order.modifier, order.element)
+        return None
+
+    def _set_order_model(
+        self, order_by: list[Any], model: DomainModel
+    ) -> list[Any]:
+        """Set the domain model of the OrderBy objects which have no domain
+        model.
+
+        Parameters
+        ----------
+        order_by
+            The list of order by clauses
+        model
+            Domain model type
+
+        Returns
+        -------
+            The list of order by clauses
+        """
+        for order in order_by:
+            if isinstance(order, OrderBy) and not order._domain_model:
+                order.set_domain_model(model)
+        return order_by
+
+    def _order_statement(self, order: Any) -> Any:
+        """Get the statement of an ordering clause.
+
+        Parameters
+        ----------
+        order
+            An OrderBy object, instrumented attribute or unary expression
+
+        Returns
+        -------
+            The ordering statement
+        """
+        if isinstance(order, OrderBy):
+            return order.filter_statement  # type: ignore
+        return order
+
+    def _bound_filter(
+        self,
+        filter_: SearchFilter | FilterOperator,
+        model: DomainModel,
+        names: Iterator[str],
+    ) -> ColumnElement[Any] | BinaryExpression[Any] | ColumnOperators:
+        """Create a filter statement in which the values are replaced by
+        bound parameters.
+
+        Parameters
+        ----------
+        filter_
+            A filter object
+        model
+            Domain model type
+        names
+            Generator of the names of the bound parameters
+
+        Returns
+        -------
+            Filter statement
+        """
+        if isinstance(filter_, FilterOperator):
+            filters = [
+                self._bound_filter(filter_item, model, names)
+                for filter_item in filter_.search_filters
+            ]
+            return filter_.filter_operator(*filters)  # type: ignore
+        bound = copy.copy(filter_)
+        bound.value = bindparam(
+            next(names), expanding=isinstance(filter_, InFilter | NotInFilter)
+        )
+        return bound.filter_statement
+
+    def _is_bindable(self, value: Any) -> bool:
+        """Check whether a value can be bound as a parameter without
+        changing the meaning of the statement. None values are compiled to
+        `IS NULL` and SQL expressions are compiled inline, so they are not
+        bindable.
+
+        Parameters
+        ----------
+        value
+            The value to check
+
+        Returns
+        -------
+            True when the value can be bound as a parameter
+        """
+        return value is not None and not isinstance(
+            value,
+            list | tuple | set | dict | ClauseElement | ColumnOperators,
+        )
+
+    def _query_clause(
+        self,
+        clause: QueryClause,
+        query: Query[Any],
+        model: DomainModel,
+    ) -> Query[Any]:
+        """Apply a QueryClause to a query object.
+
+        Parameters
+        ----------
+        clause
+            The QueryClause to apply.
+        query
+            The query object to apply the clause to.
+        model
+            The domain model class to query, used to set the `_domain_model`
+            attribute of the QueryClause if it is not already set.
+
+        Returns
+        -------
+        Query[Any]
+            The query object with the QueryClause applied.
+        """
+        if not clause._domain_model:  # type: ignore
+            clause.set_domain_model(model)
+        return clause.query_clause(query)
+
+    def _project(
+        self,
+        query: Query[Any],
+        model: DomainModel,
+        columns: list[str | InstrumentedAttribute[Any]] | None,
+        load_only: list[str | InstrumentedAttribute[Any]] | None,
+        defer: list[str | InstrumentedAttribute[Any]] | None,
+    ) -> Query[Any]:
+        """Limit the columns which are loaded by a query, and apply the
+        strict loading of the repository.
+
+        Parameters
+        ----------
+        query
+            The query of the domain model.
+        model
+            The domain model class of the query.
+        columns
+            The columns to select instead of the domain model.
+        load_only
+            The only columns of the domain model to load.
+        defer
+            The columns of the domain model which are not loaded.
+
+        Returns
+        -------
+        Query[Any]
+            The query which selects the columns, or the domain model with
+            the loader options of the columns.
+        """
+        if columns:
+            return query.with_entities(*self._attributes(columns, model))
+
+        # Relationships which are not loaded by a LoadOption raise on access,
+        # as do the columns which are not loaded
+        strict = self._strict_loading
+        if load_only:
+            query = query.options(
+                load_only_option(
+                    *self._attributes(load_only, model), raiseload=strict
+                )
+            )
+        if defer:
+            query = query.options(
+                *[
+                    defer_option(attr, raiseload=strict)
+                    for attr in self._attributes(defer, model)
+                ]
+            )
+        if strict:
+            query = query.options(raiseload(WILDCARD, sql_only=True))
+        return query
+
+    def _attributes(
+        self,
+        attrs: list[str | InstrumentedAttribute[Any]],
+        model: DomainModel,
+    ) -> list[InstrumentedAttribute[Any]]:
+        """Resolve the names of attributes to the instrumented attributes of
+        a domain model.
+
+        Parameters
+        ----------
+        attrs
+            The names or instrumented attributes.
+        model
+            The domain model class of the attributes.
+
+        Returns
+        -------
+        list[InstrumentedAttribute[Any]]
+            The instrumented attributes.
+        """
+        return [
+            getattr(model, attr) if isinstance(attr, str) else attr
+            for attr in attrs
+        ]
 
     def _process_filters(
         self,
@@ -723,3 +2011,492 @@ class SqlAlchemyRepository(Generic[DomainModel]):
                 "Only QueryClause and FilterOperator types are allowed "
                 "as values for the 'filters' argument"
             )
+
+    def _get_many_from_session(
+        self, values: list[Any], attr: str, model: DomainModel
+    ) -> dict[Any, Any]:
+        """Find the domain model instances which are already loaded in the
+        session.
+
+        Parameters
+        ----------
+        values
+            The values to filter by
+        attr
+            The attribute to filter by
+        model
+            Domain model type
+
+        Returns
+        -------
+            The instances by the value of the attribute
+        """
+        mapper = class_mapper(model)  # type: ignore
+        primary_key = [
+            mapper.get_property_by_column(column).key
+            for column in mapper.primary_key
+        ]
+        found: dict[Any, Any] = {}
+        if primary_key == [attr]:
+            for value in values:
+                obj = self.session.identity_map.get(
+                    mapper.identity_key_from_primary_key((value,))
+                )
+                if obj is not None and obj not in self.session.deleted:
+                    found[value] = obj
+            return found
+
+        wanted = set(values)
+        for obj in self.session.identity_map.values():
+            if (
+                isinstance(obj, mapper.class_)
+                and attr in inspect(obj).dict
+                and obj not in self.session.deleted
+            ):
+                value = getattr(obj, attr)
+                if value in wanted:
+                    found[value] = obj
+        return found
+
+    def _chunks_of_rows(
+        self,
+        data: pd.DataFrame | Iterable[Mapping[str, Any] | DomainModel],
+        mapper: Any,
+        chunk_size: int | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Convert a DataFrame or an iterable of mappings or domain model
+        instances to chunks of rows which are keyed by column.
+
+        Parameters
+        ----------
+        data
+            A DataFrame, or an iterable of mappings or domain model instances
+        mapper
+            The mapper of the domain model
+        chunk_size
+            The maximum size of a chunk, by default None which results in
+            using the chunk size of the repository
+
+        Yields
+        ------
+        list[dict[str, Any]]
+            A chunk of rows
+        """
+        size = self._chunk_size if chunk_size is None else chunk_size
+        if size < 1:
+            raise ValueError("The chunk_size has to be a positive integer")
+        keys = {prop.key: prop.columns[0].key for prop in mapper.column_attrs}
+
+        if isinstance(data, pd.DataFrame):
+            for ix in range(0, len(data), size):
+                frame = data.iloc[ix : ix + size]
+                frame = frame.astype(object).where(frame.notna(), None)
+                yield [
+                    {keys.get(key, key): value for key, value in row.items()}
+                    for row in frame.to_dict("records")
+                ]
+            return
+
+        # Primary keys which are not set on an instance are generated by the
+        # database
+        generated = {column.key for column in mapper.primary_key}
+        items = iter(data)
+        while chunk := list(itertools.islice(items, size)):
+            yield [
+                (
+                    {keys.get(k, k): v for k, v in item.items()}
+                    if isinstance(item, Mapping)
+                    else {
+                        column: value
+                        for key, column in keys.items()
+                        if (value := getattr(item, key)) is not None
+                        or column not in generated
+                    }
+                )
+                for item in chunk
+            ]
+
+    def _column_keys(
+        self, mapper: Any, attrs: list[str] | None
+    ) -> list[str] | None:
+        """Translate attribute names of a domain model to column keys.
+
+        Parameters
+        ----------
+        mapper
+            The mapper of the domain model
+        attrs
+            The attribute names
+
+        Returns
+        -------
+            The column keys
+        """
+        if attrs is None:
+            return None
+        return [mapper.get_property(attr).columns[0].key for attr in attrs]
+
+    def _insert_statement(
+        self,
+        table: Table,
+        columns: list[str],
+        on_conflict: Literal["ignore", "update"] | None = None,
+        conflict_keys: list[str] | None = None,
+        update_columns: list[str] | None = None,
+    ) -> Insert:
+        """Create an INSERT statement for a table, with the dialect-specific
+        clause to ignore or update conflicting rows.
+
+        Parameters
+        ----------
+        table
+            The table to insert into
+        columns
+            The keys of the inserted columns
+        on_conflict
+            What to do with conflicting rows, by default None
+        conflict_keys
+            The keys of the columns of the unique constraint used to detect
+            conflicts, by default None which results in using the primary key
+        update_columns
+            The keys of the columns to update, by default None which results
+            in updating all inserted columns except the conflict keys
+
+        Returns
+        -------
+            Insert statement
+
+        Raises
+        ------
+        NotImplementedError
+            When `on_conflict` is used with an unsupported database
+        """
+        if on_conflict is None:
+            return insert(table)
+
+        dialect = self.session.get_bind().dialect.name
+        ignore_any = on_conflict == "ignore" and conflict_keys is None
+        if conflict_keys is None:
+            conflict_keys = [column.key for column in table.primary_key]
+        if update_columns is None:
+            update_columns = [c for c in columns if c not in conflict_keys]
+
+        statement: Any
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+                statement = pg_insert(table)
+            else:
+                from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+                statement = sqlite_insert(table)
+            if ignore_any:
+                return statement.on_conflict_do_nothing()
+            if on_conflict == "ignore" or not update_columns:
+                return statement.on_conflict_do_nothing(
+                    index_elements=conflict_keys
+                )
+            return statement.on_conflict_do_update(
+                index_elements=conflict_keys,
+                set_={c: statement.excluded[c] for c in update_columns},
+            )
+
+        if dialect in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            statement = mysql_insert(table)
+            if on_conflict == "ignore" or not update_columns:
+                return statement.prefix_with("IGNORE")
+            return statement.on_duplicate_key_update(
+                {c: statement.inserted[c] for c in update_columns}
+            )
+
+        raise NotImplementedError(
+            f"Handling conflicts is not supported for the {dialect} dialect"
+        )
+
+    def _copy_rows(self, table: Table, rows: list[dict[str, Any]]) -> None:
+        """Send rows to a PostgreSQL table by using `COPY ... FROM STDIN`.
+
+        The values are converted by the bind processors of the column types
+        and written as CSV, in which unquoted empty values are NULL.
+
+        Parameters
+        ----------
+        table
+            The table to insert into
+        rows
+            The rows keyed by column
+        """
+        connection = self.session.connection()
+        dialect = connection.dialect
+        preparer = dialect.identifier_preparer
+        columns = [table.columns[key] for key in rows[0]]
+        processors = [
+            column.type.bind_processor(dialect) for column in columns
+        ]
+
+        buffer = io.StringIO()
+        for row in rows:
+            fields = []
+            for column, processor in zip(columns, processors):
+                value = row[column.key]
+                if processor is not None and value is not None:
+                    value = processor(value)
+                fields.append(self._copy_field(value))
+            buffer.write(",".join(fields) + "\n")
+        buffer.seek(0)
+
+        sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv)".format(
+            preparer.format_table(table),
+            ", ".join(preparer.format_column(column) for column in columns),
+        )
+        driver_connection: Any = connection.connection.driver_connection
+        cursor = driver_connection.cursor()
+        try:
+            if dialect.driver == "psycopg2":
+                cursor.copy_expert(sql, buffer)
+            else:
+                with cursor.copy(sql) as copy_:
+                    copy_.write(buffer.getvalue())
+        except dialect.loaded_dbapi.Error as exc:
+            # Raise the same exception types as statements executed by
+            # SQLAlchemy, like IntegrityError
+            raise DBAPIError.instance(
+                sql, None, exc, dialect.loaded_dbapi.Error, dialect=dialect
+            ) from exc
+        finally:
+            cursor.close()
+
+    def _copy_field(self, value: Any) -> str:
+        """Format a value as a field of a CSV row for `COPY`.
+
+        Parameters
+        ----------
+        value
+            The value to format
+
+        Returns
+        -------
+            The formatted value
+        """
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            text = "t" if value else "f"
+        elif isinstance(value, datetime.date | datetime.time):
+            text = value.isoformat()
+        elif isinstance(value, Enum):
+            text = value.name
+        else:
+            text = str(value)
+        return '"' + text.replace('"', '""') + '"'
+
+    def _is_set_based(self, kwargs: dict[str, Any]) -> bool:
+        """Check whether the query options can be compiled into a single
+        DELETE or UPDATE statement.
+
+        Parameters
+        ----------
+        kwargs
+            The query options
+
+        Returns
+        -------
+            True when only filtering options are used
+        """
+        return all(
+            key in ("filter", "filter_by") or not value
+            for key, value in kwargs.items()
+        )
+
+    def _has_dependent_rows(self, model: DomainModel) -> bool:
+        """Check whether the session removes or updates related rows when an
+        instance of a domain model is deleted, which a `DELETE ... WHERE`
+        statement would skip.
+
+        These are the rows of a many-to-many association table, the rows of
+        a relationship with a delete cascade, and the foreign keys of
+        one-to-many relationships which are not left to the database with
+        `passive_deletes`.
+
+        Parameters
+        ----------
+        model
+            The domain model class
+
+        Returns
+        -------
+            True when any relationship of the domain model has dependent rows
+        """
+        for relationship in class_mapper(model).relationships:  # type: ignore
+            if relationship.secondary is not None:
+                return True
+            if relationship.direction is MANYTOONE:
+                if relationship.cascade.delete:
+                    return True
+            elif not relationship.passive_deletes:
+                return True
+        return False
+
+    def _keyset_columns(
+        self,
+        model: DomainModel,
+        order_by: list[
+            InstrumentedAttribute[Any] | UnaryExpression[Any] | OrderBy
+        ],
+    ) -> list[tuple[InstrumentedAttribute[Any], bool]]:
+        """Determine the columns used for keyset pagination. The primary key
+        columns of the model are appended to make the ordering unique.
+
+        Parameters
+        ----------
+        model
+            Domain model type
+        order_by
+            The ordering clauses as passed to the `select_iter` method
+
+        Returns
+        -------
+            A list of tuples containing the instrumented attribute and whether
+            the column is sorted in descending order
+
+        Raises
+        ------
+        TypeError
+            When an unsupported ordering type is being used
+        """
+        mapper = class_mapper(model)  # type: ignore
+        columns: list[tuple[InstrumentedAttribute[Any], bool]] = []
+
+        for order in order_by:
+            if isinstance(order, OrderBy):
+                if not order._domain_model:
+                    order.set_domain_model(model)
+                if not order._instrumented_attr:
+                    order._raise_instrumented_attr_exception()
+                attr = order._instrumented_attr
+                descending = isinstance(order, DescendingOrder)
+            elif isinstance(order, InstrumentedAttribute):
+                attr = order
+                descending = False
+            elif isinstance(order, UnaryExpression):  # type: ignore
+                key = mapper.get_property_by_column(order.element).key
+                attr = getattr(model, key)
+                descending = order.modifier is operators.desc_op
+            else:
+                raise TypeError(
+                    "Only OrderBy, InstrumentedAttribute and UnaryExpression "
+                    "types are allowed as values for the 'order_by' argument"
+                )
+            columns.append((attr, descending))
+
+        keys = [attr.key for attr, _ in columns]
+        for column in mapper.primary_key:
+            key = mapper.get_property_by_column(column).key
+            if key not in keys:
+                columns.append((getattr(model, key), False))
+                keys.append(key)
+
+        return columns
+
+    def _keyset_filter(
+        self,
+        columns: list[tuple[InstrumentedAttribute[Any], bool]],
+        values: list[Any],
+    ) -> ColumnElement[bool]:
+        """Create a filter statement which selects all rows that come after
+        the given values in the ordering of the keyset columns.
+
+        For the columns (a, b) and values (x, y) the result is comparable to
+        `a > x OR (a = x AND b > y)`, where `<` is used for descending
+        columns.
+
+        Parameters
+        ----------
+        columns
+            The keyset columns and their ordering direction
+        values
+            The values of the keyset columns of the last retrieved row
+
+        Returns
+        -------
+            Filter statement
+        """
+        clauses: list[ColumnElement[bool]] = []
+        for ix, (attr, descending) in enumerate(columns):
+            equals = [
+                columns[i][0] == literal(values[i], columns[i][0].type)
+                for i in range(ix)
+            ]
+            value = literal(values[ix], attr.type)
+            compare = attr < value if descending else attr > value
+            clauses.append(and_(*equals, compare))
+        return or_(*clauses)
+
+    def _begin_savepoint(self) -> SessionTransaction | None:
+        """Begin a savepoint for a flush which may fail, when the session is
+        in a nested transaction, like the one of a nested unit of work.
+
+        Outside of a nested transaction no savepoint is started, because the
+        SQLite drivers commit the transaction when a savepoint which was
+        started as its first statement is released.
+
+        Returns
+        -------
+        SessionTransaction | None
+            The savepoint, or None outside of a nested transaction
+        """
+        if self.session.in_nested_transaction():
+            return self.session.begin_nested()
+        return None
+
+    def _rollback_savepoint(
+        self, savepoint: SessionTransaction | None
+    ) -> None:
+        """Roll back a savepoint of `_begin_savepoint`, or the transaction of
+        the session when no savepoint was started.
+
+        Parameters
+        ----------
+        savepoint
+            The savepoint, or None
+        """
+        if savepoint is None:
+            self.session.rollback()
+            if llc("debug"):
+                logger.debug("rolled back pending transaction from session")
+            return
+        savepoint.rollback()
+        if llc("debug"):
+            logger.debug("rolled back the savepoint of the failed flush")
+
+    def _chunks(
+        self, objs: list[Any], chunk_size: int | None = None
+    ) -> Iterator[list[Any]]:
+        """Split a list of objects into chunks.
+
+        Parameters
+        ----------
+        objs
+            The list of objects to split
+        chunk_size
+            The maximum size of a chunk, by default None which results in
+            using the chunk size of the repository
+
+        Yields
+        ------
+        list[Any]
+            A chunk of objects
+
+        Raises
+        ------
+        ValueError
+            When the chunk size is not a positive integer
+        """
+        size = self._chunk_size if chunk_size is None else chunk_size
+        if size < 1:
+            raise ValueError("The chunk_size has to be a positive integer")
+        for ix in range(0, len(objs), size):
+            yield objs[ix : ix + size]
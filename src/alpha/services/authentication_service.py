@@ -274,10 +274,8 @@ class AuthenticationService:
 
         # If configured to merge with database users and groups, perform the
         # merge operations on the retrieved identity.
-        if self._merge_with_database_users and identity:
-            identity = self._merge_identity_with_user(identity)
-        if self._merge_with_database_groups and identity:
-            identity = self._merge_identity_with_groups(identity)
+        if identity:
+            identity = self._merge_identity(identity)
 
         # Issue an authentication token for the authenticated identity
         token = self._identity_provider.issue_token(identity)
@@ -438,10 +436,7 @@ class AuthenticationService:
             )
             # If configured to merge with database users and groups, perform
             # the merge operations on the identity.
-            if self._merge_with_database_users:
-                identity = self._merge_identity_with_user(identity)
-            if self._merge_with_database_groups:
-                identity = self._merge_identity_with_groups(identity)
+            identity = self._merge_identity(identity)
 
         # If an auth token is provided and the identity could not be retrieved
         # using the refresh token, attempt to retrieve the identity from the
@@ -587,6 +582,38 @@ class AuthenticationService:
         )
         return auth_cookie, str(token)
 
+    def _merge_identity(self, identity: Identity) -> Identity:
+        """Merge User and Group data into an Identity instance, according to
+        the merge settings. Both merges are performed in a single unit of
+        work, in which the merges run as nested units of work, so they use
+        one database session and transaction.
+
+        Parameters
+        ----------
+        identity
+            Identity object containing user and group information.
+
+        Returns
+        -------
+        Identity
+            Updated Identity instance.
+        """
+        if not (
+            self._merge_with_database_users or self._merge_with_database_groups
+        ):
+            return identity
+        if self.uow is None:
+            self._raise_no_uow()
+
+        with self.uow:
+            if self._merge_with_database_users:
+                identity = self._merge_identity_with_user(identity)
+            if self._merge_with_database_groups:
+                identity = self._merge_identity_with_groups(identity)
+            self.uow.commit()
+
+        return identity
+
     def _merge_identity_with_user(
         self,
         identity: Identity,
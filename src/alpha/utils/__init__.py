@@ -1,4 +1,5 @@
 from alpha.utils.cookie import Cookie
+from alpha.utils.gunicorn_hooks import post_fork
 from alpha.utils.is_attrs import is_attrs
 from alpha.utils.is_pydantic import is_pydantic
 from alpha.utils.logging_configurator import (
@@ -17,6 +18,7 @@ __all__ = [
     "is_pydantic",
     "LoggingConfigurator",
     "GunicornLogger",
+    "post_fork",
     "logging_level_checker",
     "create_response_object",
     "verify_identity",
@@ -0,0 +1,29 @@
+"""Contains server hooks which can be used in a gunicorn configuration
+file"""
+
+from typing import Any
+
+from alpha.infra.connectors.sql_alchemy import reset_databases_after_fork
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Reset the database engines in a new gunicorn worker, so the worker
+    does not use the connections which are inherited from the master
+    process. This is needed when the application is preloaded, because the
+    engines are then created in the master process.
+
+    Use the hook by importing it in the gunicorn configuration file:
+    ```python
+    # gunicorn.conf.py
+    from alpha.utils.gunicorn_hooks import post_fork
+    ```
+
+    Parameters
+    ----------
+    server
+        The gunicorn arbiter
+    worker
+        The gunicorn worker which has been forked
+    """
+    reset_databases_after_fork()
+    server.log.debug("Reset database engines in worker %s", worker.pid)
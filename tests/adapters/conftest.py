@@ -2,6 +2,7 @@ from typing import Any
 
 import pytest
 
+from alpha.adapters.async_rest_api_unit_of_work import AsyncRestApiUnitOfWork
 from alpha.adapters.rest_api_unit_of_work import RestApiUnitOfWork
 from alpha.adapters.sqla_unit_of_work import SqlAlchemyUnitOfWork
 from alpha.infra.databases.sql_alchemy import SqlAlchemyDatabase
@@ -52,13 +53,6 @@ def sql_alchemy_uow(repo_model, test_database) -> SqlAlchemyUnitOfWork:
     return SqlAlchemyUnitOfWork(db=test_database, repos=[repo_model])
 
 
-@pytest.fixture
-def sql_alchemy_uow_with_invalid_repo(
-    invalid_repo_model, test_database
-) -> SqlAlchemyUnitOfWork:
-    return SqlAlchemyUnitOfWork(db=test_database, repos=[invalid_repo_model])
-
-
 @pytest.fixture
 def rest_api_uow(repo_model) -> RestApiUnitOfWork:
     return RestApiUnitOfWork(repos=[repo_model])
@@ -67,3 +61,15 @@ def rest_api_uow(repo_model) -> RestApiUnitOfWork:
 @pytest.fixture
 def rest_api_uow_with_invalid_repo(invalid_repo_model) -> RestApiUnitOfWork:
     return RestApiUnitOfWork(repos=[invalid_repo_model])
+
+
+@pytest.fixture
+def async_rest_api_uow(repo_model) -> AsyncRestApiUnitOfWork:
+    return AsyncRestApiUnitOfWork(repos=[repo_model])
+
+
+@pytest.fixture
+def async_rest_api_uow_with_invalid_repo(
+    invalid_repo_model,
+) -> AsyncRestApiUnitOfWork:
+    return AsyncRestApiUnitOfWork(repos=[invalid_repo_model])
@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+import pytest
+
+from alpha.adapters.async_rest_api_unit_of_work import AsyncRestApiUnitOfWork
+
+
+def test_async_rest_api_uow_context_management(async_rest_api_uow):
+    async def main():
+        async with async_rest_api_uow as uow:
+            assert isinstance(uow.session, httpx.AsyncClient)
+            assert hasattr(uow, "test_repo")
+            session = uow.session
+        # The client which is created by the unit of work is closed
+        assert session.is_closed
+        assert uow.session is None
+
+    asyncio.run(main())
+
+
+def test_async_rest_api_uow_shared_client(repo_model):
+    async def main():
+        async with httpx.AsyncClient() as client:
+            uow = AsyncRestApiUnitOfWork(repos=[repo_model], session=client)
+            async with uow:
+                assert uow.session is client
+            # A client which is passed to the unit of work stays open
+            assert not client.is_closed
+            assert uow.session is client
+
+    asyncio.run(main())
+
+
+def test_async_rest_api_uow_repository_interface_validation(
+    async_rest_api_uow_with_invalid_repo,
+):
+    async def main():
+        with pytest.raises(TypeError):
+            async with async_rest_api_uow_with_invalid_repo:
+                pass
+
+    asyncio.run(main())
+
+
+def test_async_rest_api_uow_commit_raises_not_implemented(
+    async_rest_api_uow,
+):
+    async def main():
+        with pytest.raises(NotImplementedError):
+            await async_rest_api_uow.commit()
+
+        with pytest.raises(NotImplementedError):
+            await async_rest_api_uow.flush()
+
+        with pytest.raises(NotImplementedError):
+            await async_rest_api_uow.rollback()
+
+        with pytest.raises(NotImplementedError):
+            await async_rest_api_uow.refresh(obj=None)
+
+    asyncio.run(main())
@@ -1,8 +1,13 @@
 import pytest
 from sqlalchemy.orm.exc import UnmappedInstanceError
 
+from alpha.adapters.sqla_unit_of_work import SqlAlchemyUnitOfWork
+from alpha.interfaces.api_repository import ApiRepository
 from alpha.interfaces.unit_of_work import UnitOfWork
 from alpha.exceptions import DatabaseSessionError
+from alpha.repositories.models.repository_model import RepositoryModel
+from tests.fixtures._domain_models import TestModel
+from tests.fixtures.fake_uow_repositories import FakeRepository
 
 
 def test_sql_alchemy_uow_initialization(sql_alchemy_uow):
@@ -23,11 +28,63 @@ def test_sql_alchemy_uow_initialization(sql_alchemy_uow):
 
 
 def test_sql_alchemy_uow_repository_interface_validation(
-    sql_alchemy_uow_with_invalid_repo,
+    invalid_repo_model, test_database
 ):
+    # The interface of a repository class is checked on initialization
     with pytest.raises(TypeError):
-        with sql_alchemy_uow_with_invalid_repo:
-            pass
+        SqlAlchemyUnitOfWork(db=test_database, repos=[invalid_repo_model])
+
+    # The interface of a repository which is created by a factory function
+    # is checked when the repository is created
+    factory_model = RepositoryModel(
+        name="invalid_repo",
+        repository=lambda **kwargs: object(),
+        default_model=None,
+        interface=ApiRepository,
+    )
+    uow = SqlAlchemyUnitOfWork(db=test_database, repos=[factory_model])
+    with uow:
+        with pytest.raises(TypeError):
+            uow.invalid_repo
+
+
+def test_sql_alchemy_uow_lazy_repositories(repo_model, test_database):
+    created = []
+
+    def factory(**kwargs):
+        created.append(kwargs["session"])
+        return FakeRepository()
+
+    factory_model = RepositoryModel(
+        name="lazy_repo",
+        repository=factory,
+        default_model=TestModel,
+        interface=ApiRepository,
+    )
+    uow = SqlAlchemyUnitOfWork(
+        db=test_database, repos=[repo_model, factory_model]
+    )
+
+    with uow:
+        # Entering the context does not create the repositories
+        assert created == []
+        assert "lazy_repo" not in vars(uow)
+
+        repository = uow.lazy_repo
+        assert uow.lazy_repo is repository
+        assert created == [uow.session]
+        assert "test_repo" not in vars(uow)
+
+    # The repositories are discarded when the context exits
+    assert "lazy_repo" not in vars(uow)
+    with pytest.raises(DatabaseSessionError):
+        uow.lazy_repo
+    with pytest.raises(AttributeError):
+        uow.unknown_repo
+
+    with uow:
+        assert uow.lazy_repo is not repository
+    assert len(created) == 2
 
 
 def test_sql_alchemy_uow_context_management(sql_alchemy_uow):
@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from alpha.infra.caches.file_cache import FileCache
+from alpha.interfaces.cache import CacheBackend
+
+
+def test_file_cache(tmp_path):
+    cache = FileCache(tmp_path / "cache", ttl=60)
+    assert isinstance(cache, CacheBackend)
+
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+    assert cache.get("a") == {"id": 1}
+    assert len(cache) == 2
+
+    # The values are shared by the instances with the same directory
+    assert FileCache(tmp_path / "cache").get("b") == {"id": 2}
+
+    cache.delete("a", "unknown")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_file_cache_ttl(tmp_path):
+    cache = FileCache(tmp_path, ttl=None)
+
+    cache.set("a", 1, ttl=0.01)
+    cache.set("b", 2)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_file_cache_corrupt_file(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.set("a", 1)
+    cache._path("a").write_bytes(b"")
+
+    assert cache.get("a") is None
+
+
+def test_file_cache_maxsize(tmp_path):
+    cache = FileCache(tmp_path, maxsize=2)
+
+    for key in ["a", "b", "c"]:
+        cache.set(key, key)
+        time.sleep(0.01)
+
+    # The least recently written value is removed
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
+
+    with pytest.raises(ValueError):
+        FileCache(tmp_path, maxsize=0)
@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.interfaces.cache import CacheBackend
+
+
+def test_memory_cache():
+    cache = MemoryCache(maxsize=2, ttl=60)
+    assert isinstance(cache, CacheBackend)
+
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+    assert cache.get("a") == {"id": 1}
+
+    # 'b' is the least recently used value
+    cache.set("c", {"id": 3})
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.delete("a", "unknown")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        MemoryCache(maxsize=0)
+
+
+def test_memory_cache_ttl():
+    cache = MemoryCache(ttl=None)
+
+    cache.set("a", 1, ttl=0.01)
+    cache.set("b", 2)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
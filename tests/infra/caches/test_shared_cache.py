@@ -0,0 +1,41 @@
+import time
+
+from alpha.infra.caches.shared_cache import LocalCacheClient, SharedCache
+from alpha.interfaces.cache import CacheBackend
+
+
+def test_shared_cache():
+    client = LocalCacheClient()
+    cache = SharedCache(client=client, prefix="test:")
+    other = SharedCache(client=client, prefix="other:")
+    assert isinstance(cache, CacheBackend)
+
+    value = {"id": 1, "name": "Max"}
+    cache.set("a", value)
+    other.set("a", 1)
+
+    # Values are serialized, so every lookup returns a new copy
+    assert cache.get("a") == value
+    assert cache.get("a") is not cache.get("a")
+    assert client.get("test:a") is not None
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+    cache.set("b", 2)
+    cache.clear()
+    assert cache.get("b") is None
+    assert other.get("a") == 1
+
+
+def test_local_cache_client_expiry():
+    client = LocalCacheClient()
+
+    client.set("a", b"1", ex=1)
+    client.set("b", b"2")
+    client._values["a"] = (time.monotonic() - 1, b"1")
+
+    assert client.get("a") is None
+    assert client.get("b") == b"2"
+    assert list(client.scan_iter(match="*")) == ["b"]
+    assert client.delete("a", "b") == 1
@@ -0,0 +1,26 @@
+import pytest
+
+from alpha.infra.caches.statement_cache import StatementCache
+
+
+def test_statement_cache():
+    cache = StatementCache(maxsize=2)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # 'b' is the least recently used statement
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    assert cache.info() == {"hits": 2, "misses": 2, "size": 2, "maxsize": 2}
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info()["hits"] == 0
+
+    with pytest.raises(ValueError):
+        StatementCache(maxsize=0)
@@ -0,0 +1,62 @@
+import logging
+import time
+
+import pytest
+
+from alpha import exceptions
+from alpha.infra.connectors.circuit_breaker import (
+    CIRCUIT_BREAKER_LOGGER,
+    CircuitBreaker,
+    CircuitState,
+)
+
+
+def test_circuit_breaker(caplog):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.05)
+    host = "api.example.com"
+
+    for _ in range(2):
+        breaker.before_request(host)
+        breaker.record_failure(host)
+    breaker.record_response(host, 404)
+    breaker.record_response(host, 503)
+    assert breaker.state(host) is CircuitState.CLOSED
+
+    with caplog.at_level(logging.INFO, logger=CIRCUIT_BREAKER_LOGGER):
+        breaker.record_failure(host)
+        breaker.record_failure(host)
+    assert breaker.state(host) is CircuitState.OPEN
+    assert breaker.state("other.example.com") is CircuitState.CLOSED
+    assert "changed from closed to open" in caplog.text
+
+    with pytest.raises(exceptions.CircuitOpenException):
+        breaker.before_request(host)
+    breaker.before_request("other.example.com")
+
+    time.sleep(0.05)
+    assert breaker.state(host) is CircuitState.HALF_OPEN
+    breaker.before_request(host)
+    # Only one trial request is permitted while half-open
+    with pytest.raises(exceptions.ServiceUnavailableException):
+        breaker.before_request(host)
+    breaker.record_failure(host)
+    assert breaker.state(host) is CircuitState.OPEN
+
+    time.sleep(0.05)
+    breaker.before_request(host)
+    breaker.record_response(host, 200)
+    assert breaker.state(host) is CircuitState.CLOSED
+
+    stats = breaker.stats()
+    assert stats["opened"] == 2
+    assert stats["half_opened"] == 2
+    assert stats["closed"] == 1
+    assert stats["rejected"] == 2
+    assert stats["failures"] == 6
+    assert stats["hosts"][host] == {
+        "state": "closed",
+        "consecutive_failures": 0,
+    }
+
+    breaker.reset()
+    assert breaker.stats()["hosts"] == {}
@@ -0,0 +1,57 @@
+import asyncio
+import os
+
+from sqlalchemy import Column, Integer, MetaData, Table, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from alpha.infra.connectors.async_sql_alchemy import AsyncSqlAlchemyDatabase
+from alpha.infra.connectors.sql_alchemy import reset_databases_after_fork
+from alpha.interfaces.async_sql_database import AsyncSqlDatabase
+
+
+def test_async_database_class(tmp_path):
+    metadata = MetaData()
+    table = Table("cars", metadata, Column("id", Integer, primary_key=True))
+    database = AsyncSqlAlchemyDatabase(
+        conn_str=f"sqlite+aiosqlite:///{tmp_path / 'async.db'}",
+        create_schema=False,
+        pool_size=2,
+    )
+
+    assert isinstance(database, AsyncSqlDatabase)
+    assert isinstance(database.engine(), AsyncEngine)
+    assert database.engine().pool.size() == 2
+
+    async def run():
+        await database.create_tables(metadata, tables=[table])
+        session = database.get_session()
+        assert isinstance(session, AsyncSession)
+        async with session:
+            await session.execute(text("INSERT INTO cars (id) VALUES (1)"))
+            await session.commit()
+            result = await session.execute(text("SELECT count(*) FROM cars"))
+            assert result.scalar() == 1
+        await database.drop_tables(metadata, tables=[table])
+        await database.dispose()
+
+    asyncio.run(run())
+
+    stats = database.pool_stats()
+    assert stats["checkouts"] == 4
+    assert stats["checked_out"] == 0
+
+
+def test_async_database_reset_after_fork(tmp_path):
+    database = AsyncSqlAlchemyDatabase(
+        conn_str=f"sqlite+aiosqlite:///{tmp_path / 'async.db'}",
+        create_schema=False,
+    )
+    pool = database.engine().pool
+
+    database.reset_after_fork()
+    assert database.engine().pool is pool
+
+    database._pid = -1
+    reset_databases_after_fork()
+    assert database.engine().pool is not pool
+    assert database._pid == os.getpid()
@@ -1,6 +1,9 @@
+import os
 from uuid import uuid4
 
 import pytest
+from alpha.exceptions import StatementTimeoutError
+from alpha.infra.connectors.sql_alchemy import reset_databases_after_fork
 from alpha.infra.databases.sql_alchemy import SqlAlchemyDatabase
 from sqlalchemy import (
     Column,
@@ -9,10 +12,11 @@ from sqlalchemy import (
     String,
     Table,
     UniqueConstraint,
+    event,
     text,
 )
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import DisconnectionError, OperationalError, TimeoutError
 from sqlalchemy.orm import Session, scoped_session
 
 from alpha.interfaces.sql_database import SqlDatabase
@@ -75,3 +79,150 @@ def test_database_class(metadata, conn_str, car_table):
     # Check if the 'cars' table has been dropped
     with pytest.raises(OperationalError):
         assert session.execute(text("SELECT * FROM cars"))
+
+
+def test_database_pool_options(tmp_path):
+    database = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'pool.db'}",
+        create_schema=False,
+        pool_size=2,
+        max_overflow=0,
+        pool_recycle=3600,
+        pool_timeout=0.1,
+        pool_use_lifo=True,
+    )
+    pool = database.engine().pool
+
+    assert pool.size() == 2
+    assert pool._recycle == 3600
+    assert pool._timeout == 0.1
+    assert pool._pool.use_lifo
+
+    # Options which are not set are left to the defaults of the pool
+    default = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'default.db'}",
+        create_schema=False,
+    )
+    assert default.engine().pool.size() == 5
+
+
+def test_database_pool_stats(tmp_path):
+    database = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'pool.db'}",
+        create_schema=False,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    engine = database.engine()
+
+    first = engine.connect()
+    second = engine.connect()
+    stats = database.pool_stats()
+    assert stats["checked_out"] == 2
+    assert stats["checked_in"] == 0
+    assert stats["size"] == 2
+    assert stats["overflow"] == 0
+
+    with pytest.raises(TimeoutError):
+        engine.connect()
+    assert database.pool_stats()["checkout_timeouts"] == 1
+
+    first.close()
+    second.close()
+    stats = database.pool_stats()
+    assert stats["checked_out"] == 0
+    assert stats["checkins"] == 2
+    assert stats["connects"] == 2
+    assert stats["checkout_latency"]["count"] == 2
+    assert stats["checkout_latency"]["buckets"]["+Inf"] == 2
+
+    # A connection which fails the pre-ping on checkout is replaced
+    failures = [DisconnectionError("connection lost")]
+
+    @event.listens_for(engine, "checkout")
+    def fail_once(dbapi_connection, record, proxy):
+        if failures:
+            raise failures.pop()
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+    stats = database.pool_stats()
+    assert stats["invalidated_by_pre_ping"] == 1
+    assert stats["connects"] == 3
+
+    # The statistics are kept when the pool is recreated
+    engine.dispose()
+    with engine.connect():
+        pass
+    assert database.pool_stats()["checkouts"] == 5
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_database_reset_after_fork(tmp_path):
+    database = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'fork.db'}",
+        create_schema=False,
+    )
+    session = database.get_session()
+    session.execute(text("SELECT 1"))
+    pool = database.engine().pool
+
+    pid = os.fork()
+    if pid == 0:
+        # The inherited pool and session are discarded in the child
+        try:
+            child_session = database.get_session()
+            ok = (
+                database.engine().pool is not pool
+                and child_session is not session
+                and database.pool_stats()["checked_out"] == 0
+                and child_session.execute(text("SELECT 1")).scalar() == 1
+            )
+        finally:
+            os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    # The parent keeps using its own pool and session
+    assert database.engine().pool is pool
+    assert database.get_session() is session
+    assert session.execute(text("SELECT 1")).scalar() == 1
+    session.close()
+
+
+def test_database_reset_after_fork_in_same_process(conn_str):
+    database = SqlAlchemyDatabase(conn_str=conn_str, create_schema=False)
+    pool = database.engine().pool
+
+    database.reset_after_fork()
+    assert database.engine().pool is pool
+
+    database._pid = -1
+    reset_databases_after_fork()
+    assert database.engine().pool is not pool
+    assert database._pid == os.getpid()
+
+
+def test_database_statement_timeout(conn_str):
+    database = SqlAlchemyDatabase(
+        conn_str=conn_str, create_schema=False, statement_timeout=0.1
+    )
+    assert database.statement_timeout == 0.1
+
+    session = database.get_session()
+    with pytest.raises(StatementTimeoutError):
+        session.execute(
+            text(
+                "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 "
+                "FROM c) SELECT count(*) FROM c"
+            )
+        )
+    session.rollback()
+    assert session.execute(text("SELECT 1")).scalar() == 1
+    session.close()
+
+    # Connections which are used without a session have no timeout
+    with database.engine().connect() as connection:
+        assert connection.execute(text("SELECT 2")).scalar() == 2
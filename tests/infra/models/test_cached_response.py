@@ -0,0 +1,66 @@
+import time
+
+import pytest
+
+from alpha.infra.models.cached_response import CachedResponse
+
+
+class Response:
+    def __init__(self, headers=None, status_code=200):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.mark.parametrize(
+    "headers, fresh, validators",
+    [
+        ({"Cache-Control": "max-age=60"}, True, {}),
+        (
+            {"Cache-Control": "public, max-age=60", "ETag": '"a"'},
+            True,
+            {"If-None-Match": '"a"'},
+        ),
+        (
+            {"Cache-Control": "no-cache, max-age=60", "etag": '"a"'},
+            False,
+            {"If-None-Match": '"a"'},
+        ),
+        (
+            {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            False,
+            {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        ),
+        ({"Cache-Control": "max-age=abc", "ETag": '"a"'}, False, None),
+    ],
+)
+def test_cached_response(headers, fresh, validators):
+    cached = CachedResponse.from_response(Response(headers), {"id": 1})
+
+    assert cached.data == {"id": 1}
+    assert cached.fresh is fresh
+    if validators is not None:
+        assert cached.validators == validators
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Cache-Control": "max-age=0"},
+        {"Cache-Control": "no-store"},
+        {"Cache-Control": "private, max-age=60"},
+        {"Cache-Control": "max-age=60", "Vary": "Accept, *"},
+    ],
+)
+def test_cached_response_not_stored(headers):
+    assert CachedResponse.from_response(Response(headers), {"id": 1}) is None
+
+
+def test_cached_response_revalidated():
+    cached = CachedResponse(data=[1], etag='"a"', expires=time.time() - 1)
+    assert not cached.fresh
+
+    response = Response({"Cache-Control": "max-age=60"}, status_code=304)
+    revalidated = CachedResponse.from_response(response, [1], cached)
+    assert revalidated.etag == '"a"'
+    assert revalidated.fresh
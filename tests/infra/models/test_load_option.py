@@ -0,0 +1,33 @@
+import pytest
+
+from alpha import exceptions
+from alpha.infra.models.load_option import (
+    JoinedLoad,
+    LoadOption,
+    LoadStrategy,
+    RaiseLoad,
+    SelectInLoad,
+)
+
+
+@pytest.mark.parametrize(
+    "strategy, load_class",
+    [
+        (LoadStrategy.SELECTIN, SelectInLoad),
+        (LoadStrategy.JOINED, JoinedLoad),
+        (LoadStrategy.RAISE, RaiseLoad),
+    ],
+)
+def test_load_option(strategy, load_class):
+    option = LoadOption(field="test", strategy=strategy)
+    assert isinstance(option, load_class)
+
+    with pytest.raises(exceptions.InstrumentedAttributeMissing):
+        option.loader_option
+
+
+def test_load_option_wildcard():
+    option = LoadOption(field="*", strategy=LoadStrategy.RAISE)
+    option.set_domain_model(object)
+    assert option._instrumented_attr is None
+    assert option.loader_option is not None
@@ -0,0 +1,67 @@
+import pytest
+
+from alpha.infra.models.pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    PagePagination,
+    Pagination,
+)
+
+
+class Response:
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+def test_pagination():
+    with pytest.raises(NotImplementedError):
+        Pagination().next_url("https://api/items", Response(), {}, [])
+
+
+def test_page_pagination():
+    pagination = PagePagination(size=2)
+    url = pagination.first_url("https://api/items?q=a")
+    assert url == "https://api/items?q=a&page=1&size=2"
+
+    url = pagination.next_url(url, Response(), {}, [1, 2])
+    assert url == "https://api/items?q=a&page=2&size=2"
+    assert pagination.next_url(url, Response(), {}, [1]) is None
+
+
+def test_offset_pagination():
+    pagination = OffsetPagination(limit=2)
+    url = pagination.first_url("https://api/items")
+    assert url == "https://api/items?offset=0&limit=2"
+
+    url = pagination.next_url(url, Response(), {}, [1, 2])
+    assert url == "https://api/items?offset=2&limit=2"
+    assert pagination.next_url(url, Response(), {}, []) is None
+
+
+def test_cursor_pagination():
+    pagination = CursorPagination(size_param="size", size=2)
+    url = pagination.first_url("https://api/items")
+    assert url == "https://api/items?size=2"
+
+    body = {"data": [1, 2], "next_cursor": "abc"}
+    url = pagination.next_url(url, Response(), body, [1, 2])
+    assert url == "https://api/items?size=2&cursor=abc"
+    assert pagination.next_url(url, Response(), {"data": []}, []) is None
+    assert pagination.next_url(url, Response(), [1, 2], [1, 2]) is None
+
+
+def test_link_header_pagination():
+    pagination = LinkHeaderPagination()
+    url = "https://api/items?page=1"
+    header = '<https://api/items?page=1>; rel="prev first", </items?page=2>; '
+    header += 'rel="next"'
+
+    assert (
+        pagination.next_url(url, Response({"Link": header}), {}, [1])
+        == "https://api/items?page=2"
+    )
+    assert pagination.next_url(url, Response(), {}, [1]) is None
+    assert LinkHeaderPagination(rel="first").next_url(
+        url, Response({"link": header}), {}, [1]
+    ) == ("https://api/items?page=1")
@@ -0,0 +1,63 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from alpha.infra.models.retry_policy import RetryPolicy
+
+
+class Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.mark.parametrize(
+    "method, headers, retryable",
+    [
+        ("get", None, True),
+        ("PUT", None, True),
+        ("DELETE", {}, True),
+        ("POST", None, False),
+        ("PATCH", {"X-Test": "test"}, False),
+        ("POST", {"idempotency-key": "abc"}, True),
+    ],
+)
+def test_retry_policy_is_retryable(method, headers, retryable):
+    assert RetryPolicy().is_retryable(method, headers) is retryable
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+    for attempt in range(10):
+        delay = policy.backoff(attempt)
+        assert 0 <= delay <= min(5.0, 2**attempt)
+
+
+def test_retry_policy_retry_delay():
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.retry_delay("GET", 0, response=Response(503)) is not None
+    assert policy.retry_delay("GET", 2, response=Response(503)) is None
+    assert policy.retry_delay("GET", 0, response=Response(500)) is None
+    assert policy.retry_delay("POST", 0, response=Response(503)) is None
+
+    connection_error = requests.ConnectionError()
+    assert policy.retry_delay("GET", 0, exception=connection_error) is not None
+    assert policy.retry_delay("GET", 0, exception=ValueError()) is None
+
+
+def test_retry_policy_retry_after():
+    policy = RetryPolicy(max_retry_after=10)
+
+    response = Response(429, {"Retry-After": "3"})
+    assert policy.retry_delay("GET", 0, response=response) == 3.0
+    response = Response(503, {"Retry-After": "30"})
+    assert policy.retry_delay("GET", 0, response=response) is None
+
+    date = datetime.now(timezone.utc) + timedelta(seconds=5)
+    response = Response(503, {"retry-after": format_datetime(date)})
+    assert 3 < RetryPolicy.retry_after(response) <= 5
+    assert RetryPolicy.retry_after(Response(503, {"Retry-After": "x"})) is None
+    assert RetryPolicy.retry_after(Response(503)) is None
@@ -4,7 +4,7 @@ from enum import Enum, auto
 from typing import ClassVar
 
 import sqlalchemy as sa
-from sqlalchemy.orm import registry
+from sqlalchemy.orm import registry, relationship
 
 from alpha.domain.models.base_model import BaseDomainModel
 from alpha.domain.models.group import Group
@@ -38,6 +38,28 @@ class Owner(BaseDomainModel):
     pet: Pet
 
 
+@dataclass
+class Animal(BaseDomainModel):
+    id: int = field(compare=False)
+    name: str
+    shelter_id: int | None = field(compare=False, default=None)
+    shelter: "Shelter | None" = field(compare=False, default=None)
+
+
+@dataclass
+class Volunteer(BaseDomainModel):
+    id: int = field(compare=False)
+    name: str
+
+
+@dataclass
+class Shelter(BaseDomainModel):
+    id: int = field(compare=False)
+    name: str
+    animals: list[Animal] = field(compare=False, default_factory=list)
+    volunteers: list[Volunteer] = field(compare=False, default_factory=list)
+
+
 class FakeMapper:
     started: ClassVar[bool] = False
 
@@ -158,3 +180,69 @@ class AppMapper:
         cls.mapper_registry.map_imperatively(Token, cls.refresh_tokens)
 
         cls.started = True
+
+
+class ShelterMapper:
+    started: ClassVar[bool] = False
+
+    mapper_registry: ClassVar = registry()
+
+    metadata: ClassVar = sa.MetaData()
+
+    shelters = sa.Table(
+        "shelters",
+        metadata,
+        sa.Column("id", sa.INTEGER, primary_key=True),
+        sa.Column("name", sa.VARCHAR(20), nullable=False),
+    )
+
+    animals = sa.Table(
+        "animals",
+        metadata,
+        sa.Column("id", sa.INTEGER, primary_key=True),
+        sa.Column("name", sa.VARCHAR(20), nullable=False),
+        sa.Column("shelter_id", sa.ForeignKey("shelters.id"), nullable=True),
+    )
+
+    volunteers = sa.Table(
+        "volunteers",
+        metadata,
+        sa.Column("id", sa.INTEGER, primary_key=True),
+        sa.Column("name", sa.VARCHAR(20), nullable=False),
+    )
+
+    shelter_volunteers = sa.Table(
+        "shelter_volunteers",
+        metadata,
+        sa.Column(
+            "shelter_id", sa.ForeignKey("shelters.id"), primary_key=True
+        ),
+        sa.Column(
+            "volunteer_id", sa.ForeignKey("volunteers.id"), primary_key=True
+        ),
+    )
+
+    @classmethod
+    def start_mapping(cls):
+        cls.mapper_registry.map_imperatively(
+            Animal,
+            cls.animals,
+            properties={
+                "shelter": relationship(Shelter, back_populates="animals")
+            },
+        )
+        cls.mapper_registry.map_imperatively(
+            Shelter,
+            cls.shelters,
+            properties={
+                "animals": relationship(
+                    Animal, back_populates="shelter", order_by=cls.animals.c.id
+                ),
+                "volunteers": relationship(
+                    Volunteer, secondary=cls.shelter_volunteers
+                ),
+            },
+        )
+        cls.mapper_registry.map_imperatively(Volunteer, cls.volunteers)
+
+        cls.started = True
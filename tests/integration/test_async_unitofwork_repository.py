@@ -0,0 +1,237 @@
+import asyncio
+import dataclasses
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from alpha import exceptions
+from alpha.adapters.async_sqla_unit_of_work import AsyncSqlAlchemyUnitOfWork
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.infra.connectors.async_sql_alchemy import AsyncSqlAlchemyDatabase
+from alpha.infra.models.order_by import AscendingOrder
+from alpha.interfaces.sql_repository import SqlRepository
+from alpha.repositories.async_sql_alchemy_repository import (
+    AsyncSqlAlchemyRepository,
+)
+from alpha.repositories.models.repository_model import RepositoryModel
+
+from ._classes import FakeMapper, Pet
+
+
+def async_uow(database, **additional_config) -> AsyncSqlAlchemyUnitOfWork:
+    return AsyncSqlAlchemyUnitOfWork(
+        db=database,
+        repos=[
+            RepositoryModel(
+                name="pets",
+                repository=AsyncSqlAlchemyRepository[Pet],
+                default_model=Pet,
+                interface=SqlRepository,
+                additional_config=additional_config or None,
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def async_database(tmp_path):
+    database = AsyncSqlAlchemyDatabase(
+        conn_str=f"sqlite+aiosqlite:///{tmp_path / 'async.db'}",
+        sqlite_savepoints=True,
+        create_schema=False,
+        mapper=FakeMapper,
+    )
+    asyncio.run(database.initialize())
+    yield database
+
+    async def teardown():
+        await database.drop_tables(FakeMapper.metadata)
+        await database.dispose()
+
+    asyncio.run(teardown())
+
+
+def test_async_unit_of_work(async_database, pets, pet):
+    uow = async_uow(async_database)
+
+    async def run():
+        async with uow:
+            assert isinstance(uow.session, AsyncSession)
+            assert isinstance(uow.pets, AsyncSqlAlchemyRepository)
+
+            assert await uow.pets.add_all(pets, return_obj=True) == pets
+            await uow.commit()
+        assert uow.session is None
+
+        # Changes which are not committed are rolled back on exit
+        async with uow:
+            await uow.pets.add(pet)
+            assert await uow.pets.count() == 6
+        async with uow:
+            assert await uow.pets.count() == 5
+            assert not await uow.pets.exists(filter_by={"name": pet.name})
+
+            with pytest.raises(exceptions.AlreadyExistsException):
+                await uow.pets.add(
+                    dataclasses.replace(pets[0]), raise_if_exists=True
+                )
+
+    asyncio.run(run())
+
+    with pytest.raises(exceptions.DatabaseSessionError):
+        asyncio.run(uow.commit())
+    with pytest.raises(TypeError):
+        AsyncSqlAlchemyUnitOfWork(db=object(), repos=[])
+
+
+def test_async_repository_queries(
+    async_database, pets, in_filter, name_order_asc
+):
+    uow = async_uow(async_database)
+
+    async def run():
+        async with uow:
+            await uow.pets.add_all(pets)
+            await uow.commit()
+
+        async with uow:
+            max_ = await uow.pets.get_by_id(1)
+            assert max_.name == "Max"
+            assert await uow.pets.get_by_id(999) is None
+            assert (await uow.pets.get("name", "Tom")).id == 3
+            assert await uow.pets.get_many([5, 999, 1]) == [
+                pets[4],
+                None,
+                pets[0],
+            ]
+
+            # Filters, ordering and query clauses
+            selected = await uow.pets.select(
+                filters=[in_filter], order_by=[name_order_asc]
+            )
+            assert [obj.name for obj in selected] == ["Bugs", "Max"]
+            selected = await uow.pets.select(
+                order_by=[AscendingOrder(field=Pet.date_of_birth)], limit=2
+            )
+            assert [obj.name for obj in selected] == ["Pluto", "Daffy"]
+            rows = await uow.pets.select(
+                columns=[Pet.id],
+                filters=[in_filter],
+                order_by=[name_order_asc],
+            )
+            assert [row.id for row in rows] == [4, 1]
+            assert await uow.pets.count(filters=[in_filter]) == 2
+
+            assert [
+                obj.id async for obj in uow.pets.select_iter(batch_size=2)
+            ] == [1, 2, 3, 4, 5]
+
+            frame = await uow.pets.select_frame(columns=["id", "name"])
+            assert frame["name"].tolist() == [obj.name for obj in pets]
+
+            # Custom query logic runs with the synchronous repository
+            total = await uow.pets.run_sync(
+                lambda repository: repository.session.query(
+                    func.count(Pet.id)
+                ).scalar()
+            )
+            assert total == 5
+
+            assert (
+                await uow.pets.update_where(
+                    {"remarks": "Updated"}, filters=[in_filter]
+                )
+                == 2
+            )
+            await uow.pets.remove(max_)
+            await uow.commit()
+
+        async with uow:
+            assert await uow.pets.count() == 4
+            assert await uow.pets.count(filter_by={"remarks": "Updated"}) == 1
+
+    asyncio.run(run())
+
+
+def test_async_repository_cache(async_database, pets):
+    cache = MemoryCache()
+    uow = async_uow(async_database, cache=cache)
+
+    async def run():
+        async with uow:
+            await uow.pets.add_all(pets)
+            await uow.commit()
+
+        async with uow:
+            await uow.pets.get_by_id(2)
+        assert len(cache) == 1
+
+        async with uow:
+            pluto = await uow.pets.get_by_id(2)
+            pluto.weight = 20.0
+            await uow.commit()
+        assert len(cache) == 0
+
+    asyncio.run(run())
+
+
+def test_async_nested_unit_of_work(async_database, pets):
+    uow = async_uow(async_database)
+
+    async def run():
+        async with uow:
+            await uow.pets.add_all(pets[:2])
+            session = uow.session
+            async with uow:
+                assert uow.session is session
+                await uow.pets.add(pets[2])
+                await uow.commit()
+                await uow.pets.add(pets[3])
+            assert await uow.pets.count() == 3
+            await uow.commit()
+
+        # A nested commit is discarded when the outer unit of work rolls back
+        async with uow:
+            async with uow:
+                await uow.pets.remove_all()
+                await uow.commit()
+            assert await uow.pets.count() == 0
+        async with uow:
+            assert await uow.pets.count() == 3
+
+    asyncio.run(run())
+
+
+def test_async_unit_of_work_shared_by_tasks(async_database, pets):
+    uow = async_uow(async_database)
+
+    async def work(pet, barrier):
+        async with uow:
+            # Both tasks are in the context before either adds a pet
+            await barrier.wait()
+            await uow.pets.add(pet)
+            await uow.commit()
+            return uow.session
+
+    async def run():
+        barrier = asyncio.Barrier(2)
+        sessions = await asyncio.wait_for(
+            asyncio.gather(work(pets[0], barrier), work(pets[1], barrier)),
+            timeout=10,
+        )
+        # Every task has its own session instead of a savepoint in the other
+        assert sessions[0] is not sessions[1]
+        assert uow.session is None
+
+        # A task which is created in the context opens its own session
+        async with uow:
+            outer = uow.session
+            inner = await asyncio.create_task(
+                work(pets[2], asyncio.Barrier(1))
+            )
+            assert inner is not outer
+            assert uow.session is outer
+            assert await uow.pets.count() == 3
+
+    asyncio.run(run())
@@ -1,20 +1,47 @@
+import dataclasses
+import logging
+import threading
+import time
+from collections import Counter
+
+import pandas as pd
 import pytest
+from sqlalchemy import event, text
 from sqlalchemy.exc import (
+    IntegrityError,
+    InvalidRequestError,
     MultipleResultsFound,
     NoResultFound,
+    OperationalError,
 )
 from sqlalchemy.orm import Session
 
 from alpha import exceptions
 from alpha.adapters.sqla_unit_of_work import SqlAlchemyUnitOfWork
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.infra.caches.shared_cache import SharedCache
+from alpha.infra.caches.statement_cache import StatementCache
+from alpha.infra.connectors.query_monitor import (
+    QUERY_LOGGER,
+    SLOW_QUERY_LOGGER,
+    QueryMonitor,
+)
 from alpha.infra.databases.sql_alchemy import SqlAlchemyDatabase
+from alpha.infra.models.load_option import LoadOption, LoadStrategy
 from alpha.interfaces.sql_mapper import SqlMapper
+from alpha.interfaces.sql_repository import SqlRepository
 from alpha.interfaces.unit_of_work import UnitOfWork
+from alpha.repositories.models.repository_model import RepositoryModel
 from alpha.repositories.sql_alchemy_repository import SqlAlchemyRepository
 
 from ._classes import (
+    Animal,
+    FakeMapper,
     Pet,
     PetType,
+    Shelter,
+    ShelterMapper,
+    Volunteer,
 )
 
 
@@ -349,3 +376,1068 @@ def test_order_by_filters(
             ).name
             == "Max"
         )
+
+
+def test_select_iter(uow, pets, name_order_desc, weight_neq_none_filter):
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    with uow:
+        expected = [
+            obj.name for obj in uow.pets.select(order_by=[name_order_desc])
+        ]
+        assert [
+            obj.name
+            for obj in uow.pets.select_iter(
+                order_by=[name_order_desc], batch_size=2
+            )
+        ] == expected
+
+        assert [obj.id for obj in uow.pets.select_iter(batch_size=1)] == [
+            obj.id for obj in uow.pets.select(order_by=[Pet.id])
+        ]
+
+        assert [
+            obj.id
+            for obj in uow.pets.select_iter(
+                filters=[weight_neq_none_filter],
+                order_by=[Pet.good_boy.desc()],
+                batch_size=2,
+            )
+        ] == [
+            obj.id
+            for obj in uow.pets.select(
+                filters=[weight_neq_none_filter],
+                order_by=[Pet.good_boy.desc(), Pet.id, Pet.name],
+            )
+        ]
+
+        with pytest.raises(ValueError):
+            next(uow.pets.select_iter(batch_size=0))
+
+
+def test_add_all_in_chunks(uow, pets):
+    objs = [
+        Pet(
+            id=100 + ix,
+            name=f"Pet {ix}",
+            pet_type=PetType.DUCK,
+            good_boy=True,
+            date_of_birth=pets[0].date_of_birth,
+            weight=1.0,
+            remarks="",
+        )
+        for ix in range(10)
+    ]
+
+    with uow:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.startswith("INSERT"):
+                statements.append(statement)
+
+        engine = uow.session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            added = uow.pets.add_all(objs, return_obj=True, chunk_size=4)
+        finally:
+            event.remove(
+                engine, "before_cursor_execute", before_cursor_execute
+            )
+
+        assert added == objs
+        assert len(statements) == 3
+        assert uow.pets.count() == len(objs)
+
+        with pytest.raises(ValueError):
+            uow.pets.add_all(pets, chunk_size=0)
+
+    with pytest.raises(ValueError):
+        SqlAlchemyRepository(session=None, default_model=Pet, chunk_size=0)
+
+
+def test_add_all_conflict(uow, pets):
+    with uow:
+        uow.pets.add_all(pets[:2])
+        uow.commit()
+
+    with uow:
+        duplicate = dataclasses.replace(pets[1], name="Duplicate")
+        added = uow.pets.add_all(
+            [pets[2], duplicate, pets[3]], return_obj=True, chunk_size=2
+        )
+        assert added == [pets[2], duplicate, pets[3]]
+        # The objects of the failed chunk are not flushed again
+        assert duplicate not in uow.session
+        assert not uow.session.new
+        uow.commit()
+
+    with uow:
+        assert [obj.id for obj in uow.pets.select()] == [1, 2, 3, 4]
+        assert uow.pets.get_by_id(2).name == pets[1].name
+
+
+def test_remove_all_and_update_where(uow, pets, lt_filter, in_filter):
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    with uow:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.startswith(("UPDATE", "DELETE")):
+                statements.append(statement)
+
+        engine = uow.session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            max_ = uow.pets.get_by_id(1)
+
+            assert (
+                uow.pets.update_where(
+                    values={"remarks": "Updated"}, filters=[in_filter]
+                )
+                == 2
+            )
+            assert max_.remarks == "Updated"
+
+            assert uow.pets.remove_all(filters=[lt_filter]) == 2
+            assert max_ not in uow.session
+        finally:
+            event.remove(
+                engine, "before_cursor_execute", before_cursor_execute
+            )
+
+        assert len(statements) == 2
+        assert uow.pets.count() == len(pets) - 2
+        assert uow.pets.count(filter_by={"remarks": "Updated"}) == 1
+
+        with pytest.raises(ValueError):
+            uow.pets.update_where(values={"remarks": ""}, limit=1)
+
+        assert uow.pets.remove_all(limit=1) == 1
+        assert uow.pets.remove_all() == len(pets) - 3
+        assert uow.pets.count() == 0
+
+
+def test_statement_cache(uow, pets, in_filter, and_filter, name_order_desc):
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    with uow:
+        cache = StatementCache()
+        uow.pets.statement_cache = cache
+
+        assert uow.pets.get_by_id(1).name == "Max"
+        assert uow.pets.get_by_id(2).name == "Pluto"
+        assert uow.pets.get_by_id(1000) is None
+        assert cache.info()["misses"] == 1
+        assert cache.info()["hits"] == 2
+
+        names = [
+            pet.name
+            for pet in uow.pets.select(
+                filters=[in_filter], order_by=[name_order_desc]
+            )
+        ]
+        assert names == ["Max", "Bugs"]
+        in_filter.value = ["Tom"]
+        assert [
+            pet.name
+            for pet in uow.pets.select(
+                filters=[in_filter], order_by=[name_order_desc]
+            )
+        ] == ["Tom"]
+        assert uow.pets.count(filters=[and_filter]) == 1
+        assert uow.pets.select(limit=2, offset=1, order_by=[Pet.id]) == (
+            uow.pets.select(order_by=[Pet.id])[1:3]
+        )
+        assert cache.info()["size"] == 5
+
+        # Filters with None values are not parameterised
+        assert uow.pets.count(filter_by={"weight": None}) == 2
+        assert cache.info()["size"] == 5
+
+
+@pytest.mark.parametrize("backend", [MemoryCache, SharedCache])
+def test_second_level_cache(uow, pets, backend):
+    cache = backend()
+    uow._repositories[0].additional_config = {
+        "cache": cache,
+        "cache_keys": ["id", "name"],
+    }
+
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    with uow:
+        engine = uow.session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    try:
+        # The first lookup populates the cache
+        with uow:
+            assert uow.pets.get_by_id(1).name == "Max"
+            assert len(statements) == 1
+
+        # Lookups by all cache keys hit the cache without a round trip
+        with uow:
+            max_ = uow.pets.get_by_id(1)
+            assert max_.name == "Max"
+            assert max_ in uow.session
+            assert uow.pets.get(attr="name", value="Max") is max_
+            assert len(statements) == 1
+
+            # Lookups by other attributes or with pending changes bypass the
+            # cache
+            uow.pets.get(attr="pet_type", value=PetType.DOG)
+            assert len(statements) == 2
+
+            max_.name = "Maximus"
+            assert uow.pets.get_by_id(1).name == "Maximus"
+            assert len(statements) == 3
+
+            uow.commit()
+
+        # The cached values are invalidated when the changes are committed
+        with uow:
+            assert uow.pets.get_by_id(1).name == "Maximus"
+            assert uow.pets.get(attr="name", value="Max") is None
+            assert len(statements) == 5
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # Changes which are rolled back do not invalidate the cache
+    with uow:
+        uow.pets.remove(uow.pets.get_by_id(1))
+    with uow:
+        assert uow.pets.get_by_id(1).name == "Maximus"
+
+    # Set based statements clear the cache on commit
+    with uow:
+        uow.pets.remove_all(filter_by={"id": 1})
+        uow.commit()
+    with uow:
+        assert uow.pets.get_by_id(1) is None
+
+
+def test_get_many(uow, pets, caplog):
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    with uow:
+        engine = uow.session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            with caplog.at_level(logging.DEBUG):
+                objs = uow.pets.get_many([3, 1, 1000, 1])
+            # The value which does not exist is not counted
+            assert (
+                "retrieved 2 objects of which 2 from the database"
+                in caplog.messages
+            )
+            assert [obj.id if obj else None for obj in objs] == [
+                3,
+                1,
+                None,
+                1,
+            ]
+            assert objs[1] is objs[3]
+            assert len(statements) == 1
+
+            # Objects loaded in the session do not trigger a query
+            assert uow.pets.get_many([1, 3]) == [objs[1], objs[0]]
+            assert len(statements) == 1
+
+            # The values are chunked into multiple queries
+            names = [pet.name for pet in pets]
+            assert [
+                pet.name
+                for pet in uow.pets.get_many(
+                    reversed(names), attr=Pet.name, chunk_size=2
+                )
+            ] == list(reversed(names))
+            assert len(statements) == 3
+
+            uow.pets.remove(objs[0])
+            assert uow.pets.get_many([3]) == [None]
+        finally:
+            event.remove(
+                engine, "before_cursor_execute", before_cursor_execute
+            )
+
+
+def test_select_frame(uow, pets, gt_filter, name_order_desc):
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    with uow:
+        frame = uow.pets.select_frame()
+        assert isinstance(frame, pd.DataFrame)
+        assert len(frame) == len(pets)
+        assert set(frame.columns) == {
+            "id",
+            "name",
+            "pet_type",
+            "date_of_birth",
+            "weight",
+            "good_boy",
+            "remarks",
+        }
+
+        frame = uow.pets.select_frame(
+            columns=[Pet.name, "pet_type", "weight"],
+            filters=[gt_filter],
+            order_by=[name_order_desc],
+            batch_size=1,
+        )
+        assert list(frame.columns) == ["name", "pet_type", "weight"]
+        assert list(frame["name"]) == [
+            pet.name
+            for pet in uow.pets.select(
+                filters=[gt_filter], order_by=[name_order_desc]
+            )
+        ]
+        assert set(frame["pet_type"]) <= {t.name for t in PetType}
+        assert frame["weight"].dtype == "float64"
+
+        assert uow.pets.select_frame(columns=["id"], limit=0).empty
+
+        pa = pytest.importorskip("pyarrow")
+        table = uow.pets.select_frame(
+            columns=["id", "name"], order_by=[Pet.id], as_arrow=True
+        )
+        assert isinstance(table, pa.Table)
+        assert table.column("id").to_pylist() == sorted(p.id for p in pets)
+
+
+def test_column_projection(uow, pets, gt_filter, eq_filter, name_order_desc):
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    with uow:
+        engine = uow.session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            rows = uow.pets.select(
+                columns=[Pet.name, "pet_type"],
+                filters=[gt_filter],
+                order_by=[name_order_desc],
+            )
+            assert rows == [("Pluto", PetType.DOG), ("Max", PetType.DOG)]
+            assert rows[0].pet_type is PetType.DOG
+            assert "remarks" not in statements[-1]
+            assert uow.session.identity_map.keys() == set()
+
+            # Queries which are cached by their shape are projected as well
+            row = uow.pets.view(
+                Pet, cursor_result="one", columns=["id"], filters=[eq_filter]
+            )
+            assert tuple(row) == (5,)
+
+            # The columns which are not loaded are loaded on access
+            statements.clear()
+            objs = uow.pets.select(
+                load_only=[Pet.name], order_by=[name_order_desc]
+            )
+            assert [obj.name for obj in objs][:2] == ["Tom", "Pluto"]
+            assert "remarks" not in statements[0]
+            assert len(statements) == 1
+            assert objs[0].remarks == "Jerry always outsmarts Tom"
+            assert len(statements) == 2
+
+            obj = uow.pets.get_one("id", 2, defer=["remarks", Pet.weight])
+            assert "remarks" not in statements[-1]
+            assert obj.weight == 18.2
+        finally:
+            event.remove(
+                engine, "before_cursor_execute", before_cursor_execute
+            )
+
+
+def test_ingest(uow, pets):
+    frame = pd.DataFrame(
+        [
+            {
+                "id": pet.id,
+                "name": pet.name,
+                "pet_type": pet.pet_type,
+                "good_boy": pet.good_boy,
+                "date_of_birth": pet.date_of_birth,
+                "weight": pet.weight,
+                "remarks": pet.remarks,
+            }
+            for pet in pets
+        ]
+    )
+
+    with uow:
+        assert uow.pets.ingest(frame, chunk_size=2) == len(pets)
+        uow.commit()
+
+    with uow:
+        assert uow.pets.count() == len(pets)
+        pluto = uow.pets.get_by_id(2)
+        assert pluto.pet_type == PetType.DOG
+        assert pluto.date_of_birth == pets[1].date_of_birth
+        assert uow.pets.count(filter_by={"weight": None}) == sum(
+            pet.weight is None for pet in pets
+        )
+
+    rows = [
+        {
+            "id": 2,
+            "name": "Pluto",
+            "pet_type": PetType.DOG,
+            "date_of_birth": pets[1].date_of_birth,
+            "remarks": "x",
+        },
+        {
+            "id": 100,
+            "name": "Goofy",
+            "pet_type": PetType.DOG,
+            "date_of_birth": pets[1].date_of_birth,
+        },
+    ]
+    with uow:
+        with pytest.raises(IntegrityError):
+            uow.pets.ingest(rows)
+
+    with uow:
+        assert uow.pets.ingest(rows, on_conflict="ignore") == 2
+        assert uow.pets.get_by_id(2).remarks == pets[1].remarks
+        assert uow.pets.count() == len(pets) + 1
+        uow.rollback()
+
+        assert (
+            uow.pets.ingest(
+                rows[:1],
+                on_conflict="update",
+                update_columns=["remarks"],
+            )
+            == 1
+        )
+        uow.session.expire_all()
+        assert uow.pets.get_by_id(2).remarks == "x"
+
+        # Domain model instances can be ingested as well
+        new_pet = Pet(
+            id=101,
+            name="Donald",
+            pet_type=PetType.DUCK,
+            good_boy=False,
+            date_of_birth=pets[0].date_of_birth,
+        )
+        assert uow.pets.ingest(iter([new_pet])) == 1
+        assert new_pet not in uow.session
+        assert uow.pets.count() == len(pets) + 1
+
+
+def test_upsert(uow, pets):
+    with uow:
+        uow.pets.add_all(pets[:2])
+        uow.commit()
+
+    with uow:
+        pluto = uow.pets.get_by_id(2)
+        changed = Pet(
+            id=2,
+            name="Pluto",
+            pet_type=PetType.DOG,
+            good_boy=False,
+            date_of_birth=pets[1].date_of_birth,
+            weight=20.0,
+            remarks="Pluto has gained some weight.",
+        )
+        assert uow.pets.upsert([changed, pets[2]], chunk_size=1) == 2
+        uow.commit()
+
+    with uow:
+        assert uow.pets.count() == 3
+        pluto = uow.pets.get_by_id(2)
+        assert pluto.weight == 20.0
+        assert pluto.remarks == "Pluto has gained some weight."
+
+        # Only the update columns of existing rows are updated
+        changed.weight = 21.0
+        changed.remarks = "Not updated"
+        assert uow.pets.upsert(changed, update_columns=["weight"]) == 1
+        assert pluto.weight == 21.0
+        assert pluto.remarks == "Pluto has gained some weight."
+        assert changed not in uow.session
+
+
+def test_exists_and_estimated_count(uow, pets, eq_filter, nin_filter):
+    with uow:
+        assert not uow.pets.exists()
+        uow.pets.add_all(pets)
+        uow.commit()
+
+    with uow:
+        assert uow.pets.exists()
+        assert uow.pets.exists(filters=[eq_filter])
+        assert uow.pets.exists(filters=[eq_filter], order_by=[Pet.name])
+        assert not uow.pets.exists(filter_by={"name": "Goofy"})
+
+        estimate = uow.pets.count(estimate=True)
+        filtered = uow.pets.count(estimate=True, filters=[nin_filter])
+        assert isinstance(estimate, int)
+        assert isinstance(filtered, int)
+        if uow.session.get_bind().dialect.name == "sqlite":
+            assert estimate == len(pets)
+            assert filtered == 3
+
+
+@pytest.fixture
+def replicated_database(tmp_path):
+    replica_urls = [
+        f"sqlite:///{tmp_path / 'replica_1.db'}",
+        f"sqlite:///{tmp_path / 'replica_2.db'}",
+    ]
+    db = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'primary.db'}",
+        db_type="sqlite",
+        create_schema=False,
+        create_tables=True,
+        replica_urls=replica_urls,
+        mapper=FakeMapper,
+    )
+    for engine in db.replicas():
+        FakeMapper.metadata.create_all(engine)
+    yield db
+    db.drop_tables(FakeMapper.metadata)
+
+
+def replicated_uow(db, read_only=False):
+    return SqlAlchemyUnitOfWork(
+        db=db,
+        repos=[
+            RepositoryModel(
+                name="pets",
+                repository=SqlAlchemyRepository[Pet],
+                default_model=Pet,
+                interface=SqlRepository,
+            )
+        ],
+        read_only=read_only,
+    )
+
+
+def test_read_replica_routing(replicated_database, pets):
+    db = replicated_database
+    uow = replicated_uow(db)
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+    # The rows are replicated to the second replica only
+    with db.replicas()[1].begin() as connection:
+        connection.execute(
+            FakeMapper.pets.insert(),
+            [
+                {
+                    "id": pet.id,
+                    "name": pet.name,
+                    "pet_type": pet.pet_type,
+                    "date_of_birth": pet.date_of_birth,
+                }
+                for pet in pets[:2]
+            ],
+        )
+
+    with uow:
+        assert uow.pets.count() == len(pets)
+        # The first replica is selected once per unit of work
+        assert uow.pets.count(read_only=True) == 0
+        assert uow.pets.get_by_id(1, read_only=True) is None
+        assert uow.pets.get_many([1, 2], read_only=True) == [None, None]
+        assert not uow.pets.exists(read_only=True)
+        assert uow.pets.get_by_id(1) is not None
+
+    # Round-robin balancing selects the second replica next
+    checkouts = db.pool_stats()["replicas"][1]["checkouts"]
+    with replicated_uow(db, read_only=True) as read_uow:
+        assert read_uow.pets.count() == 2
+        assert len(read_uow.pets.select_frame(read_only=True)) == 2
+        # Writes are executed on the primary database
+        read_uow.pets.update_where({"remarks": "x"}, filter_by={"id": 1})
+        read_uow.commit()
+        # All reads after a write stay on the primary database
+        assert read_uow.pets.count() == len(pets)
+    assert db.pool_stats()["replicas"][1]["checkouts"] == checkouts + 1
+
+    with uow:
+        uow.pets.add(
+            Pet(
+                id=100,
+                name="Goofy",
+                pet_type=PetType.DOG,
+                date_of_birth=pets[0].date_of_birth,
+            )
+        )
+        assert uow.pets.get_by_id(100, read_only=True) is not None
+
+
+def test_read_replica_without_read_your_writes(tmp_path, pets):
+    db = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'primary.db'}",
+        db_type="sqlite",
+        create_schema=False,
+        create_tables=True,
+        replica_urls=[f"sqlite:///{tmp_path / 'replica.db'}"],
+        replica_balancing="least_connections",
+        read_your_writes=False,
+        mapper=FakeMapper,
+    )
+    FakeMapper.metadata.create_all(db.replicas()[0])
+    uow = replicated_uow(db)
+
+    with uow:
+        uow.pets.add_all(pets)
+        uow.flush()
+        assert uow.pets.count(read_only=True) == 0
+        assert uow.pets.count() == len(pets)
+    db.drop_tables(FakeMapper.metadata)
+
+    with pytest.raises(ValueError):
+        SqlAlchemyDatabase(
+            conn_str="sqlite:///:memory:",
+            create_schema=False,
+            replica_urls=["sqlite:///:memory:"],
+            replica_balancing="random",
+        )
+
+
+@pytest.fixture
+def sqlite_file_database(tmp_path):
+    db = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'nested.db'}",
+        db_type="sqlite",
+        sqlite_savepoints=True,
+        create_schema=False,
+        create_tables=True,
+        mapper=FakeMapper,
+    )
+    yield db
+    db.drop_tables(FakeMapper.metadata)
+
+
+@pytest.mark.parametrize("sqlite_savepoints", [False, True])
+def test_sqlite_savepoints(tmp_path, sqlite_savepoints):
+    db = SqlAlchemyDatabase(
+        conn_str=f"sqlite:///{tmp_path / 'savepoints.db'}",
+        db_type="sqlite",
+        create_schema=False,
+        sqlite_savepoints=sqlite_savepoints,
+    )
+    # The driver only leaves the transactions to SQL Alchemy when enabled
+    with db.engine().connect() as connection:
+        isolation_level = (
+            connection.connection.dbapi_connection.isolation_level
+        )
+    assert (isolation_level is None) is sqlite_savepoints
+
+
+@pytest.fixture(
+    params=["sqlite_file_database", "psql_database"],
+    ids=["sqlite", "postgresql"],
+)
+def nested_database(request) -> SqlAlchemyDatabase:
+    return request.getfixturevalue(request.param)
+
+
+def test_nested_unit_of_work(nested_database, pets):
+    db = nested_database
+    uow = replicated_uow(db)
+    other_uow = replicated_uow(db)
+
+    checkouts = db.pool_stats()["checkouts"]
+    with uow:
+        uow.pets.add_all(pets[:2])
+        with uow:
+            uow.pets.add(pets[2])
+            # Releases the savepoint of the nested unit of work
+            uow.commit()
+            uow.pets.add(pets[3])
+        # The changes after the commit are rolled back on exit
+        assert uow.pets.count() == 3
+
+        # Another unit of work shares the session of the outer one
+        with other_uow:
+            assert other_uow.session is uow.session
+            other_uow.pets.add(pets[4])
+            other_uow.rollback()
+            assert other_uow.pets.count() == 3
+        assert other_uow.session is None
+        assert uow.session is not None
+        uow.commit()
+    assert uow.session is None
+    # The nested units of work use the connection of the outer one
+    assert db.pool_stats()["checkouts"] == checkouts + 1
+
+    # A nested commit is discarded when the outer unit of work rolls back
+    with uow:
+        with other_uow:
+            other_uow.pets.remove_all()
+            other_uow.commit()
+        assert uow.pets.count() == 0
+    with uow:
+        assert [obj.id for obj in uow.pets.select()] == [1, 2, 3]
+
+
+def test_nested_unit_of_work_conflict(nested_database, pets):
+    uow = replicated_uow(nested_database)
+
+    with uow:
+        uow.pets.add_all(pets[:2])
+        with uow:
+            uow.pets.add(pets[2])
+            # A conflict only rolls back the savepoint of the object
+            assert uow.pets.add(dataclasses.replace(pets[0])) is None
+            with pytest.raises(exceptions.AlreadyExistsException):
+                uow.pets.add_all(
+                    [pets[3], dataclasses.replace(pets[1])],
+                    raise_if_exists=True,
+                )
+            assert uow.pets.count() == 3
+            uow.commit()
+        uow.commit()
+    with uow:
+        assert [obj.id for obj in uow.pets.select()] == [1, 2, 3]
+
+
+def test_unit_of_work_shared_by_threads(nested_database, pets):
+    uow = replicated_uow(nested_database)
+    barrier = threading.Barrier(2, timeout=10)
+    sessions = {}
+
+    def work(index: int) -> None:
+        with uow:
+            sessions[index] = uow.session
+            # Both threads are in the context before either adds a pet
+            barrier.wait()
+            uow.pets.add(pets[index])
+            uow.commit()
+        assert uow.session is None
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every thread has its own session instead of a savepoint in the other
+    assert len(sessions) == 2
+    assert sessions[0] is not sessions[1]
+    with uow:
+        assert uow.pets.count() == 2
+
+
+@pytest.fixture
+def monitored_database():
+    db = SqlAlchemyDatabase(
+        conn_str="sqlite:///:memory:",
+        db_type="sqlite",
+        create_schema=False,
+        create_tables=True,
+        query_monitor=QueryMonitor(
+            slow_query_threshold=None, n_plus_one_threshold=3
+        ),
+        mapper=FakeMapper,
+    )
+    yield db
+    db.drop_tables(FakeMapper.metadata)
+
+
+def test_query_monitor(monitored_database, pets, caplog):
+    db = monitored_database
+    monitor = db.query_monitor
+    # Ignore the statements which created the tables
+    monitor.reset()
+    uow = replicated_uow(db)
+    assert uow.query_summary is None
+    with uow:
+        uow.pets.add_all(pets)
+        uow.commit()
+    records = uow.query_summary.records
+    assert sum(record.rowcount for record in records) == len(pets)
+    assert {record.origin for record in records} == {
+        "SqlAlchemyRepository.add_all"
+    }
+
+    caplog.set_level(logging.DEBUG, logger=QUERY_LOGGER)
+    with uow:
+        for pet in pets:
+            uow.pets.get_by_id(pet.id)
+        # A nested unit of work adds its statements to the outer summary
+        with replicated_uow(db) as nested_uow:
+            assert nested_uow.pets.count() == len(pets)
+            assert nested_uow.query_summary is uow.query_summary
+    summary = uow.query_summary
+    assert Counter(
+        record.origin
+        for record in summary.records
+        if record.statement.startswith("SELECT")
+    ) == {
+        "SqlAlchemyRepository.get_by_id": len(pets),
+        "SqlAlchemyRepository.count": 1,
+    }
+    assert list(summary.n_plus_one.values()) == [len(pets)]
+    warnings = [
+        record
+        for record in caplog.records
+        if record.levelno == logging.WARNING
+    ]
+    assert len(warnings) == 1
+    assert "Possible N+1 pattern" in warnings[0].getMessage()
+    assert "possible N+1: 5x SELECT" in caplog.records[-1].getMessage()
+
+    # Slow statements are written to a dedicated logger
+    monitor.slow_query_threshold = 0.0
+    caplog.clear()
+    with uow:
+        uow.pets.exists()
+    assert len(uow.query_summary.slow) == 1
+    assert [
+        record.name
+        for record in caplog.records
+        if record.levelno == logging.WARNING
+    ] == [SLOW_QUERY_LOGGER]
+
+    stats = monitor.stats()
+    assert stats["statements"] == (
+        len(records) + summary.count + uow.query_summary.count
+    )
+    assert stats["slow"] == 1
+    assert stats["n_plus_one"] == 1
+    assert stats["origins"]["SqlAlchemyRepository.get_by_id"]["count"] == 5
+
+
+SLOW_STATEMENTS = {
+    "sqlite": (
+        "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) "
+        "SELECT count(*) FROM c"
+    ),
+    "postgresql": "SELECT pg_sleep(5)",
+}
+
+
+@pytest.mark.parametrize("database", ["sqlite_database", "psql_database"])
+def test_statement_timeout(request, database):
+    db = request.getfixturevalue(database)
+    slow_statement = text(SLOW_STATEMENTS[db.engine().dialect.name])
+
+    uow = SqlAlchemyUnitOfWork(db=db, repos=[], statement_timeout=0.1)
+    start = time.monotonic()
+    with pytest.raises(exceptions.StatementTimeoutError) as exc_info:
+        with uow:
+            uow.session.execute(slow_statement)
+    assert time.monotonic() - start < 2
+    assert isinstance(exc_info.value, exceptions.GatewayTimeoutException)
+    assert exc_info.value.__cause__ is not None
+
+    # The timeout only applies to the unit of work
+    with SqlAlchemyUnitOfWork(db=db, repos=[]) as other_uow:
+        assert other_uow.session.execute(text("SELECT 1")).scalar() == 1
+
+    # The timeout applies to the transactions after a commit as well
+    with uow:
+        uow.commit()
+        with pytest.raises(exceptions.StatementTimeoutError):
+            uow.session.execute(slow_statement)
+
+    # Statements which are cancelled otherwise are not timeouts
+    if db.engine().dialect.name == "postgresql":
+        with pytest.raises(OperationalError) as exc_info:
+            with uow:
+                uow.session.execute(
+                    text("SELECT pg_cancel_backend(pg_backend_pid())")
+                )
+        assert not isinstance(exc_info.value, exceptions.StatementTimeoutError)
+
+
+@pytest.fixture
+def shelter_database():
+    db = SqlAlchemyDatabase(
+        conn_str="sqlite:///:memory:",
+        db_type="sqlite",
+        create_schema=False,
+        create_tables=True,
+        mapper=ShelterMapper,
+    )
+    yield db
+    db.drop_tables(ShelterMapper.metadata)
+
+
+def shelter_uow(db, strict_loading=False):
+    return SqlAlchemyUnitOfWork(
+        db=db,
+        repos=[
+            RepositoryModel(
+                name="shelters",
+                repository=SqlAlchemyRepository[Shelter],
+                default_model=Shelter,
+                interface=SqlRepository,
+                additional_config={"strict_loading": strict_loading},
+            ),
+            RepositoryModel(
+                name="animals",
+                repository=SqlAlchemyRepository[Animal],
+                default_model=Animal,
+                interface=SqlRepository,
+                additional_config={"strict_loading": strict_loading},
+            ),
+        ],
+    )
+
+
+def test_load_options(shelter_database):
+    db = shelter_database
+    uow = shelter_uow(db)
+    with uow:
+        uow.shelters.add_all(
+            [
+                Shelter(
+                    id=shelter_id,
+                    name=f"shelter {shelter_id}",
+                    animals=[
+                        Animal(id=shelter_id * 10 + i, name=f"animal {i}")
+                        for i in range(3)
+                    ],
+                )
+                for shelter_id in (1, 2)
+            ],
+            # The animals are only added by the cascade of the session
+            return_obj=True,
+        )
+        uow.commit()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    engine = db.engine()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        # The collections of all shelters are loaded by one statement
+        with uow:
+            shelters = uow.shelters.select(load=[LoadOption(field="animals")])
+            assert [len(shelter.animals) for shelter in shelters] == [3, 3]
+            assert len(statements) == 2
+
+        # Relationships of the related objects are loaded by children
+        statements.clear()
+        with uow:
+            animals = uow.animals.select(
+                load=[
+                    LoadOption(
+                        field=Animal.shelter,
+                        strategy=LoadStrategy.JOINED,
+                        children=[LoadOption(field="animals")],
+                    )
+                ]
+            )
+            assert {len(animal.shelter.animals) for animal in animals} == {3}
+            assert len(statements) == 2
+
+        statements.clear()
+        with uow:
+            shelters = uow.shelters.get_many(
+                [2, 1], load=[LoadOption(field="animals")]
+            )
+            assert [shelter.animals[0].id for shelter in shelters] == [20, 10]
+            assert len(statements) == 2
+
+        # Relationships which raise are not lazy loaded
+        statements.clear()
+        with uow:
+            shelter = uow.shelters.get_one(
+                "id",
+                1,
+                load=[LoadOption(field="*", strategy=LoadStrategy.RAISE)],
+            )
+            with pytest.raises(InvalidRequestError):
+                shelter.animals
+            assert len(statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # Strict repositories only return relationships which are loaded
+    strict_uow = shelter_uow(db, strict_loading=True)
+    with strict_uow:
+        shelters = strict_uow.shelters.select()
+        with pytest.raises(InvalidRequestError):
+            shelters[0].animals
+    with strict_uow:
+        shelters = strict_uow.shelters.select(
+            load=[LoadOption(field="animals")]
+        )
+        assert len(shelters[0].animals) == 3
+        # The shelter of the animals is already loaded in the session
+        assert shelters[0].animals[0].shelter is shelters[0]
+
+    # Columns which are not loaded raise on access as well
+    with strict_uow:
+        animal = strict_uow.animals.get_one("id", 10, load_only=["name"])
+        assert animal.name == "animal 0"
+        with pytest.raises(InvalidRequestError):
+            animal.shelter_id
+
+
+def test_remove_all_with_dependent_rows(shelter_database):
+    db = shelter_database
+    uow = shelter_uow(db)
+    volunteers = [Volunteer(id=1, name="volunteer 1")]
+    with uow:
+        uow.shelters.add_all(
+            [
+                Shelter(
+                    id=shelter_id,
+                    name=f"shelter {shelter_id}",
+                    animals=[Animal(id=shelter_id, name="animal")],
+                    volunteers=volunteers,
+                )
+                for shelter_id in (1, 2)
+            ],
+            return_obj=True,
+        )
+        uow.commit()
+
+    with uow:
+        # The association rows are removed by the session as well
+        assert uow.shelters.remove_all(filter_by={"name": "shelter 1"}) == 1
+        uow.commit()
+
+    with uow:
+        associations = uow.session.execute(
+            ShelterMapper.shelter_volunteers.select()
+        ).all()
+        assert [row.shelter_id for row in associations] == [2]
+        assert uow.animals.get_by_id(1).shelter_id is None
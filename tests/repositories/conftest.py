@@ -2,6 +2,7 @@ import httpx
 import pytest
 import requests
 import threading
+import time
 from flask import Flask, request
 from werkzeug.serving import make_server
 
@@ -63,6 +64,79 @@ def flask_app() -> Flask:
         obj = request.json
         return {"status": "ok", "data": obj}, 204
 
+    @app.route("/slow/<id>", methods=["GET"])
+    def test_slow_object(id):
+        time.sleep(0.2)
+        return {"status": "ok", "data": {"value": id}}, 200
+
+    items = [{"value": str(ix)} for ix in range(25)]
+
+    @app.route("/pages", methods=["GET"])
+    def test_pages():
+        size = int(request.args["size"])
+        start = (int(request.args["page"]) - 1) * size
+        return {"data": items[start : start + size]}, 200
+
+    @app.route("/offsets", methods=["GET"])
+    def test_offsets():
+        offset = int(request.args["offset"])
+        return {"data": items[offset : offset + int(request.args["limit"])]}
+
+    @app.route("/cursors", methods=["GET"])
+    def test_cursors():
+        start = int(request.args.get("cursor", 0))
+        end = start + 10
+        cursor = str(end) if end < len(items) else None
+        return {"data": items[start:end], "meta": {"next": cursor}}, 200
+
+    @app.route("/links", methods=["GET"])
+    def test_links():
+        page = int(request.args.get("page", 1))
+        headers = {}
+        if page * 10 < len(items):
+            headers["Link"] = (
+                f'</links?page={page + 1}>; rel="next", </links>; rel="first"'
+            )
+        return {"data": items[(page - 1) * 10 : page * 10]}, 200, headers
+
+    attempts: dict[str, int] = {}
+
+    @app.route("/flaky/<key>", methods=["GET", "POST"])
+    def test_flaky(key):
+        # Fails with the status code until the number of failures is reached
+        attempts[key] = attempts.get(key, 0) + 1
+        if attempts[key] <= int(request.args.get("failures", 1)):
+            headers = {}
+            if "retry_after" in request.args:
+                headers["Retry-After"] = request.args["retry_after"]
+            return {}, int(request.args.get("status", 503)), headers
+        return {"status": "ok", "data": {"value": str(attempts[key])}}, 200
+
+    versions: dict[str, int] = {}
+    cache_stats: dict[str, dict[str, int]] = {}
+
+    @app.route("/cached/<id>", methods=["GET", "PUT"])
+    def test_cached(id):
+        stats = cache_stats.setdefault(id, {"requests": 0, "not_modified": 0})
+        if request.method == "PUT":
+            versions[id] = versions.get(id, 0) + 1
+            return {"data": {"value": f"{id}-{versions[id]}"}}, 200
+        stats["requests"] += 1
+        etag = f'"{id}-{versions.get(id, 0)}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": request.args.get("cache_control", "no-cache"),
+        }
+        if request.headers.get("If-None-Match") == etag:
+            stats["not_modified"] += 1
+            return "", 304, headers
+        value = f"{id}-{versions.get(id, 0)}"
+        return {"data": {"value": value}}, 200, headers
+
+    @app.route("/cache_stats/<id>", methods=["GET"])
+    def test_cache_stats(id):
+        return cache_stats.get(id, {}), 200
+
     @app.route("/status/<status_code>", methods=["GET"])
     def test_status(status_code):
         return {"status": "ok", "data": {"value": status_code}}, int(
@@ -74,7 +148,7 @@ def flask_app() -> Flask:
 
 @pytest.fixture(scope="package")
 def test_api_server(flask_app):
-    server = make_server("127.0.0.1", 0, flask_app)
+    server = make_server("127.0.0.1", 0, flask_app, threaded=True)
     host = f"http://127.0.0.1:{server.server_port}"
     server_thread = threading.Thread(target=server.serve_forever, daemon=True)
     server_thread.start()
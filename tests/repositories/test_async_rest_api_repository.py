@@ -0,0 +1,197 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from alpha import exceptions
+from alpha.infra.caches.file_cache import FileCache
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.infra.connectors.circuit_breaker import CircuitBreaker
+from alpha.infra.models.pagination import PagePagination
+from alpha.infra.models.retry_policy import RetryPolicy
+from alpha.interfaces.http_client import AsyncHTTPClient
+from alpha.repositories.async_rest_api_repository import (
+    AsyncRestApiRepository,
+)
+from alpha.repositories.rest_api_repository_mixin import (
+    RestApiRepositoryMixin,
+)
+from tests.fixtures._domain_models import TestModel
+
+
+def run(test_api_server, coroutine_function, **kwargs):
+    async def main():
+        async with httpx.AsyncClient() as client:
+            repository = AsyncRestApiRepository[TestModel](
+                host=test_api_server,
+                default_model=TestModel,
+                response_data_attribute="data",
+                model_factory_method_name="factory",
+                client=client,
+                **{"endpoint": "/objects", **kwargs},
+            )
+            return await coroutine_function(repository)
+
+    return asyncio.run(main())
+
+
+def test_async_rest_api_repository(test_api_server):
+    repository = AsyncRestApiRepository(
+        host=test_api_server, request_headers={"X-Test": "test"}
+    )
+    assert isinstance(repository.client, httpx.AsyncClient)
+    assert isinstance(repository.client, AsyncHTTPClient)
+    assert repository.session is repository.client
+    assert repository.client.headers["X-Test"] == "test"
+    assert isinstance(repository, RestApiRepositoryMixin)
+
+
+def test_async_rest_api_repository_get(test_api_server):
+    async def get(repository):
+        obj = await repository.get(param=1)
+        assert isinstance(obj, TestModel)
+        assert obj.value == "1"
+
+        data = await repository.get(param=1, use_factory=False)
+        assert data == {"value": "1"}
+
+        obj = await repository.get(
+            parent_endpoint="parents", parent_param=123, param=321
+        )
+        assert obj.value == "123_321"
+
+        objs = await repository.get_all()
+        assert [obj.value for obj in objs] == ["abc", "def"]
+
+        # The requests are sent concurrently from one event loop
+        objs = await asyncio.gather(
+            *[repository.get(param=ix) for ix in range(20)]
+        )
+        assert [obj.value for obj in objs] == [str(ix) for ix in range(20)]
+
+        data = await repository.request(
+            method="get", url=f"{test_api_server}/objects/1"
+        )
+        assert data == {"value": "1"}
+
+    run(test_api_server, get)
+
+
+def test_async_rest_api_repository_get_many(test_api_server):
+    async def get_many(repository):
+        objs = await repository.get_many(range(20), max_concurrency=5)
+        assert [obj.value for obj in objs] == [str(ix) for ix in range(20)]
+
+        start = time.monotonic()
+        objs = await repository.get_many(["a", "b", "c"], endpoint="/slow")
+        assert time.monotonic() - start < 0.4
+        assert [obj.value for obj in objs] == ["a", "b", "c"]
+
+        objs = await repository.get_many(
+            [1, 404], endpoint="/status", use_factory=False
+        )
+        assert isinstance(objs[1], exceptions.NotFoundException)
+
+        # Exceptions which are not caused by the request are raised
+        with pytest.raises(AttributeError):
+            await repository.get_many([1], model=object)
+
+    run(test_api_server, get_many)
+
+
+def test_async_rest_api_repository_iter_all(test_api_server):
+    async def iter_all(repository):
+        values = [str(ix) for ix in range(25)]
+        objs = [obj async for obj in repository.iter_all(endpoint="/links")]
+        assert [obj.value for obj in objs] == values
+
+        objs = repository.iter_all(
+            pagination=PagePagination(size=10),
+            endpoint="/pages",
+            use_factory=False,
+        )
+        assert [obj["value"] async for obj in objs] == values
+
+    run(test_api_server, iter_all)
+
+
+def test_async_rest_api_repository_resilience(test_api_server):
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    async def retry(repository):
+        obj = await repository.get(param="async_retry", failures=2)
+        assert obj.value == "3"
+
+        with pytest.raises(exceptions.CircuitOpenException):
+            await repository.get(param="async_open", failures=10)
+        assert breaker.stats()["opened"] == 1
+
+    run(
+        test_api_server,
+        retry,
+        endpoint="/flaky",
+        retry_policy=RetryPolicy(backoff_factor=0.01),
+        circuit_breaker=breaker,
+    )
+
+
+@pytest.mark.parametrize("cache_type", ["memory", "file"])
+def test_async_rest_api_repository_response_cache(
+    test_api_server, tmp_path, cache_type
+):
+    param = f"async_cached_{cache_type}"
+
+    async def get(repository):
+        for _ in range(3):
+            obj = await repository.get(param=param, cache_control="max-age=60")
+            assert obj.value == f"{param}-0"
+        await repository.update(TestModel(value="new"), param=param)
+        obj = await repository.get(param=param)
+        assert obj.value == f"{param}-1"
+        obj = await repository.get(param=param)
+
+    # The file cache is read and written in a worker thread
+    cache = MemoryCache() if cache_type == "memory" else FileCache(tmp_path)
+    run(test_api_server, get, endpoint="/cached", response_cache=cache)
+    stats = httpx.get(f"{test_api_server}/cache_stats/{param}").json()
+    assert stats == {"requests": 3, "not_modified": 1}
+
+
+def test_async_rest_api_repository_changes(
+    test_api_server, test_model, json_patch
+):
+    async def change(repository):
+        obj = await repository.add(test_model)
+        assert obj.value == test_model.value
+        assert await repository.add(test_model, return_obj=False) is None
+
+        objs = await repository.add_all([test_model], use_factory=False)
+        assert objs == [{"value": test_model.value}]
+
+        objs = await repository.add_all(
+            [TestModel(value="a"), TestModel(value="b")], one_by_one=True
+        )
+        assert [obj.value for obj in objs] == ["a", "b"]
+
+        obj = await repository.update(test_model, param=1)
+        assert obj.value == test_model.value
+
+        obj = await repository.patch(json_patch, param=1)
+        assert obj.value == "patched_value"
+
+        assert await repository.remove(param="abc") is None
+
+    run(test_api_server, change)
+
+
+def test_async_rest_api_repository_error_handling(test_api_server):
+    async def status(repository):
+        with pytest.raises(exceptions.NotFoundException):
+            await repository.get(param=404)
+        with pytest.raises(exceptions.ClientErrorException):
+            await repository.get(param=402)
+        with pytest.raises(exceptions.ServiceUnavailableException):
+            await repository.get(param=503)
+
+    run(test_api_server, status, endpoint="/status")
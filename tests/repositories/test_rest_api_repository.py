@@ -1,9 +1,24 @@
+import time
+
 import httpx
 import pytest
 import requests
 
 from alpha.interfaces.api_repository import ApiRepository
 from alpha import exceptions
+from alpha.infra.caches.file_cache import FileCache
+from alpha.infra.caches.memory_cache import MemoryCache
+from alpha.infra.connectors.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from alpha.infra.models.pagination import (
+    CursorPagination,
+    OffsetPagination,
+    PagePagination,
+)
+from alpha.infra.models.retry_policy import RetryPolicy
+from alpha.repositories.rest_api_repository import RestApiRepository
 from tests.fixtures._domain_models import TestModel
 
 
@@ -104,6 +119,212 @@ def test_rest_api_repository_get_all(rest_api_repository):
     assert response[1]["value"] == "def"
 
 
+def test_rest_api_repository_get_many(rest_api_repository):
+    response = rest_api_repository.get_many(range(20), max_concurrency=5)
+
+    assert [item.value for item in response] == [str(ix) for ix in range(20)]
+    assert rest_api_repository.get_many([]) == []
+
+    # The requests are sent concurrently
+    start = time.monotonic()
+    response = rest_api_repository.get_many(
+        ["a", "b", "c", "d", "e"], endpoint="/slow"
+    )
+    assert time.monotonic() - start < 0.6
+    assert [item.value for item in response] == ["a", "b", "c", "d", "e"]
+
+    with pytest.raises(ValueError):
+        rest_api_repository.get_many([1], max_concurrency=0)
+
+
+def test_rest_api_repository_get_many_errors(rest_api_repository_status):
+    response = rest_api_repository_status.get_many(
+        [200, 404, 503], use_factory=False
+    )
+
+    assert response[0]["data"] == {"value": "200"}
+    assert isinstance(response[1], exceptions.NotFoundException)
+    assert isinstance(response[2], exceptions.ServiceUnavailableException)
+
+    # Connection errors are returned, other exceptions are raised
+    unreachable = RestApiRepository(host="http://127.0.0.1:1", endpoint="/")
+    response = unreachable.get_many([1], use_factory=False)
+    assert isinstance(response[0], requests.ConnectionError)
+    with pytest.raises(AttributeError):
+        rest_api_repository_status.get_many([200], model=object)
+
+
+@pytest.mark.parametrize(
+    "endpoint, pagination",
+    [
+        ("/pages", PagePagination(size=10)),
+        ("/pages", PagePagination(size=5)),
+        ("/offsets", OffsetPagination(limit=10)),
+        ("/cursors", CursorPagination(cursor_attribute="meta.next")),
+        ("/links", None),
+    ],
+)
+def test_rest_api_repository_iter_all(
+    rest_api_repository, endpoint, pagination
+):
+    objs = rest_api_repository.iter_all(
+        pagination=pagination, endpoint=endpoint
+    )
+    assert not isinstance(objs, list)
+    assert [obj.value for obj in objs] == [str(ix) for ix in range(25)]
+
+
+def test_rest_api_repository_iter_all_partial(rest_api_repository):
+    objs = rest_api_repository.iter_all(endpoint="/links", use_factory=False)
+    assert next(objs) == {"value": "0"}
+    objs.close()
+
+    with pytest.raises(exceptions.NotFoundException):
+        list(rest_api_repository.iter_all(endpoint="/status/404"))
+
+
+def test_rest_api_repository_iter_all_client(
+    rest_api_repository, rest_api_repository_httpx
+):
+    # A requests session is copied for the thread which requests the pages
+    client = rest_api_repository._prefetch_client()
+    assert client is not rest_api_repository.client
+    assert client.headers == rest_api_repository.client.headers
+    assert client.headers is not rest_api_repository.client.headers
+    assert (
+        client.adapters["http://"]
+        is rest_api_repository.client.adapters["http://"]
+    )
+    assert (
+        rest_api_repository_httpx._prefetch_client()
+        is rest_api_repository_httpx.client
+    )
+
+
+def test_rest_api_repository_retry(test_api_server):
+    repository = RestApiRepository[TestModel](
+        host=test_api_server,
+        endpoint="/flaky",
+        default_model=TestModel,
+        response_data_attribute="data",
+        model_factory_method_name="factory",
+        retry_policy=RetryPolicy(backoff_factor=0.01),
+    )
+
+    assert repository.get(param="retry_get", failures=2).value == "3"
+    assert repository.get(param="retry_429", status=429).value == "2"
+    with pytest.raises(exceptions.ServiceUnavailableException):
+        repository.get(param="retry_exhausted", failures=4)
+    with pytest.raises(exceptions.ServiceUnavailableException):
+        repository.get(param="retry_after", retry_after=120)
+
+    # POST requests are only retried with an idempotency key
+    url = f"{test_api_server}/flaky/retry_post"
+    with pytest.raises(exceptions.ServiceUnavailableException):
+        repository.request("post", url)
+    url = f"{test_api_server}/flaky/retry_idempotent_post"
+    headers = {"Idempotency-Key": "abc"}
+    assert repository.request("post", url, headers=headers) == {"value": "2"}
+
+
+def test_rest_api_repository_circuit_breaker(test_api_server):
+    transitions = []
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=0.1,
+        on_state_change=lambda *args: transitions.append(args[1:]),
+    )
+    repository = RestApiRepository[TestModel](
+        host=test_api_server,
+        endpoint="/status",
+        response_data_attribute="data",
+        circuit_breaker=breaker,
+    )
+    host = test_api_server.split("://")[1]
+
+    for _ in range(2):
+        with pytest.raises(exceptions.ServiceUnavailableException):
+            repository.get(param=503, use_factory=False)
+    assert breaker.state(host) is CircuitState.OPEN
+    with pytest.raises(exceptions.CircuitOpenException):
+        repository.get(param=200, use_factory=False)
+
+    time.sleep(0.1)
+    assert repository.get(param=200, use_factory=False) == {"value": "200"}
+    assert breaker.state(host) is CircuitState.CLOSED
+    assert transitions == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+    assert breaker.stats()["rejected"] == 1
+
+
+@pytest.mark.parametrize("cache_type", ["memory", "file"])
+def test_rest_api_repository_response_cache(
+    test_api_server, tmp_path, cache_type
+):
+    cache = MemoryCache() if cache_type == "memory" else FileCache(tmp_path)
+    repository = RestApiRepository[TestModel](
+        host=test_api_server,
+        endpoint="/cached",
+        default_model=TestModel,
+        response_data_attribute="data",
+        model_factory_method_name="factory",
+        response_cache=cache,
+    )
+
+    def stats(id):
+        return requests.get(f"{test_api_server}/cache_stats/{id}").json()
+
+    # Revalidated with the ETag on every lookup
+    first = repository.get(param=f"{cache_type}_etag", use_factory=False)
+    second = repository.get(param=f"{cache_type}_etag", use_factory=False)
+    assert first == second == {"value": f"{cache_type}_etag-0"}
+    assert stats(f"{cache_type}_etag") == {"requests": 2, "not_modified": 1}
+
+    # Fresh for the max-age, so no request is sent
+    for _ in range(3):
+        obj = repository.get(
+            param=f"{cache_type}_fresh", cache_control="max-age=60"
+        )
+        assert obj.value == f"{cache_type}_fresh-0"
+    assert stats(f"{cache_type}_fresh") == {"requests": 1, "not_modified": 0}
+
+    # A change of the resource invalidates the cached response
+    repository.update(TestModel(value="new"), param=f"{cache_type}_fresh")
+    obj = repository.get(
+        param=f"{cache_type}_fresh", cache_control="max-age=60"
+    )
+    assert obj.value == f"{cache_type}_fresh-1"
+
+    for _ in range(2):
+        repository.get(
+            param=f"{cache_type}_no_store", cache_control="no-store"
+        )
+    assert stats(f"{cache_type}_no_store") == {
+        "requests": 2,
+        "not_modified": 0,
+    }
+
+    # Responses are cached per set of credentials and not when private
+    def get_with_token(token, id, cache_control="max-age=60"):
+        return RestApiRepository[TestModel](
+            host=test_api_server,
+            endpoint="/cached",
+            response_data_attribute="data",
+            request_headers={"Authorization": f"Bearer {token}"},
+            response_cache=cache,
+        ).get(param=id, cache_control=cache_control, use_factory=False)
+
+    for token in ["a", "b", "a", "b"]:
+        get_with_token(token, f"{cache_type}_auth")
+    assert stats(f"{cache_type}_auth")["requests"] == 2
+    for _ in range(2):
+        get_with_token("a", f"{cache_type}_private", "private, max-age=60")
+    assert stats(f"{cache_type}_private")["requests"] == 2
+
+
 def test_rest_api_repository_add(rest_api_repository, test_model):
     response = rest_api_repository.add(
         endpoint=f"{rest_api_repository._host}/objects",
@@ -0,0 +1,24 @@
+import logging
+import os
+from types import SimpleNamespace
+
+from alpha.infra.connectors.sql_alchemy import SqlAlchemyDatabase
+from alpha.utils.gunicorn_hooks import post_fork
+
+
+def test_post_fork(caplog):
+    database = SqlAlchemyDatabase(
+        conn_str="sqlite:///:memory:", create_schema=False
+    )
+    pool = database.engine().pool
+    # Pretend the database was created in the master process
+    database._pid = -1
+
+    server = SimpleNamespace(log=logging.getLogger("gunicorn.error"))
+    worker = SimpleNamespace(pid=os.getpid())
+    with caplog.at_level(logging.DEBUG, logger="gunicorn.error"):
+        post_fork(server, worker)
+
+    assert database.engine().pool is not pool
+    assert database._pid == os.getpid()
+    assert f"worker {os.getpid()}" in caplog.text